@@ -2,31 +2,131 @@
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
+from contextlib import asynccontextmanager
+from dataclasses import dataclass, field
 from datetime import datetime
-from typing import Dict, List
+from typing import Any, AsyncIterator, ClassVar, Dict, List, Mapping, Optional, Tuple, Union
+
+from .http_client import HttpClient
+
+
+@dataclass(slots=True)
+class TrendItem:
+    """
+    标准化热点条目。
+
+    使用 __slots__ 降低单条内存；raw_data 只保留各数据源投影后的少量字段。
+    支持 item["title"] / item.get("url") 读取，下游按 dict 访问的代码无需改动。
+    """
+
+    title: str
+    url: str
+    source: str
+    engagement_score: float
+    published_at: datetime
+    category: str
+    raw_data: Dict[str, Any] = field(default_factory=dict)
+
+    FIELDS: ClassVar[Tuple[str, ...]] = (
+        "title",
+        "url",
+        "source",
+        "engagement_score",
+        "published_at",
+        "category",
+        "raw_data",
+    )
+
+    def __getitem__(self, key: str) -> Any:
+        if key not in self.FIELDS:
+            raise KeyError(key)
+        return getattr(self, key)
+
+    def __setitem__(self, key: str, value: Any) -> None:
+        if key not in self.FIELDS:
+            raise KeyError(key)
+        setattr(self, key, value)
+
+    def __contains__(self, key: object) -> bool:
+        return key in self.FIELDS
+
+    def get(self, key: str, default: Any = None) -> Any:
+        if key not in self.FIELDS:
+            return default
+        return getattr(self, key)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {key: getattr(self, key) for key in self.FIELDS}
+
+    @classmethod
+    def from_dict(cls, data: Mapping[str, Any]) -> "TrendItem":
+        """从 dict 构造，published_at 统一解析为 datetime。"""
+        return cls(
+            title=data.get("title", ""),
+            url=data.get("url", ""),
+            source=data.get("source", ""),
+            engagement_score=float(data.get("engagement_score", 0) or 0),
+            published_at=BaseCrawler.parse_datetime(data.get("published_at")),
+            category=data.get("category", "科技"),
+            raw_data=dict(data.get("raw_data") or {}),
+        )
+
+    @classmethod
+    def coerce(cls, item: Union["TrendItem", Mapping[str, Any]]) -> "TrendItem":
+        return item if isinstance(item, cls) else cls.from_dict(item)
 
 
 class BaseCrawler(ABC):
     """所有数据源爬虫需继承的抽象类。"""
 
+    name: str = "base"  # 数据源标识，用于日志、策略与运行汇总
+    raw_fields: Tuple[str, ...] = ()  # raw_data 中保留的上游字段，其余丢弃
+    http: Optional[HttpClient] = None
+
+    def bind_http(self, http: HttpClient) -> None:
+        """注入管线持有的共享 HTTP 客户端。"""
+        self.http = http
+
     @abstractmethod
-    async def fetch_trending(self) -> List[Dict]:
+    async def fetch_trending(self) -> List[TrendItem]:
         """
         拉取热点列表。
 
-        返回的每个元素应包含：
+        返回的每个元素为 TrendItem（兼容旧式 dict），包含：
         - title: str
         - url: str
         - source: str
         - engagement_score: float
         - published_at: datetime
         - category: str
-        - raw_data: 原始数据
+        - raw_data: 按 raw_fields 投影后的原始数据
+        """
+
+    async def stream_trending(self) -> AsyncIterator[TrendItem]:
+        """
+        逐条产出热点，结构同 fetch_trending。
+
+        默认适配只实现了列表接口的爬虫；能更早产出结果的数据源可覆盖此方法。
         """
+        for item in await self.fetch_trending():
+            yield item
+
+    def _project_raw(self, raw: Mapping[str, Any]) -> Dict[str, Any]:
+        """只保留下游用得到的上游字段，避免整份原始对象常驻内存与落盘。"""
+        return {key: raw[key] for key in self.raw_fields if key in raw}
+
+    @asynccontextmanager
+    async def _http_client(self) -> AsyncIterator[HttpClient]:
+        """优先复用注入的客户端；单独运行爬虫时临时创建并在结束后关闭。"""
+        if self.http is not None:
+            yield self.http
+            return
+        async with HttpClient() as client:
+            yield client
 
     @staticmethod
     def parse_datetime(value) -> datetime:
-        """将时间戳或字符串转换为 datetime，失败时回退当前时间。"""
+        """将时间戳或字符串转换为 datetime，缺失或失败时回退当前时间。"""
         if isinstance(value, datetime):
             return value
         if isinstance(value, (int, float)):
@@ -1,11 +1,10 @@
 """GitHub Trending 爬虫（使用 waningflow 非官方 API）。"""
 from __future__ import annotations
 
-import aiohttp
 from datetime import datetime
-from typing import Dict, List
+from typing import List
 
-from .base_crawler import BaseCrawler
+from .base_crawler import BaseCrawler, TrendItem
 
 API_URL = "https://github-trending-api.waningflow.com/repositories"
 TOP_LIMIT = 30
@@ -15,17 +14,19 @@ FORK_WEIGHT = 2  # fork 权重
 class GitHubTrendingCrawler(BaseCrawler):
     """拉取 GitHub Trending，每日榜单。"""
 
-    async def fetch_trending(self) -> List[Dict]:
+    name = "github"
+    raw_fields = ("author", "name", "language", "stars", "forks")
+
+    async def fetch_trending(self) -> List[TrendItem]:
         params = {
             "since": "daily",
             "language": "",
             "spoken_language_code": "zh",
         }
-        items: List[Dict] = []
+        items: List[TrendItem] = []
 
-        async with aiohttp.ClientSession() as session:
-            async with session.get(API_URL, params=params) as resp:
-                data = await resp.json()
+        async with self._http_client() as http:
+            data = await http.get_json(API_URL, source="github", params=params, cacheable=True)
 
         for repo in data[:TOP_LIMIT]:
             title = f"{repo.get('name', '')}: {repo.get('description', '')}".strip()
@@ -37,15 +38,15 @@ class GitHubTrendingCrawler(BaseCrawler):
             engagement = stars + forks * FORK_WEIGHT
 
             items.append(
-                {
-                    "title": title,
-                    "url": repo.get("url", ""),
-                    "source": "github",
-                    "engagement_score": engagement,
-                    "published_at": datetime.now(),
-                    "category": "开发",  # 统一归类为开发/工程
-                    "raw_data": repo,
-                }
+                TrendItem(
+                    title=title,
+                    url=repo.get("url", ""),
+                    source="github",
+                    engagement_score=engagement,
+                    published_at=datetime.now(),
+                    category="开发",  # 统一归类为开发/工程
+                    raw_data=self._project_raw(repo),
+                )
             )
 
         return items
@@ -1,64 +1,145 @@
 """HackerNews 热点爬虫。"""
 from __future__ import annotations
 
-import aiohttp
+import asyncio
+import time
 from datetime import datetime
-from typing import Dict, List
+from typing import Any, AsyncIterator, Dict, List, Optional, Tuple
 
-from .base_crawler import BaseCrawler
+from .base_crawler import BaseCrawler, TrendItem
+from .hn_item_store import HNItemStore
+from .http_client import HttpClient
+from backend.utils.config_loader import load_yaml_config
+from backend.utils.config_schema import CRAWLER_CONFIG_PATH
+from backend.utils.keywords import KeywordMatcher
 
-HN_TOP_LIMIT = 30  # 只取前 30 个热门
 COMMENT_WEIGHT = 0.5  # 评论折算权重
+SOURCE = "hackernews"
+
+DEFAULT_CATEGORY = "科技"
+# 分组按优先级声明，命中多个时取最靠前的
+CATEGORY_MATCHER = KeywordMatcher(
+    {
+        "AI": ["ai", "*gpt*", "llm*", "neural"],
+        "区块链": ["blockchain*", "crypto*", "bitcoin*"],
+        "安全": ["hack*", "*security*", "vulnerabilit*"],
+    }
+)
 
 
 class HackerNewsCrawler(BaseCrawler):
     """使用官方 Firebase API 拉取 HN 热榜。"""
 
+    name = SOURCE
+    raw_fields = ("id", "by", "type", "score", "descendants", "time")
     api_base = "https://hacker-news.firebaseio.com/v0"
 
-    async def fetch_trending(self) -> List[Dict]:
-        """抓取热门话题，返回统一结构。"""
-        trending_items: List[Dict] = []
-
-        async with aiohttp.ClientSession() as session:
-            async with session.get(f"{self.api_base}/topstories.json") as resp:
-                story_ids = await resp.json()
-                top_ids = story_ids[:HN_TOP_LIMIT]
-
-            # 顺序请求，避免过多并发对接口造成压力
-            for story_id in top_ids:
-                async with session.get(f"{self.api_base}/item/{story_id}.json") as resp:
-                    story = await resp.json()
-
-                if not story or not story.get("title"):
-                    continue
-
-                title = story["title"]
-                score = story.get("score", 0)
-                comments = story.get("descendants", 0)
-                published_at = BaseCrawler.parse_datetime(story.get("time", datetime.now().timestamp()))
-
-                item = {
-                    "title": title,
-                    "url": story.get("url", f"https://news.ycombinator.com/item?id={story_id}"),
-                    "source": "hackernews",
-                    "engagement_score": score + comments * COMMENT_WEIGHT,
-                    "published_at": published_at,
-                    "category": self._categorize(title),
-                    "raw_data": story,
-                }
-                trending_items.append(item)
-
-        return trending_items
+    def __init__(self) -> None:
+        conf = load_yaml_config(CRAWLER_CONFIG_PATH)["hackernews"]
+        self.top_limit = conf["top_limit"]
+        self.concurrency = max(1, conf["concurrency"])
+        self.item_store = HNItemStore(conf["item_store"], conf["item_retention_days"])
+        self.store_stats = {"skipped": 0, "refreshed": 0, "fetched": 0}
+
+    async def fetch_trending(self) -> List[TrendItem]:
+        """抓取热门话题，返回统一结构（保持 topstories 排名顺序）。"""
+        ranked = [pair async for pair in self._iter_ranked()]
+        ranked.sort(key=lambda pair: pair[0])
+        return [item for _, item in ranked]
+
+    async def stream_trending(self) -> AsyncIterator[TrendItem]:
+        """按完成先后逐条产出，不等待最慢的 item。"""
+        async for _, item in self._iter_ranked():
+            yield item
+
+    async def _iter_ranked(self) -> AsyncIterator[Tuple[int, TrendItem]]:
+        """并发拉取 item，按完成顺序产出 (排名, 标准化结构)。"""
+        async with self._http_client() as http:
+            story_ids = await http.get_json(f"{self.api_base}/topstories.json", source=SOURCE, cacheable=True)
+            top_ids = story_ids[: self.top_limit]
+
+            # 信号量限制同时在途的请求数，速率由共享客户端按主机令牌桶控制
+            semaphore = asyncio.Semaphore(self.concurrency)
+            self.store_stats = {"skipped": 0, "refreshed": 0, "fetched": 0}
+            now = time.time()
+            tasks = [
+                asyncio.ensure_future(self._load_ranked(http, semaphore, rank, story_id, now))
+                for rank, story_id in enumerate(top_ids)
+            ]
+
+            failed = 0
+            try:
+                for next_done in asyncio.as_completed(tasks):
+                    rank, story_id, story = await next_done
+                    if isinstance(story, Exception):
+                        failed += 1
+                        continue
+                    if not story or not story.get("title"):
+                        continue
+                    yield rank, self._build_item(story_id, story)
+            finally:
+                # 消费方提前退出时取消剩余请求，并保存已拉到的 item
+                for task in tasks:
+                    task.cancel()
+                self.item_store.flush()
+
+        if failed:
+            print(f"   ⚠️  HN {failed}/{len(top_ids)} 条 item 拉取失败")
+        stats = self.store_stats
+        print(f"   ℹ️  HN item: 沿用 {stats['skipped']}, 刷新热度 {stats['refreshed']}, 全量拉取 {stats['fetched']}")
+
+    async def _load_ranked(
+        self, http: HttpClient, semaphore: asyncio.Semaphore, rank: int, story_id: int, now: float
+    ) -> Tuple[int, int, Any]:
+        """包装 _load_item，把排名带回并将异常作为结果返回。"""
+        try:
+            return rank, story_id, await self._load_item(http, semaphore, story_id, now)
+        except Exception as exc:  # pragma: no cover - 单条失败不影响整体
+            return rank, story_id, exc
+
+    async def _load_item(
+        self, http: HttpClient, semaphore: asyncio.Semaphore, story_id: int, now: float
+    ) -> Optional[Dict]:
+        """优先使用本地存储：未到刷新时间直接沿用，到期重拉整条但只更新 score/descendants，新故事才整条入库。"""
+        cached = self.item_store.get(story_id)
+        if cached is not None and not self.item_store.needs_refresh(story_id, now):
+            self.store_stats["skipped"] += 1
+            return cached
+
+        async with semaphore:
+            # 单个 item 请求已含易变字段，比分别请求 score/descendants 少一次往返
+            story = await self._get(http, f"{self.api_base}/item/{story_id}.json")
+            if cached is not None:
+                self.store_stats["refreshed"] += 1
+                return self.item_store.update_volatile(story_id, story or {}, now)
+
+            self.store_stats["fetched"] += 1
+            if not story or "id" not in story:
+                return story
+            return self.item_store.put(story, now)
+
+    async def _get(self, http: HttpClient, url: str):
+        """按 hackernews 数据源策略限速、重试的 GET。"""
+        return await http.get_json(url, source=SOURCE)
+
+    def _build_item(self, story_id: int, story: Dict) -> TrendItem:
+        """将 HN item 转为统一结构。"""
+        title = story["title"]
+        score = story.get("score", 0)
+        comments = story.get("descendants", 0)
+        published_at = BaseCrawler.parse_datetime(story.get("time", datetime.now().timestamp()))
+
+        return TrendItem(
+            title=title,
+            url=story.get("url", f"https://news.ycombinator.com/item?id={story_id}"),
+            source=SOURCE,
+            engagement_score=score + comments * COMMENT_WEIGHT,
+            published_at=published_at,
+            category=self._categorize(title),
+            raw_data=self._project_raw(story),
+        )
 
     @staticmethod
     def _categorize(title: str) -> str:
         """基于标题关键词粗略分类。"""
-        lower = title.lower()
-        if any(kw in lower for kw in ["ai", "gpt", "llm", "neural"]):
-            return "AI"
-        if any(kw in lower for kw in ["blockchain", "crypto", "bitcoin"]):
-            return "区块链"
-        if any(kw in lower for kw in ["hack", "security", "vulnerability"]):
-            return "安全"
-        return "科技"
+        return CATEGORY_MATCHER.first_group(title, DEFAULT_CATEGORY)
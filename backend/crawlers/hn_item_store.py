@@ -0,0 +1,116 @@
+"""HackerNews item 的跨运行增量存储（追加写日志 + 定期压缩）。"""
+from __future__ import annotations
+
+import json
+import os
+import time
+from pathlib import Path
+from typing import Dict, List, Optional
+
+DEFAULT_STORE_PATH = "data/cache/hn_items.jsonl"
+DEFAULT_RETENTION_DAYS = 7
+VOLATILE_FIELDS = ("score", "descendants")
+SKIPPED_FIELDS = ("kids",)  # 评论 ID 列表体积大且下游不用，不落盘
+# (故事年龄上限秒, 刷新间隔秒)：越老的故事热度变化越慢，刷新越稀疏
+REFRESH_TIERS = [
+    (2 * 3600, 5 * 60),
+    (24 * 3600, 30 * 60),
+    (72 * 3600, 3 * 3600),
+]
+DEFAULT_REFRESH_INTERVAL = 24 * 3600
+COMPACT_RATIO = 2  # 日志行数超过存活条目数的倍数时触发压缩
+
+
+class HNItemStore:
+    """按 story ID 保存 item：不可变字段只取一次，score/descendants 按故事年龄定期刷新。"""
+
+    def __init__(self, path: str = DEFAULT_STORE_PATH, retention_days: int = DEFAULT_RETENTION_DAYS) -> None:
+        self.path = Path(path)
+        self.retention_seconds = retention_days * 86400
+        self._records: Dict[int, Dict] = {}
+        self._pending: List[Dict] = []
+        self._log_lines = 0
+        self._load()
+
+    def get(self, story_id: int) -> Optional[Dict]:
+        record = self._records.get(story_id)
+        return record["item"] if record else None
+
+    def needs_refresh(self, story_id: int, now: Optional[float] = None) -> bool:
+        record = self._records.get(story_id)
+        if record is None:
+            return True
+        now = now or time.time()
+        story_time = record["item"].get("time", now)
+        return now - record["fetched_at"] >= self.refresh_interval(story_time, now)
+
+    @staticmethod
+    def refresh_interval(story_time: float, now: float) -> float:
+        """按故事年龄返回易变字段的刷新间隔。"""
+        age = now - story_time
+        for max_age, interval in REFRESH_TIERS:
+            if age < max_age:
+                return interval
+        return DEFAULT_REFRESH_INTERVAL
+
+    def put(self, story: Dict, now: Optional[float] = None) -> Dict:
+        """保存完整 item（剔除大字段）。"""
+        item = {key: value for key, value in story.items() if key not in SKIPPED_FIELDS}
+        self._append({"id": story["id"], "fetched_at": now or time.time(), "item": item})
+        return item
+
+    def update_volatile(self, story_id: int, fields: Dict, now: Optional[float] = None) -> Dict:
+        """只取 fields（可为重新拉取的完整 item）中的易变字段，其余沿用已存内容。"""
+        item = dict(self._records[story_id]["item"])
+        for key in VOLATILE_FIELDS:
+            if fields.get(key) is not None:
+                item[key] = fields[key]
+        self._append({"id": story_id, "fetched_at": now or time.time(), "item": item})
+        return item
+
+    def flush(self) -> None:
+        """把本轮变更追加到日志，必要时压缩。"""
+        if self._pending:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            with self.path.open("a", encoding="utf-8") as fp:
+                for record in self._pending:
+                    fp.write(json.dumps(record, ensure_ascii=False) + "\n")
+            self._log_lines += len(self._pending)
+            self._pending = []
+
+        if self._log_lines > COMPACT_RATIO * max(len(self._records), 1):
+            self.compact()
+
+    def compact(self, now: Optional[float] = None) -> None:
+        """丢弃超出保留期的故事，并把日志重写为每个 ID 一行。"""
+        now = now or time.time()
+        self._records = {
+            story_id: record
+            for story_id, record in self._records.items()
+            if now - record["item"].get("time", now) <= self.retention_seconds
+        }
+
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.path.with_suffix(".tmp")
+        with tmp_path.open("w", encoding="utf-8") as fp:
+            for record in self._records.values():
+                fp.write(json.dumps(record, ensure_ascii=False) + "\n")
+        os.replace(tmp_path, self.path)
+        self._log_lines = len(self._records)
+
+    def _append(self, record: Dict) -> None:
+        self._records[record["id"]] = record
+        self._pending.append(record)
+
+    def _load(self) -> None:
+        """回放日志，同一 ID 以最后一行为准；损坏的行直接跳过。"""
+        if not self.path.exists():
+            return
+        with self.path.open("r", encoding="utf-8") as fp:
+            for line in fp:
+                self._log_lines += 1
+                try:
+                    record = json.loads(line)
+                    self._records[record["id"]] = record
+                except (ValueError, KeyError, TypeError):
+                    continue
@@ -0,0 +1,172 @@
+"""爬虫响应的磁盘缓存，支持 ETag / Last-Modified 条件请求。"""
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import re
+import time
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Any, Dict, Mapping, Optional
+
+DEFAULT_CACHE_DIR = "data/cache/http"
+DEFAULT_TTL = 600  # 上游未给校验信息时的兜底新鲜期（秒）
+DEFAULT_MAX_ENTRIES = 500
+DEFAULT_MAX_BYTES = 50 * 1024 * 1024
+
+MAX_AGE_PATTERN = re.compile(r"max-age=(\d+)")
+
+
+@dataclass
+class CacheEntry:
+    """单条缓存：已解析的 JSON 与校验信息。"""
+
+    url: str
+    payload: Any
+    etag: Optional[str] = None
+    last_modified: Optional[str] = None
+    expires_at: float = 0.0
+    stored_at: float = field(default_factory=time.time)
+
+    def is_fresh(self, now: Optional[float] = None) -> bool:
+        return (now or time.time()) < self.expires_at
+
+    def conditional_headers(self) -> Dict[str, str]:
+        """构造条件请求头。"""
+        headers: Dict[str, str] = {}
+        if self.etag:
+            headers["If-None-Match"] = self.etag
+        if self.last_modified:
+            headers["If-Modified-Since"] = self.last_modified
+        return headers
+
+
+@dataclass
+class CacheStats:
+    fresh_hits: int = 0
+    revalidated: int = 0
+    misses: int = 0
+    evictions: int = 0
+
+    def as_dict(self) -> Dict[str, int]:
+        return asdict(self)
+
+
+class ResponseCache:
+    """按 URL+参数缓存解析后的响应，按最近使用时间做容量淘汰。"""
+
+    def __init__(
+        self,
+        cache_dir: str = DEFAULT_CACHE_DIR,
+        default_ttl: float = DEFAULT_TTL,
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+        max_bytes: int = DEFAULT_MAX_BYTES,
+    ) -> None:
+        self.cache_dir = Path(cache_dir)
+        self.default_ttl = default_ttl
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.stats = CacheStats()
+        # 进程内保留已解析的条目，同一进程重复命中无需再读盘解析
+        self._memory: Dict[str, CacheEntry] = {}
+
+    @classmethod
+    def from_config(cls, conf: Mapping) -> "ResponseCache":
+        return cls(
+            cache_dir=conf["dir"],
+            default_ttl=conf["default_ttl"],
+            max_entries=conf["max_entries"],
+            max_bytes=conf["max_bytes"],
+        )
+
+    @staticmethod
+    def make_key(url: str, params: Optional[Mapping] = None) -> str:
+        raw = url
+        if params:
+            raw += "?" + "&".join(f"{k}={params[k]}" for k in sorted(params))
+        return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+    def get(self, key: str) -> Optional[CacheEntry]:
+        """读取条目并刷新其最近使用时间。"""
+        path = self._path(key)
+        entry = self._memory.get(key)
+        if entry is None:
+            try:
+                entry = CacheEntry(**json.loads(path.read_text(encoding="utf-8")))
+            except (OSError, ValueError, TypeError):
+                return None
+            self._memory[key] = entry
+
+        try:
+            os.utime(path)
+        except OSError:
+            pass
+        return entry
+
+    def store(self, key: str, url: str, headers: Mapping[str, str], payload: Any) -> None:
+        """写入新响应；Cache-Control: no-store 时不缓存。"""
+        cache_control = headers.get("Cache-Control", "").lower()
+        if "no-store" in cache_control:
+            return
+
+        entry = CacheEntry(
+            url=url,
+            payload=payload,
+            etag=headers.get("ETag"),
+            last_modified=headers.get("Last-Modified"),
+        )
+        entry.expires_at = self._expires_at(entry, cache_control)
+        self._write(key, entry)
+        self._evict()
+
+    def refresh(self, key: str, entry: CacheEntry, headers: Mapping[str, str]) -> None:
+        """304 后沿用原内容，仅更新校验信息与新鲜期。"""
+        entry.etag = headers.get("ETag", entry.etag)
+        entry.last_modified = headers.get("Last-Modified", entry.last_modified)
+        entry.stored_at = time.time()
+        entry.expires_at = self._expires_at(entry, headers.get("Cache-Control", "").lower())
+        self._write(key, entry)
+
+    def _expires_at(self, entry: CacheEntry, cache_control: str) -> float:
+        """max-age 优先；有校验信息时每次走条件请求；都没有则用兜底 TTL。"""
+        now = time.time()
+        if "no-cache" in cache_control:
+            return now
+        match = MAX_AGE_PATTERN.search(cache_control)
+        if match:
+            return now + int(match.group(1))
+        if entry.etag or entry.last_modified:
+            return now
+        return now + self.default_ttl
+
+    def _write(self, key: str, entry: CacheEntry) -> None:
+        """先写临时文件再原子替换，避免中途崩溃留下半截缓存。"""
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        path = self._path(key)
+        tmp_path = path.with_suffix(".tmp")
+        tmp_path.write_text(json.dumps(asdict(entry), ensure_ascii=False), encoding="utf-8")
+        os.replace(tmp_path, path)
+        self._memory[key] = entry
+
+    def _evict(self) -> None:
+        """超过条目数或总字节数时，按最近使用时间从旧到新淘汰。"""
+        files = []
+        for path in self.cache_dir.glob("*.json"):
+            try:
+                stat = path.stat()
+            except OSError:
+                continue
+            files.append((stat.st_mtime, stat.st_size, path))
+
+        files.sort()
+        total_bytes = sum(size for _, size, _ in files)
+        while files and (len(files) > self.max_entries or total_bytes > self.max_bytes):
+            _, size, path = files.pop(0)
+            path.unlink(missing_ok=True)
+            self._memory.pop(path.stem, None)
+            total_bytes -= size
+            self.stats.evictions += 1
+
+    def _path(self, key: str) -> Path:
+        return self.cache_dir / f"{key}.json"
@@ -0,0 +1,192 @@
+"""爬虫共享 HTTP 客户端：连接池复用、按主机限速、失败重试与连接统计。"""
+from __future__ import annotations
+
+import asyncio
+from dataclasses import asdict, dataclass
+from typing import Any, Dict, Mapping, Optional, Tuple
+from urllib.parse import urlsplit
+
+import aiohttp
+
+from .http_cache import ResponseCache
+from .rate_limit import RETRYABLE_STATUS, RetryStats, SourcePolicy, TokenBucket
+from backend.utils.config_loader import load_yaml_config
+from backend.utils.config_schema import CRAWLER_CONFIG_PATH, CRAWLER_CONFIG_SCHEMA, validate
+
+
+@dataclass
+class ConnectionStats:
+    """连接层计数，供运行汇总展示。"""
+
+    requests: int = 0
+    created: int = 0
+    reused: int = 0
+
+    def as_dict(self) -> Dict[str, int]:
+        return asdict(self)
+
+
+class HttpClient:
+    """封装共享 ClientSession，由管线持有并在结束时关闭。"""
+
+    def __init__(self, crawler_conf: Optional[Dict] = None) -> None:
+        # 显式传入的配置同样按 schema 补齐缺省值
+        if crawler_conf is None:
+            crawler_conf = load_yaml_config(CRAWLER_CONFIG_PATH)
+        else:
+            crawler_conf = validate(crawler_conf, CRAWLER_CONFIG_SCHEMA)
+        self.conf = crawler_conf["http"]
+        self.sources_conf = crawler_conf["sources"]
+        cache_conf = crawler_conf["cache"]
+
+        self.stats = ConnectionStats()
+        self.retry_stats = RetryStats()
+        self.cache: Optional[ResponseCache] = (
+            ResponseCache.from_config(cache_conf) if cache_conf["enabled"] else None
+        )
+        self._session: Optional[aiohttp.ClientSession] = None
+        self._policies: Dict[str, SourcePolicy] = {}
+        # 令牌桶按主机共享：不同数据源访问同一主机时共用额度
+        self._buckets: Dict[str, TokenBucket] = {}
+
+    @property
+    def closed(self) -> bool:
+        return self._session is None or self._session.closed
+
+    async def open(self) -> None:
+        """按配置创建连接池；ClientSession 需在事件循环内创建，因此延迟到首次使用。"""
+        if not self.closed:
+            return
+
+        connector = aiohttp.TCPConnector(
+            limit=self.conf["limit"],
+            limit_per_host=self.conf["limit_per_host"],
+            use_dns_cache=True,
+            ttl_dns_cache=self.conf["dns_cache_ttl"],
+            keepalive_timeout=self.conf["keepalive_timeout"],
+        )
+        self._session = aiohttp.ClientSession(
+            connector=connector,
+            timeout=aiohttp.ClientTimeout(**self.conf["timeout"]),
+            trace_configs=[self._build_trace_config()],
+        )
+
+    async def close(self) -> None:
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+        self._session = None
+
+    async def __aenter__(self) -> "HttpClient":
+        await self.open()
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.close()
+
+    async def request_json(self, method: str, url: str, *, source: Optional[str] = None, **kwargs) -> Any:
+        """发起请求并解析 JSON，重试耗尽后非 2xx 状态直接抛出。"""
+        _, _, payload = await self._send(method, url, source, **kwargs)
+        return payload
+
+    async def get_json(self, url: str, *, source: Optional[str] = None, cacheable: bool = False, **kwargs) -> Any:
+        """GET 并解析 JSON；cacheable 为真时走磁盘缓存与条件请求。"""
+        if not cacheable or self.cache is None:
+            return await self.request_json("GET", url, source=source, **kwargs)
+
+        key = self.cache.make_key(url, kwargs.get("params"))
+        entry = self.cache.get(key)
+        if entry is not None and entry.is_fresh():
+            self.cache.stats.fresh_hits += 1
+            return entry.payload
+
+        headers = dict(kwargs.pop("headers", None) or {})
+        if entry is not None:
+            headers.update(entry.conditional_headers())
+
+        status, resp_headers, payload = await self._send("GET", url, source, headers=headers, **kwargs)
+        if status == 304 and entry is not None:
+            # 上游未变更，直接复用已解析的内容
+            self.cache.stats.revalidated += 1
+            self.cache.refresh(key, entry, resp_headers)
+            return entry.payload
+
+        self.cache.stats.misses += 1
+        self.cache.store(key, url, resp_headers, payload)
+        return payload
+
+    async def post_json(self, url: str, *, source: Optional[str] = None, **kwargs) -> Any:
+        return await self.request_json("POST", url, source=source, **kwargs)
+
+    async def _send(
+        self, method: str, url: str, source: Optional[str], **kwargs
+    ) -> Tuple[int, Mapping[str, str], Any]:
+        """
+        带限速与重试的统一请求路径，返回 (状态码, 响应头, 解析后的 JSON)。
+
+        429/5xx 与连接类错误按数据源策略指数退避重试，并遵守 Retry-After；304 不解析正文直接返回。
+        """
+        await self.open()
+        policy = self._policy(source)
+        bucket = self._bucket(url, policy)
+        attempt = 0
+
+        while True:
+            if bucket is not None and await bucket.acquire() > 0:
+                self.retry_stats.limiter_waits += 1
+
+            try:
+                async with self._session.request(method, url, **kwargs) as resp:
+                    if resp.status not in RETRYABLE_STATUS:
+                        if resp.status == 304:
+                            return resp.status, resp.headers, None
+                        resp.raise_for_status()
+                        return resp.status, resp.headers, await resp.json(content_type=None)
+
+                    if resp.status == 429:
+                        self.retry_stats.throttles += 1
+                    delay = policy.backoff(attempt, resp.headers.get("Retry-After"))
+                    if attempt >= policy.retries or delay is None:
+                        self.retry_stats.give_ups += 1
+                        resp.raise_for_status()
+            except (aiohttp.ClientConnectionError, asyncio.TimeoutError):
+                if attempt >= policy.retries:
+                    self.retry_stats.give_ups += 1
+                    raise
+                delay = policy.backoff(attempt)
+
+            attempt += 1
+            self.retry_stats.retries += 1
+            await asyncio.sleep(delay)
+
+    def _policy(self, source: Optional[str]) -> SourcePolicy:
+        key = source or "default"
+        if key not in self._policies:
+            self._policies[key] = SourcePolicy.from_config(self.sources_conf, source)
+        return self._policies[key]
+
+    def _bucket(self, url: str, policy: SourcePolicy) -> Optional[TokenBucket]:
+        """主机首次遇到限速策略时按该速率建桶，之后访问该主机的所有请求共用。"""
+        host = urlsplit(url).netloc
+        bucket = self._buckets.get(host)
+        if bucket is None and policy.rate > 0:
+            bucket = self._buckets[host] = TokenBucket(policy.rate, policy.burst or None)
+        return bucket
+
+    def _build_trace_config(self) -> aiohttp.TraceConfig:
+        """通过 aiohttp trace 钩子统计新建/复用的连接数。"""
+        stats = self.stats
+
+        async def on_request_start(session, ctx, params) -> None:
+            stats.requests += 1
+
+        async def on_connection_create_end(session, ctx, params) -> None:
+            stats.created += 1
+
+        async def on_connection_reuseconn(session, ctx, params) -> None:
+            stats.reused += 1
+
+        trace = aiohttp.TraceConfig()
+        trace.on_request_start.append(on_request_start)
+        trace.on_connection_create_end.append(on_connection_create_end)
+        trace.on_connection_reuseconn.append(on_connection_reuseconn)
+        return trace
@@ -1,11 +1,16 @@
 """基于 MCP Trends Hub 的聚合爬虫。"""
 from __future__ import annotations
 
-import aiohttp
+import asyncio
+import time
 from datetime import datetime
-from typing import Dict, List
+from typing import AsyncIterator, Dict, List, Tuple
 
-from .base_crawler import BaseCrawler
+from .base_crawler import BaseCrawler, TrendItem
+from .http_client import HttpClient
+from backend.utils.config_loader import load_yaml_config
+from backend.utils.config_schema import CRAWLER_CONFIG_PATH
+from backend.utils.keywords import KeywordMatcher
 
 DEFAULT_MCP_BASE = "http://localhost:3000"
 PLATFORMS = [
@@ -21,35 +26,111 @@ PLATFORMS = [
     "toutiao",
 ]
 
+DEFAULT_CATEGORY = "科技"
+# 分组按优先级声明，命中多个时取最靠前的
+CATEGORY_MATCHER = KeywordMatcher(
+    {
+        "AI": ["ai", "*gpt*", "ml", "neural", "人工智能", "机器学习"],
+        "区块链": ["blockchain*", "区块链", "crypto*", "web3"],
+        "安全": ["*security*", "漏洞", "攻击", "breach*"],
+    }
+)
+
 
 class MCPTrendsCrawler(BaseCrawler):
     """通过本地 MCP 服务拉取多平台 trending。"""
 
+    name = "mcp"
+    # 各平台计算热度用到的字段
+    raw_fields = ("id", "stars", "forks", "points", "comments", "upvotes", "hot_value", "hot_score", "score", "likes")
+
     def __init__(self, base_url: str = DEFAULT_MCP_BASE, limit: int = 30) -> None:
         self.base_url = base_url.rstrip("/")
         self.limit = limit
 
-    async def fetch_trending(self) -> List[Dict]:
-        all_items: List[Dict] = []
-        for platform in PLATFORMS:
+        conf = load_yaml_config(CRAWLER_CONFIG_PATH)["mcp"]
+        self.concurrency = max(1, conf["concurrency"])
+        self.platform_timeout = conf["platform_timeout"]
+        # 最近一次抓取各平台的状态与耗时，便于定位慢源
+        self.platform_stats: Dict[str, Dict] = {}
+
+    async def fetch_trending(self) -> List[TrendItem]:
+        """并发拉取所有平台，单平台超时或失败时返回其余平台的结果（按 PLATFORMS 顺序）。"""
+        batches = [pair async for pair in self._iter_platforms()]
+        batches.sort(key=lambda pair: pair[0])
+
+        all_items: List[TrendItem] = []
+        for _, items in batches:
+            all_items.extend(items)
+        return all_items
+
+    async def stream_trending(self) -> AsyncIterator[TrendItem]:
+        """哪个平台先返回就先产出哪个平台的条目。"""
+        async for _, items in self._iter_platforms():
+            for item in items:
+                yield item
+
+    async def _iter_platforms(self) -> AsyncIterator[Tuple[int, List[TrendItem]]]:
+        """按完成顺序产出 (平台序号, 该平台条目)。"""
+        self.platform_stats = {}
+        semaphore = asyncio.Semaphore(self.concurrency)
+
+        async with self._http_client() as http:
+            tasks = [
+                asyncio.ensure_future(self._fetch_indexed(http, semaphore, idx, platform))
+                for idx, platform in enumerate(PLATFORMS)
+            ]
             try:
-                items = await self._fetch_platform(platform)
-                all_items.extend(items)
+                for next_done in asyncio.as_completed(tasks):
+                    yield await next_done
+            finally:
+                for task in tasks:
+                    task.cancel()
+
+        self._print_platform_stats()
+
+    async def _fetch_indexed(
+        self, http: HttpClient, semaphore: asyncio.Semaphore, idx: int, platform: str
+    ) -> Tuple[int, List[TrendItem]]:
+        return idx, await self._fetch_with_deadline(http, semaphore, platform)
+
+    async def _fetch_with_deadline(
+        self, http: HttpClient, semaphore: asyncio.Semaphore, platform: str
+    ) -> List[TrendItem]:
+        """在并发上限内拉取单个平台，并记录耗时与状态。"""
+        async with semaphore:
+            start = time.monotonic()
+            items: List[TrendItem] = []
+            try:
+                items = await asyncio.wait_for(self._fetch_platform(http, platform), self.platform_timeout)
+                status = "ok"
+            except asyncio.TimeoutError:
+                status = "timeout"
             except Exception as exc:  # pragma: no cover - 运行时容错
+                status = "error"
                 print(f"   ⚠️  MCP {platform} 拉取失败: {exc}")
-                continue
-        return all_items
 
-    async def _fetch_platform(self, platform: str) -> List[Dict]:
+            self.platform_stats[platform] = {
+                "status": status,
+                "latency_ms": round((time.monotonic() - start) * 1000),
+                "count": len(items),
+            }
+            return items
+
+    def _print_platform_stats(self) -> None:
+        """按耗时降序输出各平台状态，最慢的上游排在最前。"""
+        ranked = sorted(self.platform_stats.items(), key=lambda kv: kv[1]["latency_ms"], reverse=True)
+        summary = ", ".join(
+            f"{platform} {stat['latency_ms']}ms/{stat['status']}/{stat['count']}" for platform, stat in ranked
+        )
+        print(f"   ℹ️  MCP 平台: {summary}")
+
+    async def _fetch_platform(self, http: HttpClient, platform: str) -> List[TrendItem]:
         url = f"{self.base_url}/trends/{platform}"
         payload = {"limit": self.limit}
-        items: List[Dict] = []
+        items: List[TrendItem] = []
 
-        async with aiohttp.ClientSession() as session:
-            async with session.post(url, json=payload) as resp:
-                if resp.status != 200:
-                    raise RuntimeError(f"status {resp.status}")
-                data = await resp.json()
+        data = await http.post_json(url, source="mcp", json=payload)
 
         for raw in data.get("items", []):
             title = raw.get("title")
@@ -57,15 +138,15 @@ class MCPTrendsCrawler(BaseCrawler):
                 continue
 
             items.append(
-                {
-                    "title": title,
-                    "url": raw.get("url", ""),
-                    "source": platform,
-                    "engagement_score": self._calculate_score(raw, platform),
-                    "published_at": datetime.now(),  # MCP 端未必含时间，默认当前
-                    "category": self._categorize(title),
-                    "raw_data": raw,
-                }
+                TrendItem(
+                    title=title,
+                    url=raw.get("url", ""),
+                    source=platform,
+                    engagement_score=self._calculate_score(raw, platform),
+                    published_at=datetime.now(),  # MCP 端未必含时间，默认当前
+                    category=self._categorize(title),
+                    raw_data=self._project_raw(raw),
+                )
             )
         return items
 
@@ -90,11 +171,4 @@ class MCPTrendsCrawler(BaseCrawler):
     @staticmethod
     def _categorize(title: str) -> str:
         """粗分类，优先科技相关。"""
-        lower = title.lower()
-        if any(kw in lower for kw in ["ai", "gpt", "ml", "neural", "人工智能", "机器学习"]):
-            return "AI"
-        if any(kw in lower for kw in ["blockchain", "区块链", "crypto", "web3"]):
-            return "区块链"
-        if any(kw in lower for kw in ["security", "漏洞", "攻击", "breach"]):
-            return "安全"
-        return "科技"
+        return CATEGORY_MATCHER.first_group(title, DEFAULT_CATEGORY)
@@ -1,12 +1,12 @@
 """NewsAPI 热点爬虫。"""
 from __future__ import annotations
 
-import aiohttp
 from datetime import datetime
-from typing import Dict, List
+from typing import List
 
-from .base_crawler import BaseCrawler
+from .base_crawler import BaseCrawler, TrendItem
 from backend.utils.config_loader import load_yaml_config
+from backend.utils.keywords import KeywordMatcher
 
 NEWSAPI_ENDPOINT = "https://newsapi.org/v2/top-headlines"
 DEFAULT_COUNTRY = "us"
@@ -14,15 +14,28 @@ PAGE_SIZE = 30
 BASE_ENGAGEMENT = 6000  # 构造的热度基准，保证可通过阈值
 ENGAGEMENT_STEP = 120   # 递减步长
 
+DEFAULT_CATEGORY = "科技"
+# 分组按优先级声明，命中多个时取最靠前的
+CATEGORY_MATCHER = KeywordMatcher(
+    {
+        "AI": ["ai", "*gpt*", "ml", "neural"],
+        "硬件": ["chip*", "gpu*", "cpu*", "semiconductor*"],
+        "安全": ["*security*", "breach*", "attack*"],
+    }
+)
+
 
 class NewsAPICrawler(BaseCrawler):
     """使用 NewsAPI 获取科技新闻。"""
 
+    name = "newsapi"
+    raw_fields = ("source", "author", "publishedAt")
+
     def __init__(self) -> None:
         api_conf = load_yaml_config("backend/config/api_config.yaml")
         self.api_key = api_conf.get("newsapi_key")
 
-    async def fetch_trending(self) -> List[Dict]:
+    async def fetch_trending(self) -> List[TrendItem]:
         """调用 NewsAPI，返回标准化热点列表。"""
         if not self.api_key:
             # 缺少密钥直接返回空列表，避免报错
@@ -35,11 +48,10 @@ class NewsAPICrawler(BaseCrawler):
             "country": DEFAULT_COUNTRY,
         }
         headers = {"Authorization": self.api_key}
-        items: List[Dict] = []
+        items: List[TrendItem] = []
 
-        async with aiohttp.ClientSession() as session:
-            async with session.get(NEWSAPI_ENDPOINT, params=params, headers=headers) as resp:
-                data = await resp.json()
+        async with self._http_client() as http:
+            data = await http.get_json(NEWSAPI_ENDPOINT, source="newsapi", params=params, headers=headers)
 
         articles = data.get("articles", [])
         for idx, article in enumerate(articles):
@@ -51,15 +63,15 @@ class NewsAPICrawler(BaseCrawler):
             engagement = BASE_ENGAGEMENT - idx * ENGAGEMENT_STEP
 
             items.append(
-                {
-                    "title": title,
-                    "url": article.get("url", ""),
-                    "source": "newsapi",
-                    "engagement_score": max(0, engagement),
-                    "published_at": published_at,
-                    "category": self._categorize(title),
-                    "raw_data": article,
-                }
+                TrendItem(
+                    title=title,
+                    url=article.get("url", ""),
+                    source="newsapi",
+                    engagement_score=max(0, engagement),
+                    published_at=published_at,
+                    category=self._categorize(title),
+                    raw_data=self._project_raw(article),
+                )
             )
 
         return items
@@ -67,11 +79,4 @@ class NewsAPICrawler(BaseCrawler):
     @staticmethod
     def _categorize(title: str) -> str:
         """基于关键词分科技子类。"""
-        lower = title.lower()
-        if any(kw in lower for kw in ["ai", "gpt", "ml", "neural"]):
-            return "AI"
-        if any(kw in lower for kw in ["chip", "gpu", "cpu", "semiconductor"]):
-            return "硬件"
-        if any(kw in lower for kw in ["security", "breach", "attack"]):
-            return "安全"
-        return "科技"
+        return CATEGORY_MATCHER.first_group(title, DEFAULT_CATEGORY)
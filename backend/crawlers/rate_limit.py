@@ -0,0 +1,99 @@
+"""爬虫限速与重试策略。"""
+from __future__ import annotations
+
+import asyncio
+import random
+import time
+from dataclasses import asdict, dataclass
+from email.utils import parsedate_to_datetime
+from typing import Dict, Mapping, Optional
+
+DEFAULT_RETRIES = 2
+DEFAULT_BACKOFF_BASE = 0.5  # 秒
+DEFAULT_BACKOFF_MAX = 30  # 秒
+RETRYABLE_STATUS = {429, 500, 502, 503, 504}
+
+
+class TokenBucket:
+    """异步令牌桶：rate 为每秒补充的令牌数，burst 为桶容量。"""
+
+    def __init__(self, rate: float, burst: Optional[float] = None) -> None:
+        if rate <= 0:
+            raise ValueError("rate 必须为正数")
+        self.rate = float(rate)
+        self.capacity = float(burst) if burst else max(1.0, self.rate)
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    async def acquire(self) -> float:
+        """取一个令牌，不足时等待补充；返回实际等待秒数。"""
+        waited = 0.0
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+                self._updated = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return waited
+
+                delay = (1 - self._tokens) / self.rate
+                await asyncio.sleep(delay)
+                waited += delay
+
+
+@dataclass
+class SourcePolicy:
+    """单个数据源的限速与重试策略。"""
+
+    rate: float = 0.0  # 每秒请求数，0 表示不限速
+    burst: float = 0.0
+    retries: int = DEFAULT_RETRIES
+    backoff_base: float = DEFAULT_BACKOFF_BASE
+    backoff_max: float = DEFAULT_BACKOFF_MAX
+
+    @classmethod
+    def from_config(cls, sources_conf: Mapping, source: Optional[str]) -> "SourcePolicy":
+        """default 段为基础，数据源自身配置覆盖；未单独配置的数据源直接沿用 default。"""
+        merged = {**sources_conf["default"], **sources_conf.get(source or "", {})}
+        known = {key: merged[key] for key in cls.__dataclass_fields__ if key in merged}
+        return cls(**known)
+
+    def backoff(self, attempt: int, retry_after: Optional[str] = None) -> Optional[float]:
+        """
+        计算第 attempt 次重试前的等待秒数（指数退避 + 全抖动）。
+
+        上游给出 Retry-After 时至少等待该时长；若要求的等待超过 backoff_max 则返回 None，直接放弃。
+        """
+        delay = random.uniform(0, min(self.backoff_max, self.backoff_base * (2 ** attempt)))
+        if retry_after:
+            wait = parse_retry_after(retry_after)
+            if wait is not None:
+                if wait > self.backoff_max:
+                    return None
+                delay = max(delay, wait)
+        return delay
+
+
+@dataclass
+class RetryStats:
+    retries: int = 0
+    throttles: int = 0  # 上游返回 429
+    limiter_waits: int = 0  # 本地令牌桶触发的等待
+    give_ups: int = 0
+
+    def as_dict(self) -> Dict[str, int]:
+        return asdict(self)
+
+
+def parse_retry_after(value: str) -> Optional[float]:
+    """Retry-After 既可能是秒数也可能是 HTTP 日期。"""
+    value = value.strip()
+    if value.isdigit():
+        return float(value)
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    return max(0.0, retry_at.timestamp() - time.time())
@@ -1,32 +1,44 @@
 """Reddit 热点爬虫（使用公开 JSON，无需 OAuth）。"""
 from __future__ import annotations
 
-import aiohttp
 from datetime import datetime
-from typing import Dict, List
+from typing import List
 
-from .base_crawler import BaseCrawler
+from .base_crawler import BaseCrawler, TrendItem
 from backend.utils.config_loader import load_yaml_config
+from backend.utils.keywords import KeywordMatcher
 
 REDDIT_URL = "https://www.reddit.com/r/technology/top.json?limit=30&t=day"
 COMMENT_WEIGHT = 0.2  # 评论折算权重
 
+DEFAULT_CATEGORY = "科技"
+# 分组按优先级声明，命中多个时取最靠前的
+CATEGORY_MATCHER = KeywordMatcher(
+    {
+        "AI": ["ai", "*gpt*", "llm*", "neural"],
+        "云计算": ["cloud", "aws", "azure", "gcp"],
+        "安全": ["*security*", "breach*", "vulnerabilit*"],
+    }
+)
+
 
 class RedditCrawler(BaseCrawler):
     """抓取 /r/technology 日榜热点。"""
 
+    name = "reddit"
+    raw_fields = ("id", "subreddit", "url", "is_self", "ups", "num_comments", "created_utc")
+
     def __init__(self) -> None:
         api_conf = load_yaml_config("backend/config/api_config.yaml")
         self.user_agent = api_conf.get("reddit_user_agent", "trendforge-bot/0.1")
 
-    async def fetch_trending(self) -> List[Dict]:
+    async def fetch_trending(self) -> List[TrendItem]:
         """拉取 Reddit 热点并标准化结构。"""
         headers = {"User-Agent": self.user_agent}
-        items: List[Dict] = []
+        items: List[TrendItem] = []
 
-        async with aiohttp.ClientSession(headers=headers) as session:
-            async with session.get(REDDIT_URL) as resp:
-                data = await resp.json()
+        async with self._http_client() as http:
+            data = await http.get_json(REDDIT_URL, source="reddit", headers=headers, cacheable=True)
 
         posts = data.get("data", {}).get("children", [])
         for post in posts:
@@ -39,15 +51,15 @@ class RedditCrawler(BaseCrawler):
             comments = info.get("num_comments", 0)
             published_at = BaseCrawler.parse_datetime(info.get("created_utc", datetime.now().timestamp()))
 
-            item = {
-                "title": title,
-                "url": f"https://www.reddit.com{info.get('permalink', '')}",
-                "source": "reddit",
-                "engagement_score": ups + comments * COMMENT_WEIGHT,
-                "published_at": published_at,
-                "category": self._categorize(title),
-                "raw_data": info,
-            }
+            item = TrendItem(
+                title=title,
+                url=f"https://www.reddit.com{info.get('permalink', '')}",
+                source="reddit",
+                engagement_score=ups + comments * COMMENT_WEIGHT,
+                published_at=published_at,
+                category=self._categorize(title),
+                raw_data=self._project_raw(info),
+            )
             items.append(item)
 
         return items
@@ -55,11 +67,4 @@ class RedditCrawler(BaseCrawler):
     @staticmethod
     def _categorize(title: str) -> str:
         """基于标题粗分科技子类。"""
-        lower = title.lower()
-        if any(kw in lower for kw in ["ai", "gpt", "llm", "neural"]):
-            return "AI"
-        if any(kw in lower for kw in ["cloud", "aws", "azure", "gcp"]):
-            return "云计算"
-        if any(kw in lower for kw in ["security", "breach", "vulnerability"]):
-            return "安全"
-        return "科技"
+        return CATEGORY_MATCHER.first_group(title, DEFAULT_CATEGORY)
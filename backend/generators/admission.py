@@ -0,0 +1,210 @@
+"""DR 准入控制：按历史耗时/用量估算每个话题的成本，在本次运行的时间与用量预算内择优生成。"""
+from __future__ import annotations
+
+import json
+import sqlite3
+import time
+from dataclasses import asdict, dataclass, field
+from datetime import date, timedelta
+from pathlib import Path
+from typing import Callable, Dict, List, Mapping, Optional, Tuple
+
+from backend.generators.report_cache import topic_fingerprint
+
+MIN_CATEGORY_SAMPLES = 3  # 同类别样本少于该数时改用全局均值
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS runs (
+    id INTEGER PRIMARY KEY,
+    category TEXT NOT NULL,
+    duration REAL NOT NULL,
+    tokens INTEGER NOT NULL,
+    cost REAL NOT NULL,
+    finished_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS runs_category ON runs (category, id);
+"""
+
+
+@dataclass
+class RunUsage:
+    """一次研究的实际开销；命中报告缓存时各项为 0。"""
+
+    duration: float = 0.0  # 秒
+    tokens: int = 0
+    cost: float = 0.0
+
+    def __add__(self, other: "RunUsage") -> "RunUsage":
+        return RunUsage(self.duration + other.duration, self.tokens + other.tokens, self.cost + other.cost)
+
+
+class CostHistory:
+    """SQLite 记录每次研究的耗时与用量，按类别取最近 window 次的均值作为预估。"""
+
+    def __init__(self, path: str, window: int, default: RunUsage) -> None:
+        self.path = path
+        self.window = max(1, window)
+        self.default = default
+        if path != ":memory:":
+            Path(path).parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(path)
+        self._conn.execute("PRAGMA journal_mode = WAL")
+        self._conn.executescript(SCHEMA)
+
+    def record(self, category: str, usage: RunUsage) -> None:
+        with self._conn:
+            self._conn.execute(
+                "INSERT INTO runs (category, duration, tokens, cost, finished_at) VALUES (?, ?, ?, ?, ?)",
+                (category, usage.duration, usage.tokens, usage.cost, time.time()),
+            )
+
+    def estimate(self, category: str) -> RunUsage:
+        """同类别样本足够时用类别均值，否则用全局均值，没有历史时用配置的缺省值。"""
+        for where, params in (("WHERE category = ?", (category,)), ("", ())):
+            count, duration, tokens, cost = self._conn.execute(
+                f"SELECT COUNT(*), AVG(duration), AVG(tokens), AVG(cost) FROM "
+                f"(SELECT duration, tokens, cost FROM runs {where} ORDER BY id DESC LIMIT ?)",
+                (*params, self.window),
+            ).fetchone()
+            if count >= (MIN_CATEGORY_SAMPLES if where else 1):
+                return RunUsage(duration, int(tokens), cost)
+        return self.default
+
+    def close(self) -> None:
+        self._conn.close()
+
+
+@dataclass
+class Budget:
+    """单次运行的预算；各项为 0 表示不限。"""
+
+    seconds: float = 0.0  # 墙钟时间
+    tokens: int = 0
+    cost: float = 0.0
+
+    @classmethod
+    def from_config(cls, conf: Mapping) -> "Budget":
+        return cls(seconds=conf["wall_clock_minutes"] * 60, tokens=conf["tokens"], cost=conf["cost"])
+
+    def share(self, usage: RunUsage) -> float:
+        """占用最紧张那项预算的比例（主导资源份额）；未设预算时各话题相同，即退化为按热度排序。"""
+        shares = [
+            used / limit
+            for used, limit in ((usage.duration, self.seconds), (usage.tokens, self.tokens), (usage.cost, self.cost))
+            if limit
+        ]
+        return max(shares) if shares else 1.0
+
+    def fits(self, usage: RunUsage) -> bool:
+        return all(
+            not limit or used <= limit
+            for used, limit in ((usage.duration, self.seconds), (usage.tokens, self.tokens), (usage.cost, self.cost))
+        )
+
+
+@dataclass
+class BudgetReport:
+    budget: Budget
+    concurrency: int
+    planned: RunUsage = field(default_factory=RunUsage)  # 已准入话题的预估合计
+    used: RunUsage = field(default_factory=RunUsage)  # 实际合计，duration 为墙钟耗时
+    admitted: int = 0
+    deferred: int = 0
+
+    def as_dict(self) -> Dict:
+        return asdict(self)
+
+    def lines(self) -> List[str]:
+        rows = [
+            ("时间(s)", self.budget.seconds, self.planned.duration / self.concurrency, self.used.duration),
+            ("tokens", self.budget.tokens, self.planned.tokens, self.used.tokens),
+            ("费用", self.budget.cost, self.planned.cost, self.used.cost),
+        ]
+        return [
+            f"{name}: 预算 {limit if limit else '不限'}, 计划 {planned:.1f}, 实际 {used:.1f}"
+            for name, limit, planned, used in rows
+        ]
+
+
+class AdmissionController:
+    """
+    按“权重热度 / 预估成本”降序依次准入，放不进剩余预算的跳过，继续尝试更便宜的话题。
+
+    墙钟预算按并发折算：准入话题的预估耗时之和除以并发数不得超过 seconds。
+    """
+
+    def __init__(
+        self,
+        budget: Budget,
+        estimate: Callable[[Dict], RunUsage],
+        score: Callable[[Dict], float],
+        concurrency: int = 1,
+    ) -> None:
+        self.budget = budget
+        self.estimate = estimate
+        self.score = score
+        self.concurrency = max(1, concurrency)
+
+    def admit(self, topics: List[Dict], limit: int) -> Tuple[List[Dict], List[Dict], BudgetReport]:
+        """返回 (准入, 顺延, 报告)；准入话题保持原有的热度顺序。"""
+        report = BudgetReport(budget=self.budget, concurrency=self.concurrency)
+        estimates = [self.estimate(topic) for topic in topics]
+        # 同值按原顺序，保证结果确定
+        order = sorted(
+            range(len(topics)),
+            key=lambda idx: -self.score(topics[idx]) / max(self.budget.share(estimates[idx]), 1e-9),
+        )
+
+        admitted: List[int] = []
+        for idx in order:
+            if len(admitted) >= limit:
+                break
+            planned = report.planned + estimates[idx]
+            if not self.budget.fits(self._wall_clock(planned)):
+                continue
+            report.planned = planned
+            admitted.append(idx)
+
+        admitted_set = set(admitted)
+        accepted = [topic for idx, topic in enumerate(topics) if idx in admitted_set]
+        deferred = [topic for idx, topic in enumerate(topics) if idx not in admitted_set]
+        report.admitted, report.deferred = len(accepted), len(deferred)
+        return accepted, deferred, report
+
+    def _wall_clock(self, usage: RunUsage) -> RunUsage:
+        return RunUsage(usage.duration / self.concurrency, usage.tokens, usage.cost)
+
+
+class TopicBacklog:
+    """预算不足而顺延的话题，存为 JSON，下次运行与新话题一起参与准入；超过 keep_days 的丢弃。"""
+
+    def __init__(self, path: str, keep_days: int) -> None:
+        self.path = Path(path)
+        self.keep_days = keep_days
+
+    def load(self, today: Optional[date] = None) -> List[Dict]:
+        try:
+            entries = json.loads(self.path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return []
+        cutoff = ((today or date.today()) - timedelta(days=self.keep_days)).isoformat()
+        return [entry["topic"] for entry in entries if entry.get("queued_on", "") >= cutoff]
+
+    def save(self, topics: List[Dict], today: Optional[date] = None) -> None:
+        queued_on = (today or date.today()).isoformat()
+        previous = self._queued_dates()
+        entries = [
+            {"queued_on": previous.get(topic_fingerprint(topic), queued_on), "topic": topic} for topic in topics
+        ]
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.path.with_suffix(".tmp")
+        tmp_path.write_text(json.dumps(entries, ensure_ascii=False, indent=2, default=str), encoding="utf-8")
+        tmp_path.replace(self.path)
+
+    def _queued_dates(self) -> Mapping[str, str]:
+        """沿用已在队列中的话题的首次入队日期，避免反复顺延的话题永不过期。"""
+        try:
+            entries = json.loads(self.path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return {}
+        return {topic_fingerprint(entry["topic"]): entry["queued_on"] for entry in entries}
@@ -1,67 +1,195 @@
 """MetaGPT Deep Research 文章生成器。"""
 from __future__ import annotations
 
+import asyncio
 import re
+import time
+from contextlib import asynccontextmanager
 from datetime import datetime
-from typing import Dict, List
+from typing import Any, AsyncIterator, Dict, List, Optional, Tuple
+
+from backend.generators.admission import CostHistory, RunUsage
+from backend.generators.report_cache import ReportCache, report_key
+from backend.utils.config_loader import load_yaml_config
+from backend.utils.config_schema import DR_CONFIG_PATH
+from backend.utils.keywords import KeywordMatcher
 
 try:
+    from metagpt.config2 import config as metagpt_config
     from metagpt.environment.mgx.mgx_env import MGXEnv
     from metagpt.roles.dr.research_leader import Researcher
 except ImportError as exc:  # pragma: no cover - 环境缺模块时给出友好提示
     raise ImportError("请先安装 MetaGPT: pip install git+ssh://git@gitlab.deepwisdomai.com/pub/MetaGPT.git@dr4run") from exc
 
-TAG_KEYWORDS = {
-    "ai": "AI",
-    "gpt": "GPT",
-    "openai": "OpenAI",
-    "google": "Google",
-    "apple": "Apple",
-    "microsoft": "Microsoft",
-    "blockchain": "区块链",
-    "web3": "Web3",
-    "crypto": "加密货币",
-    "cloud": "云计算",
-    "database": "数据库",
-    "security": "安全",
-}
+# 标签 → 标题关键词；标签按声明顺序输出
+TAG_MATCHER = KeywordMatcher(
+    {
+        "AI": ["ai"],
+        "GPT": ["*gpt*"],
+        "OpenAI": ["openai"],
+        "Google": ["google"],
+        "Apple": ["apple"],
+        "Microsoft": ["microsoft"],
+        "区块链": ["blockchain*"],
+        "Web3": ["web3"],
+        "加密货币": ["crypto*"],
+        "云计算": ["cloud"],
+        "数据库": ["database*"],
+        "安全": ["security"],
+    }
+)
 EXCERPT_LENGTH = 150
 SLUG_MAX_LENGTH = 50
+# 参与报告缓存键的模型配置项（不含密钥）
+MODEL_CONFIG_FIELDS = ("api_type", "base_url", "model", "temperature", "max_token")
+
+RESEARCH_PROMPT_TEMPLATE = """
+深度研究主题：{title}
+
+研究要求：
+1. 生成一篇1000-1500字的深度分析文章
+2. 包含技术细节、行业影响、未来展望
+3. 引用权威数据源和最新信息
+4. 适合技术和运营团队阅读
+5. 结构清晰，论述有力
+
+参考来源：{url}{related}
+话题类别：{category}
+"""
+
+
+def _new_researcher() -> Researcher:
+    researcher = Researcher()
+    researcher.rc.env = MGXEnv()
+    return researcher
+
+
+class ResearcherPool:
+    """
+    隔离的 Researcher/MGXEnv 实例池。
+
+    Researcher 把报告写在自身 state 上，多个话题共用一个实例会互相覆盖，
+    因此每个话题独占一个实例：启动时预先创建 size 个，checkout() 借出、用完归还。
+    归还时清空记忆与上一份报告并换上新环境；运行出错的实例直接丢弃重建，避免残留状态带到下一个话题。
+    """
+
+    def __init__(self, size: int) -> None:
+        self.size = max(1, size)
+        self._idle: List[Researcher] = [_new_researcher() for _ in range(self.size)]
+        self._available: Optional[asyncio.Semaphore] = None
+
+    @asynccontextmanager
+    async def checkout(self) -> AsyncIterator[Researcher]:
+        if self._available is None:
+            # 信号量需在事件循环中创建
+            self._available = asyncio.Semaphore(len(self._idle))
+        async with self._available:
+            researcher = self._idle.pop()
+            try:
+                yield researcher
+            except BaseException:
+                researcher = _new_researcher()
+                raise
+            else:
+                self._reset(researcher)
+            finally:
+                self._idle.append(researcher)
+
+    @staticmethod
+    def _reset(researcher: Researcher) -> None:
+        researcher.rc.memory.clear()
+        researcher.rc.env = MGXEnv()
+        researcher.state.report_info = {}
 
 
 class DRGenerator:
-    """封装 MetaGPT Deep Research，直接生成可发布 Markdown。"""
+    """封装 MetaGPT Deep Research，直接生成可发布 Markdown；并发调用各自占用实例池中的一个 Researcher。"""
+
+    def __init__(self, pool_size: Optional[int] = None) -> None:
+        dr_conf = load_yaml_config(DR_CONFIG_PATH)
+        if pool_size is None:
+            pool_size = dr_conf["researcher_pool_size"]
+        self.pool = ResearcherPool(pool_size)
+        cache_conf = dr_conf["report_cache"]
+        self.cache: Optional[ReportCache] = ReportCache.from_config(cache_conf) if cache_conf["enabled"] else None
+        self.model_config = self._model_config()
+        budget_conf = dr_conf["budget"]
+        self.cost_history = CostHistory(
+            budget_conf["history_path"],
+            budget_conf["history_window"],
+            RunUsage(budget_conf["default_duration"], budget_conf["default_tokens"], budget_conf["default_cost"]),
+        )
+        # 本次运行实际产生的研究开销（缓存命中不计）
+        self.usage = RunUsage()
 
-    def __init__(self) -> None:
-        # 初始化 DR 角色与环境
-        self.researcher = Researcher()
-        self.researcher.rc.env = MGXEnv()
+    def estimate(self, topic: Dict) -> RunUsage:
+        """预估生成该话题的开销：已有缓存报告时为 0，否则按同类别历史均值。"""
+        if self.cache is not None and self.cache.contains(self._cache_key(topic)):
+            return RunUsage()
+        return self.cost_history.estimate(topic.get("category", "科技"))
 
     async def generate_article(self, topic: Dict) -> str:
-        """对单个话题生成深度文章。"""
+        """对单个话题生成深度文章；同一话题在缓存有效期内直接复用已有报告。"""
+        key = self._cache_key(topic)
+        report_content = self.cache.get(key) if self.cache is not None else None
+        if report_content is not None:
+            print(f"  → 命中报告缓存: {topic['title'][:50]}")
+            return self._format_article(report_content, topic)
+
         query = self._build_research_query(topic)
+        async with self.pool.checkout() as researcher:
+            print(f"  → 正在生成: {topic['title'][:50]}...")
+            start = time.monotonic()
+            tokens_before, cost_before = self._llm_totals(researcher)
+            try:
+                await researcher.run(with_message=query)
+                # 归还前取出报告，实例随后会被重置；本次运行未产出报告时报错，绝不沿用上一个话题的
+                report_content = researcher.state.report_info.get("report_content")
+                if not report_content:
+                    raise RuntimeError(f"DR 未产出报告: {topic['title'][:50]}")
+            finally:
+                # 失败的研究同样花了时间和 tokens，照样计入本次开销与历史估算
+                tokens_after, cost_after = self._llm_totals(researcher)
+                usage = RunUsage(time.monotonic() - start, tokens_after - tokens_before, cost_after - cost_before)
+                self.cost_history.record(topic.get("category", "科技"), usage)
+                self.usage += usage
+
+        if self.cache is not None:
+            self.cache.put(key, topic["title"], report_content)
+        return self._format_article(report_content, topic)
 
-        print(f"  → 正在生成: {topic['title'][:50]}...")
-        await self.researcher.run(with_message=query)
+    def close(self) -> None:
+        self.cost_history.close()
+        if self.cache is not None:
+            self.cache.close()
 
-        report_content = self.researcher.state.report_info["report_content"]
-        return self._format_article(report_content, topic)
+    def _cache_key(self, topic: Dict) -> str:
+        return report_key(topic, RESEARCH_PROMPT_TEMPLATE, self.model_config)
 
-    def _build_research_query(self, topic: Dict) -> str:
-        """根据话题构造 DR 提示。"""
-        return f"""
-深度研究主题：{topic['title']}
+    @staticmethod
+    def _llm_totals(researcher: Researcher) -> Tuple[int, float]:
+        """读取 LLM 成本统计的累计 tokens 与费用；未启用成本统计时为 0。"""
+        manager = getattr(getattr(researcher, "llm", None), "cost_manager", None)
+        if manager is None:
+            return 0, 0.0
+        tokens = getattr(manager, "total_prompt_tokens", 0) + getattr(manager, "total_completion_tokens", 0)
+        return tokens, float(getattr(manager, "total_cost", 0.0))
 
-研究要求：
-1. 生成一篇1000-1500字的深度分析文章
-2. 包含技术细节、行业影响、未来展望
-3. 引用权威数据源和最新信息
-4. 适合技术和运营团队阅读
-5. 结构清晰，论述有力
+    @staticmethod
+    def _model_config() -> Dict[str, Any]:
+        llm = metagpt_config.llm
+        return {name: getattr(llm, name, None) for name in MODEL_CONFIG_FIELDS}
 
-参考来源：{topic.get('url', '')}
-话题类别：{topic.get('category', '科技')}
-"""
+    def _build_research_query(self, topic: Dict) -> str:
+        """根据话题构造 DR 提示；同一故事的其他来源一并提供。"""
+        cluster = (topic.get("raw_data") or {}).get("cluster", [])
+        related = "".join(f"\n- [{member.get('source')}] {member.get('url', '')}" for member in cluster)
+        return RESEARCH_PROMPT_TEMPLATE.format(
+            title=topic["title"],
+            url=topic.get("url", ""),
+            related=related,
+            category=topic.get("category", "科技"),
+        )
 
     def _format_article(self, report: str, topic: Dict) -> str:
         """拼接 frontmatter 与正文。"""
@@ -106,9 +234,6 @@ class DRGenerator:
         if category:
             tags.append(category)
 
-        title_lower = topic.get("title", "").lower()
-        for keyword, tag in TAG_KEYWORDS.items():
-            if keyword in title_lower:
-                tags.append(tag)
+        tags.extend(TAG_MATCHER.matched_groups(topic.get("title", "")))
 
         return tags[:5]
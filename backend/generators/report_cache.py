@@ -0,0 +1,126 @@
+"""DR 报告的持久化缓存：同一话题、同一提示模板与模型配置下不重复研究。"""
+from __future__ import annotations
+
+import hashlib
+import json
+import sqlite3
+import time
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Any, Dict, Mapping, Optional
+
+from backend.utils.normalize import link_target, normalize_title
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS reports (
+    key TEXT PRIMARY KEY,
+    title TEXT NOT NULL,
+    report TEXT NOT NULL,
+    created_at REAL NOT NULL,
+    last_used REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS reports_last_used ON reports (last_used);
+"""
+
+
+def topic_fingerprint(topic: Mapping) -> str:
+    """规范化后的外链目标 + 规范化标题，同一故事的转载、讨论页得到相同指纹。"""
+    url = link_target(topic.get("url", ""), topic.get("raw_data"))
+    return f"{url}\n{normalize_title(topic.get('title', ''))}"
+
+
+def report_key(topic: Mapping, template: str, model_config: Mapping[str, Any]) -> str:
+    """话题指纹、提示模板哈希与模型配置共同决定缓存键，任一变化都视为新研究。"""
+    parts = {
+        "topic": topic_fingerprint(topic),
+        "template": hashlib.sha256(template.encode("utf-8")).hexdigest(),
+        "model": dict(model_config),
+    }
+    raw = json.dumps(parts, ensure_ascii=False, sort_keys=True, default=str)
+    return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+
+@dataclass
+class ReportCacheStats:
+    hits: int = 0
+    misses: int = 0
+    expired: int = 0
+    stores: int = 0
+    evictions: int = 0
+
+    def as_dict(self) -> Dict[str, int]:
+        return asdict(self)
+
+
+class ReportCache:
+    """
+    SQLite 持久化的报告缓存。
+
+    条目超过 ttl 秒即失效（读到或写入新条目时清理）；写入后若超过 max_entries，按最近使用时间淘汰最旧的。
+    """
+
+    def __init__(self, path: str, ttl: float, max_entries: int) -> None:
+        self.path = path
+        self.ttl = ttl
+        self.max_entries = max(1, max_entries)
+        self.stats = ReportCacheStats()
+        if path != ":memory:":
+            Path(path).parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(path)
+        self._conn.execute("PRAGMA journal_mode = WAL")
+        self._conn.executescript(SCHEMA)
+
+    @classmethod
+    def from_config(cls, conf: Mapping) -> "ReportCache":
+        return cls(path=conf["path"], ttl=conf["ttl_hours"] * 3600, max_entries=conf["max_entries"])
+
+    def get(self, key: str, now: Optional[float] = None) -> Optional[str]:
+        """命中返回报告正文并刷新最近使用时间；未命中或已过期返回 None。"""
+        now = time.time() if now is None else now
+        row = self._conn.execute("SELECT report, created_at FROM reports WHERE key = ?", (key,)).fetchone()
+        if row is None:
+            self.stats.misses += 1
+            return None
+
+        report, created_at = row
+        with self._conn:
+            if now - created_at > self.ttl:
+                self._conn.execute("DELETE FROM reports WHERE key = ?", (key,))
+                self.stats.expired += 1
+                self.stats.misses += 1
+                return None
+            self._conn.execute("UPDATE reports SET last_used = ? WHERE key = ?", (now, key))
+        self.stats.hits += 1
+        return report
+
+    def contains(self, key: str, now: Optional[float] = None) -> bool:
+        """是否有未过期的条目；只查询，不计入命中统计、不刷新使用时间。"""
+        now = time.time() if now is None else now
+        row = self._conn.execute("SELECT created_at FROM reports WHERE key = ?", (key,)).fetchone()
+        return row is not None and now - row[0] <= self.ttl
+
+    def put(self, key: str, title: str, report: str, now: Optional[float] = None) -> None:
+        now = time.time() if now is None else now
+        with self._conn:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO reports (key, title, report, created_at, last_used) VALUES (?, ?, ?, ?, ?)",
+                (key, title, report, now, now),
+            )
+            self.stats.stores += 1
+            self._evict(now)
+
+    def close(self) -> None:
+        self._conn.close()
+
+    def _evict(self, now: float) -> None:
+        expired = self._conn.execute("DELETE FROM reports WHERE created_at < ?", (now - self.ttl,)).rowcount
+        self.stats.expired += expired
+        (count,) = self._conn.execute("SELECT COUNT(*) FROM reports").fetchone()
+        excess = count - self.max_entries
+        if excess <= 0:
+            return
+        self._conn.execute(
+            "DELETE FROM reports WHERE key IN (SELECT key FROM reports ORDER BY last_used LIMIT ?)",
+            (excess,),
+        )
+        self.stats.evictions += excess
@@ -0,0 +1,180 @@
+"""DR 任务调度：固定数量的研究任务同时在途，任一完成立即补位，并按延迟与失败率调整并发。"""
+from __future__ import annotations
+
+import asyncio
+import statistics
+import time
+from collections import deque
+from dataclasses import asdict, dataclass, field
+from typing import Any, Awaitable, Callable, Deque, Dict, Generic, List, Optional, Set, Tuple, TypeVar
+
+T = TypeVar("T")
+
+DEFAULT_CONCURRENCY = 3
+DEFAULT_MIN_CONCURRENCY = 1
+DEFAULT_MAX_CONCURRENCY = 6
+DEFAULT_WINDOW = 4  # 每累计这么多次完成评估一次并发
+DEFAULT_LATENCY_TARGET = 120.0  # 秒，单篇研究耗时中位数超过即降并发
+DEFAULT_ERROR_THRESHOLD = 0.25  # 窗口内失败率超过即降并发
+
+
+@dataclass
+class TaskRecord(Generic[T]):
+    """单个话题的执行结果与耗时。"""
+
+    index: int  # 在输入中的位置
+    item: T
+    result: Any = None
+    error: Optional[BaseException] = None
+    queue_wait: float = 0.0  # 从入队到开始执行的秒数
+    duration: float = 0.0  # 执行耗时（秒）
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+
+@dataclass
+class SchedulerStats:
+    in_flight: int = 0
+    peak_in_flight: int = 0
+    completed: int = 0
+    failed: int = 0
+    concurrency: int = 0  # 当前并发上限
+    increases: int = 0
+    decreases: int = 0
+    total_queue_wait: float = 0.0
+    durations: List[float] = field(default_factory=list)
+
+    def as_dict(self) -> Dict[str, Any]:
+        return asdict(self)
+
+
+class AdaptiveScheduler:
+    """
+    工作队列式调度器：保持 concurrency 个任务在途，任一完成立即启动下一个，不等整批。
+
+    每累计 window 次完成做一次评估（加性增、乘性减）：失败率超过 error_threshold
+    或耗时中位数超过 latency_target 时并发减半，否则加一，始终限制在 [min, max] 内。
+    """
+
+    def __init__(
+        self,
+        concurrency: int = DEFAULT_CONCURRENCY,
+        min_concurrency: int = DEFAULT_MIN_CONCURRENCY,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+        window: int = DEFAULT_WINDOW,
+        latency_target: float = DEFAULT_LATENCY_TARGET,
+        error_threshold: float = DEFAULT_ERROR_THRESHOLD,
+    ) -> None:
+        self.min_concurrency = max(1, min_concurrency)
+        self.max_concurrency = max(self.min_concurrency, max_concurrency)
+        self.window = max(1, window)
+        self.latency_target = latency_target
+        self.error_threshold = error_threshold
+        self.stats = SchedulerStats(concurrency=self._clamp(concurrency))
+        self._samples: Deque[Tuple[float, bool]] = deque()
+
+    @classmethod
+    def from_config(cls, conf: Dict) -> "AdaptiveScheduler":
+        return cls(
+            concurrency=conf["initial"],
+            min_concurrency=conf["min"],
+            max_concurrency=conf["max"],
+            window=conf["window"],
+            latency_target=conf["latency_target"],
+            error_threshold=conf["error_threshold"],
+        )
+
+    @property
+    def concurrency(self) -> int:
+        return self.stats.concurrency
+
+    async def run(
+        self,
+        items: List[T],
+        job: Callable[[T], Awaitable[Any]],
+        on_done: Optional[Callable[[TaskRecord[T]], None]] = None,
+    ) -> List[TaskRecord[T]]:
+        """
+        对每个条目执行 job(item)，返回按输入顺序排列的执行记录。
+
+        job 抛出的异常记录在 TaskRecord.error 中，不会中断其余任务；on_done 在每个任务完成时回调，
+        其抛出的异常同样记入该任务的 error，不会取消仍在途的任务。
+        """
+        enqueued_at = time.monotonic()
+        queue: Deque[Tuple[int, T]] = deque(enumerate(items))
+        running: Set[asyncio.Future] = set()
+        records: List[TaskRecord[T]] = []
+
+        try:
+            while queue or running:
+                while queue and len(running) < self.concurrency:
+                    index, item = queue.popleft()
+                    running.add(asyncio.ensure_future(self._execute(index, item, job, enqueued_at)))
+                    self._set_in_flight(len(running))
+
+                done, running = await asyncio.wait(running, return_when=asyncio.FIRST_COMPLETED)
+                self._set_in_flight(len(running))
+                for task in done:
+                    record = task.result()
+                    records.append(record)
+                    self._observe(record)
+                    if on_done is not None:
+                        self._notify(on_done, record)
+        finally:
+            for task in running:
+                task.cancel()
+            if running:
+                await asyncio.gather(*running, return_exceptions=True)
+            self._set_in_flight(0)
+
+        records.sort(key=lambda record: record.index)
+        return records
+
+    async def _execute(self, index: int, item: T, job: Callable[[T], Awaitable[Any]], enqueued_at: float) -> TaskRecord[T]:
+        started = time.monotonic()
+        record = TaskRecord(index=index, item=item, queue_wait=started - enqueued_at)
+        try:
+            record.result = await job(item)
+        except Exception as exc:  # 单个话题失败不影响其余
+            record.error = exc
+        record.duration = time.monotonic() - started
+        return record
+
+    def _notify(self, on_done: Callable[[TaskRecord[T]], None], record: TaskRecord[T]) -> None:
+        try:
+            on_done(record)
+        except Exception as exc:  # 回调出错只影响该任务的结果
+            self.stats.failed += record.ok
+            record.error = exc
+
+    def _set_in_flight(self, count: int) -> None:
+        self.stats.in_flight = count
+        self.stats.peak_in_flight = max(self.stats.peak_in_flight, count)
+
+    def _observe(self, record: TaskRecord) -> None:
+        self.stats.completed += 1
+        self.stats.failed += not record.ok
+        self.stats.total_queue_wait += record.queue_wait
+        self.stats.durations.append(record.duration)
+
+        self._samples.append((record.duration, record.ok))
+        if len(self._samples) < self.window:
+            return
+        error_rate = sum(not ok for _, ok in self._samples) / len(self._samples)
+        median = statistics.median(duration for duration, _ in self._samples)
+        self._samples.clear()
+
+        if error_rate > self.error_threshold or median > self.latency_target:
+            target = self._clamp(self.concurrency // 2)
+            if target < self.concurrency:
+                self.stats.decreases += 1
+        else:
+            target = self._clamp(self.concurrency + 1)
+            if target > self.concurrency:
+                self.stats.increases += 1
+        self.stats.concurrency = target
+
+    def _clamp(self, value: int) -> int:
+        return min(self.max_concurrency, max(self.min_concurrency, value))
@@ -7,49 +7,104 @@ import asyncio
 import json
 import sys
 import os
+import shutil
+import textwrap
+import time
 from datetime import datetime
+from functools import cached_property
 from pathlib import Path
-from typing import Dict, List, Tuple
+from typing import TYPE_CHECKING, AsyncIterator, Dict, List, Optional, Set, TextIO, Tuple
 
 # 添加父目录到路径以便正确导入
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-import requests
+from backend.utils.config_loader import CONFIG_REGISTRY, load_yaml_config
+from backend.utils.config_schema import CRAWLER_CONFIG_PATH, DR_CONFIG_PATH
 
-from backend.crawlers.hackernews import HackerNewsCrawler
-from backend.crawlers.reddit import RedditCrawler
-from backend.crawlers.newsapi import NewsAPICrawler
-from backend.crawlers.github_trending import GitHubTrendingCrawler
-from backend.crawlers.mcp_trends import MCPTrendsCrawler
-from backend.generators.dr_generator import DRGenerator
-from backend.utils.config_loader import load_yaml_config
-from backend.utils.deduplicator import Deduplicator
-from backend.utils.filter import TrendingFilter
-from backend.utils.storage import GitStorage
+# 爬虫、DR 生成器与 Git 存储按命令延迟导入：crawl 不应为 MetaGPT/GitPython 付出导入开销或因其缺失而失败
+if TYPE_CHECKING:
+    from backend.crawlers.base_crawler import TrendItem
+    from backend.generators.admission import BudgetReport, TopicBacklog
+    from backend.generators.dr_generator import DRGenerator
+    from backend.utils.deduplicator import Deduplicator
+    from backend.utils.executor import StageExecutor
+    from backend.utils.filter import TrendingFilter
+    from backend.utils.storage import GitStorage
 
 RAW_DATA_DIR = Path("data/trending")
 PROCESSED_DATA_DIR = Path("data/processed")
 CONTENT_DIR = Path("content/blog")
 LOG_DIR = Path("logs")
 DEFAULT_COMMIT_PREFIX = "feat: add"  # 保持提交信息格式一致
+JSON_ITEM_INDENT = "    "  # payload["items"] 中单个条目的缩进
+RAW_FLUSH_ITEMS = 2000  # 原始条目缓冲上限，攒满一片再序列化落盘（大片交给进程池）
 
 
 class TrendForgePipeline:
     """主流程控制器。"""
 
     def __init__(self, use_mcp: bool = False, mcp_base: str | None = None) -> None:
-        dr_conf = load_yaml_config("backend/config/dr_config.yaml")
-        self.batch_size = dr_conf.get("batch_size", 3)
-        self.max_articles = dr_conf.get("max_articles_per_run", 10)
-
+        self._apply_dr_config(load_yaml_config(DR_CONFIG_PATH))
+        CONFIG_REGISTRY.subscribe(DR_CONFIG_PATH, self._apply_dr_config)
+
+        crawler_conf = load_yaml_config(CRAWLER_CONFIG_PATH)
+        crawl_conf = crawler_conf["crawl"]
+        self.global_crawl_timeout = crawl_conf["global_timeout"]
+        self.crawler_timeout = crawl_conf["crawler_timeout"]
+        self.crawler_timeouts: Dict[str, float] = crawl_conf["crawler_timeouts"]
+        # 最近一次抓取各爬虫的状态、耗时与条目数
+        self.crawl_report: Dict[str, Dict] = {}
+        # 最近一次准入的预算计划，DR 结束后补上实际开销
+        self.budget_report: Optional[BudgetReport] = None
+        # 顺延队列与本次未准入的话题，DR 结束后据此把失败话题放回队列
+        self.backlog: Optional[TopicBacklog] = None
+        self.deferred: List[TrendItem] = []
+
+        from backend.utils.executor import StageExecutor
+
+        # 去重、筛选与大 JSON 序列化等 CPU 密集阶段交给进程池，避免阻塞抓取与 DR 的 I/O
+        self.executor = StageExecutor.from_config(crawler_conf["executor"])
+
+        from backend.crawlers.http_client import HttpClient
+
+        # 所有爬虫共享同一连接池，管线结束时统一关闭
+        self.http = HttpClient()
         self.crawlers = self._init_crawlers(use_mcp, mcp_base)
-        self.filter = TrendingFilter()
-        self.deduplicator = Deduplicator()
-        self.dr_generator = DRGenerator()
-        self.storage = GitStorage()
+        for crawler in self.crawlers:
+            crawler.bind_http(self.http)
 
         self._ensure_directories()
 
+    def _apply_dr_config(self, dr_conf: Dict) -> None:
+        self.dr_concurrency = dr_conf["concurrency"]
+        self.dr_budget = dr_conf["budget"]
+        self.commit_interval = dr_conf["publish"]["commit_interval_seconds"]
+        self.max_articles = dr_conf["max_articles_per_run"]
+
+    @cached_property
+    def filter(self) -> TrendingFilter:
+        from backend.utils.filter import TrendingFilter
+
+        return TrendingFilter()
+
+    @cached_property
+    def deduplicator(self) -> Deduplicator:
+        from backend.utils.deduplicator import Deduplicator
+
+        return Deduplicator()
+
+    @cached_property
+    def dr_generator(self) -> DRGenerator:
+        from backend.generators.dr_generator import DRGenerator
+
+        return DRGenerator()
+
+    @cached_property
+    def storage(self) -> GitStorage:
+        from backend.utils.storage import GitStorage
+
+        return GitStorage()
+
     def _ensure_directories(self) -> None:
         """确保运行所需目录存在。"""
         for folder in [RAW_DATA_DIR, PROCESSED_DATA_DIR, CONTENT_DIR, LOG_DIR]:
@@ -61,10 +116,17 @@ class TrendForgePipeline:
 
         if use_mcp:
             if self._check_mcp_available(base):
+                from backend.crawlers.mcp_trends import MCPTrendsCrawler
+
                 print(f"   ✓ 使用 MCP Trends Hub: {base}")
                 return [MCPTrendsCrawler(base_url=base)]
             print("   ⚠️  MCP 未就绪，回退本地爬虫")
 
+        from backend.crawlers.github_trending import GitHubTrendingCrawler
+        from backend.crawlers.hackernews import HackerNewsCrawler
+        from backend.crawlers.newsapi import NewsAPICrawler
+        from backend.crawlers.reddit import RedditCrawler
+
         print("   ℹ️ 使用本地独立爬虫")
         return [
             HackerNewsCrawler(),
@@ -80,25 +142,29 @@ class TrendForgePipeline:
         print(f"TrendForge Daily Pipeline - {start_time:%Y-%m-%d %H:%M:%S}")
         print("=" * 60)
 
-        try:
-            print("📡 Step 1: Fetching trending topics...")
-            all_trending = await self._fetch_all_trending()
-            print(f"   ✓ Got {len(all_trending)} raw topics")
-
-            self._save_raw_trending(all_trending)
+        # 常驻进程中复用管线时，拾取上次运行后修改过的配置（订阅者会各自重建）
+        reloaded = CONFIG_REGISTRY.reload_if_changed()
+        if reloaded:
+            print(f"   ℹ️  已重新加载配置: {', '.join(reloaded)}")
 
-            print("\n🔍 Step 2: Deduplicating...")
-            unique_trending = self.deduplicator.deduplicate(all_trending)
-            print(f"   ✓ {len(unique_trending)} unique after dedup")
+        try:
+            # 抓取、去重与单条筛选流式进行：快的数据源先进入去重/筛选，不等慢源
+            print("📡 Step 1-2: Fetching & deduplicating trending topics (streaming)...")
+            raw_count, unique_trending, selected = await self._stream_and_screen()
+            print(f"   ✓ Got {raw_count} raw topics")
+            print(f"   ✓ {len(unique_trending)} story clusters after dedup")
+            self._print_crawl_report()
+            self._print_http_stats()
 
             print("\n🎯 Step 3: Filtering...")
-            selected = self.filter.filter_trending(unique_trending)
             if not selected:
                 print("   ⚠️  No topics passed filter today")
-                return
 
-            if len(selected) > self.max_articles:
-                selected = selected[: self.max_articles]
+            # 即使今天没有新话题入选，上次顺延的话题仍参与准入
+            selected = self._admit_topics(selected)
+            if not selected:
+                print("   ⚠️  No topics to generate within today's DR budget")
+                return
 
             for idx, topic in enumerate(selected, start=1):
                 title_preview = topic["title"][:60]
@@ -106,79 +172,336 @@ class TrendForgePipeline:
 
             self._save_processed_trending(selected)
 
-            print("\n📝 Step 4: Generating articles via DR...")
-            articles = await self._generate_articles(selected)
-            print(f"   ✓ Generated {len(articles)} articles")
-
-            print("\n💾 Step 5: Saving markdown files...")
-            saved_files = self._save_articles(articles)
-            print(f"   ✓ Saved {len(saved_files)} files")
+            # 每篇文章完成即写入 content/blog，开启定时提交时同时小批量发布
+            print("\n📝 Step 4: Generating & saving articles via DR...")
+            dr_start = time.monotonic()
+            saved_files, committed = await self._generate_articles(selected)
+            print(f"   ✓ Generated and saved {len(saved_files)} articles")
+            self._print_budget_report(time.monotonic() - dr_start)
 
-            print("\n📤 Step 6: Git commit & push...")
-            commit_msg = f"{DEFAULT_COMMIT_PREFIX} {len(articles)} new articles - {datetime.now():%Y-%m-%d}"
-            self.storage.commit_and_push(commit_msg)
+            print("\n📤 Step 5: Git commit & push...")
+            self.storage.commit_and_push(self._commit_message(len(saved_files) - committed))
 
             duration = (datetime.now() - start_time).total_seconds()
             print("\n" + "=" * 60)
             print("✅ Pipeline finished")
-            print(f"耗时: {duration:.1f}s, 文章数: {len(articles)}")
+            print(f"耗时: {duration:.1f}s, 文章数: {len(saved_files)}")
+            self._print_crawl_report()
             print("=" * 60)
         except Exception as exc:  # pragma: no cover - 运行时错误需直接暴露
             print(f"\n❌ Pipeline failed: {exc}")
             raise
+        finally:
+            await self.close()
+
+    async def close(self) -> None:
+        """释放管线持有的网络、进程池与本地索引资源。"""
+        await self.http.close()
+        self.executor.close()
+        if "deduplicator" in self.__dict__:
+            self.deduplicator.close()
+        if "dr_generator" in self.__dict__:
+            self.dr_generator.close()
+
+    def _print_http_stats(self) -> None:
+        """输出连接复用情况。"""
+        stats = self.http.stats
+        print(f"   ℹ️  HTTP: {stats.requests} 请求, 新建连接 {stats.created}, 复用连接 {stats.reused}")
+        retry = self.http.retry_stats
+        print(
+            f"   ℹ️  重试 {retry.retries}, 上游限流 {retry.throttles}, "
+            f"本地限速等待 {retry.limiter_waits}, 放弃 {retry.give_ups}"
+        )
+        if self.http.cache is not None:
+            cache = self.http.cache.stats
+            print(
+                f"   ℹ️  缓存: 新鲜命中 {cache.fresh_hits}, 304 复用 {cache.revalidated}, "
+                f"未命中 {cache.misses}, 淘汰 {cache.evictions}"
+            )
+
+    async def _fetch_all_trending(self) -> List[TrendItem]:
+        """并发执行所有爬虫，收集全部结果。"""
+        return [item async for item in self._stream_all_trending()]
+
+    async def _stream_all_trending(self) -> AsyncIterator[TrendItem]:
+        """
+        并发执行所有爬虫，合并各自的流，先到先出。
+
+        单个爬虫超过截止时间会被取消，其已产出的条目保留；抓取总时长超限时取消所有未完成的爬虫。
+        """
+        from backend.crawlers.base_crawler import TrendItem
+
+        queue: asyncio.Queue = asyncio.Queue()
+        finished = object()
+        self.crawl_report = {}
+
+        async def drain(crawler, record: Dict) -> None:
+            async for item in crawler.stream_trending():
+                record["items"] += 1
+                await queue.put(TrendItem.coerce(item))
+
+        async def pump(crawler, record: Dict) -> None:
+            start = time.monotonic()
+            try:
+                await asyncio.wait_for(drain(crawler, record), self._crawler_deadline(crawler))
+                record["status"] = "ok"
+            except asyncio.TimeoutError:
+                record["status"] = "timeout"
+            except asyncio.CancelledError:
+                record["status"] = "cut_off"
+                raise
+            except Exception as exc:  # pragma: no cover - 单个爬虫失败不影响其余
+                record["status"] = "error"
+                print(f"   ⚠️  Crawler {crawler.name} failed: {exc}")
+            finally:
+                record["duration"] = round(time.monotonic() - start, 2)
+                queue.put_nowait(finished)
+
+        tasks = []
+        for crawler in self.crawlers:
+            record = {"status": "running", "duration": 0.0, "items": 0}
+            self.crawl_report[crawler.name] = record
+            tasks.append(asyncio.ensure_future(pump(crawler, record)))
+
+        deadline = time.monotonic() + self.global_crawl_timeout
+        remaining = len(tasks)
+        try:
+            while remaining and time.monotonic() < deadline:
+                try:
+                    item = queue.get_nowait()
+                except asyncio.QueueEmpty:
+                    try:
+                        item = await asyncio.wait_for(queue.get(), deadline - time.monotonic())
+                    except asyncio.TimeoutError:
+                        break
+                if item is finished:
+                    remaining -= 1
+                    continue
+                yield item
+
+            if remaining:
+                print(f"   ⚠️  抓取总时长超过 {self.global_crawl_timeout}s，取消未完成的数据源")
+                for task in tasks:
+                    task.cancel()
+                await asyncio.gather(*tasks, return_exceptions=True)
+                # 截止前已入队的条目照常产出
+                while not queue.empty():
+                    item = queue.get_nowait()
+                    if item is not finished:
+                        yield item
+        finally:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+    def _crawler_deadline(self, crawler) -> float:
+        return self.crawler_timeouts.get(crawler.name, self.crawler_timeout)
+
+    def _print_crawl_report(self) -> None:
+        """输出各数据源耗时与状态，并列出被截断的数据源。"""
+        summary = " | ".join(
+            f"{name} {record['status']} {record['duration']:.1f}s/{record['items']}"
+            for name, record in self.crawl_report.items()
+        )
+        print(f"   ℹ️  数据源: {summary}")
+        cut_off = [name for name, record in self.crawl_report.items() if record["status"] in ("timeout", "cut_off")]
+        if cut_off:
+            print(f"   ⚠️  被截断的数据源: {', '.join(cut_off)}")
+
+    async def _stream_and_screen(self) -> Tuple[int, List[TrendItem], List[TrendItem]]:
+        """
+        边抓取边聚类、逐条筛选，返回 (原始条目数, 话题簇代表, 入选话题)。
+
+        原始条目边到边写入当日文件，不在内存中保留；入选话题由 Top-K 选择器产出，
+        按权重热度降序，截断到 daily_limit 与 max_articles_per_run 中较小者。
+        """
+        raw_writer = RawTrendingWriter(RAW_DATA_DIR / f"{datetime.now():%Y-%m-%d}.json", self.executor)
+        passed: Set[int] = set()
+        dedup_batch = self.deduplicator.new_batch()
+        start = time.monotonic()
+        now = datetime.now()
+
+        def screen(item: TrendItem) -> None:
+            if self.filter.accepts(item, now):
+                if not passed:
+                    print(f"   ℹ️  首个候选话题耗时 {time.monotonic() - start:.1f}s")
+                passed.add(id(item))
 
-    async def _fetch_all_trending(self) -> List[Dict]:
-        """并发执行所有爬虫。"""
-        tasks = [crawler.fetch_trending() for crawler in self.crawlers]
-        results = await asyncio.gather(*tasks, return_exceptions=True)
+        try:
+            async for item in self._stream_all_trending():
+                await raw_writer.add(item)
+                if dedup_batch.offer(item) and dedup_batch.streaming:
+                    screen(item)
+            await raw_writer.finish()
+        except BaseException:
+            raw_writer.abort()
+            raise
 
-        items: List[Dict] = []
-        for idx, result in enumerate(results):
-            if isinstance(result, Exception):
-                print(f"   ⚠️  Crawler {idx} failed: {result}")
-                continue
-            items.extend(result)
-        return items
+        job = dedup_batch.similarity_job()
+        similar = await self.executor.run(job[0], *job[1], size=len(job[1][0])) if job else None
+        unique = dedup_batch.finish(similar)
+
+        # 聚类汇总后代表条目的热度可能上升，tfidf 后端也要在此才能筛选；已通过的不再重复判定
+        pending = [item for item in unique if id(item) not in passed]
+        verdicts = dict(zip(map(id, pending), await self.executor.map_chunks(self.filter.accepts_many, pending, now)))
+        # 排序分要用汇总后的热度，因此在聚类完成后才送入选择器
+        selector = self.filter.new_selector(min(self.filter.daily_limit, self.max_articles))
+        selector.extend(item for item in unique if id(item) in passed or verdicts[id(item)])
+
+        stats = dedup_batch.stats
+        print(
+            f"   ℹ️  聚类: {len(unique)} 个话题簇, 精确合并 {stats['exact']}, "
+            f"近似合并 {stats['similar']}, 历史已处理 {stats['history']}"
+        )
+        print(f"   ℹ️  原始条目已写入 {raw_writer.path}")
+        return raw_writer.count, unique, selector.result()
 
     @staticmethod
     def _check_mcp_available(base_url: str) -> bool:
         """探测 MCP 服务健康接口。"""
+        import requests
+
         try:
             resp = requests.get(f"{base_url}/health", timeout=2)
             return resp.status_code == 200
         except Exception:
             return False
 
-    async def _generate_articles(self, topics: List[Dict]) -> List[Tuple[Dict, str]]:
-        """批量调用 DR，限制并发批次。"""
-        articles: List[Tuple[Dict, str]] = []
-        for start in range(0, len(topics), self.batch_size):
-            batch = topics[start : start + self.batch_size]
-            print(f"   → Batch {start // self.batch_size + 1} ({len(batch)} items)")
+    def _admit_topics(self, selected: List[TrendItem]) -> List[TrendItem]:
+        """
+        在本次运行的时间与用量预算内准入话题，上次顺延的话题一并参与。
+
+        按权重热度 / 预估开销择优，最多 max_articles_per_run 篇；放不下的写入顺延队列留待下次。
+        """
+        from backend.crawlers.base_crawler import TrendItem
+        from backend.generators.admission import AdmissionController, Budget, TopicBacklog
+        from backend.generators.report_cache import topic_fingerprint
+
+        backlog = TopicBacklog(self.dr_budget["backlog_path"], self.dr_budget["backlog_days"])
+        fresh = {topic_fingerprint(topic) for topic in selected}
+        queued = [TrendItem.coerce(topic) for topic in backlog.load() if topic_fingerprint(topic) not in fresh]
+        if queued:
+            print(f"   ℹ️  上次顺延的话题 {len(queued)} 个")
+
+        controller = AdmissionController(
+            Budget.from_config(self.dr_budget),
+            estimate=self.dr_generator.estimate,
+            score=self.filter.score,
+            concurrency=min(self.dr_concurrency["initial"], self.dr_generator.pool.size),
+        )
+        admitted, deferred, self.budget_report = controller.admit(selected + queued, self.max_articles)
+        # 准入的话题生成成功前仍留在队列中，研究中途崩溃时下次运行会再次参与准入
+        backlog.save([topic.to_dict() for topic in admitted + deferred])
+        self.backlog, self.deferred = backlog, deferred
+        if deferred:
+            print(f"   ⚠️  预算不足，顺延 {len(deferred)} 个话题到下次运行")
+        return admitted
+
+    def _settle_backlog(self, failed: List[TrendItem]) -> None:
+        """DR 结束后只把已生成的话题移出顺延队列，失败的留待下次重试（仍按首次入队日期过期）。"""
+        if self.backlog is None:
+            return
+        self.backlog.save([topic.to_dict() for topic in self.deferred + failed])
+        if failed:
+            print(f"   ℹ️  {len(failed)} 个失败话题放回顺延队列")
+
+    def _print_budget_report(self, wall_clock: float) -> None:
+        """对比本次 DR 的计划与实际开销。"""
+        from backend.generators.admission import RunUsage
+
+        if self.budget_report is None:
+            return
+        usage = self.dr_generator.usage
+        self.budget_report.used = RunUsage(wall_clock, usage.tokens, usage.cost)
+        print(f"   ℹ️  预算: 准入 {self.budget_report.admitted}, 顺延 {self.budget_report.deferred}")
+        for line in self.budget_report.lines():
+            print(f"   ℹ️  {line}")
+
+    async def _generate_articles(self, topics: List[Dict]) -> Tuple[List[str], int]:
+        """
+        调用 DR 生成文章：保持若干研究任务在途，任一完成立即开始下一个话题。
+
+        每篇完成即原子写入磁盘（中途崩溃不丢已完成的文章），内存中只保留文件路径；
+        返回 (已保存文件, 其中已被定时提交发布的篇数)。
+        """
+        from backend.generators.scheduler import AdaptiveScheduler
+
+        # 并发不能超过实例池，否则多出的任务只会在借实例时空等
+        max_concurrency = min(self.dr_concurrency["max"], self.dr_generator.pool.size)
+        scheduler = AdaptiveScheduler.from_config({**self.dr_concurrency, "max": max_concurrency})
+        print(f"   → {len(topics)} topics, initial concurrency {scheduler.concurrency}")
+
+        committer = None
+        if self.commit_interval > 0:
+            from backend.utils.storage import IncrementalCommitter
+
+            committer = IncrementalCommitter(self.storage, self.commit_interval, self._commit_message)
+            committer.start()
+
+        async def generate_and_save(topic: Dict) -> str:
+            content = await self.dr_generator.generate_article(topic)
+            # 写盘放到线程中，不阻塞其余研究任务；写入失败记为该话题失败，其余任务照常进行
+            return await asyncio.to_thread(self._save_article, topic, content)
+
+        def report(record) -> None:
+            title = record.item["title"][:50]
+            timing = f"排队 {record.queue_wait:.1f}s, 耗时 {record.duration:.1f}s"
+            if record.ok:
+                if committer is not None:
+                    committer.add(record.result)
+                print(f"   ✓ Done: {title} -> {record.result} ({timing})")
+            else:
+                print(f"   ⚠️  Fail: {title} -> {record.error} ({timing})")
+            print(f"   ℹ️  在途 {scheduler.stats.in_flight}, 并发上限 {scheduler.concurrency}")
 
-            tasks = [self.dr_generator.generate_article(topic) for topic in batch]
-            results = await asyncio.gather(*tasks, return_exceptions=True)
+        try:
+            records = await scheduler.run(topics, generate_and_save, on_done=report)
+        finally:
+            if committer is not None:
+                await committer.stop()
+        self._settle_backlog([record.item for record in records if not record.ok])
+        self._print_dr_stats(scheduler.stats)
+        cache = self.dr_generator.cache
+        if cache is not None:
+            stats = cache.stats
+            print(
+                f"   ℹ️  报告缓存: 命中 {stats.hits}, 未命中 {stats.misses}, "
+                f"过期 {stats.expired}, 淘汰 {stats.evictions}"
+            )
+        return [record.result for record in records if record.ok], committer.committed if committer else 0
 
-            for topic, result in zip(batch, results):
-                if isinstance(result, Exception):
-                    print(f"   ⚠️  Fail: {topic['title'][:50]} -> {result}")
-                    continue
-                articles.append((topic, result))
-                print(f"   ✓ Done: {topic['title'][:50]}")
-        return articles
+    @staticmethod
+    def _print_dr_stats(stats) -> None:
+        """输出 DR 调度概况：并发变化、排队与单篇耗时。"""
+        if not stats.completed:
+            return
+        durations = sorted(stats.durations)
+        print(
+            f"   ℹ️  DR 调度: 完成 {stats.completed}, 失败 {stats.failed}, 峰值在途 {stats.peak_in_flight}, "
+            f"最终并发 {stats.concurrency} (升 {stats.increases}/降 {stats.decreases})"
+        )
+        print(
+            f"   ℹ️  平均排队 {stats.total_queue_wait / stats.completed:.1f}s, "
+            f"单篇耗时 中位 {durations[len(durations) // 2]:.1f}s / 最长 {durations[-1]:.1f}s"
+        )
 
-    def _save_articles(self, articles: List[Tuple[Dict, str]]) -> List[str]:
-        """写入 Markdown 文件。"""
-        saved: List[str] = []
-        date_str = datetime.now().strftime("%Y-%m-%d")
+    def _save_article(self, topic: Dict, content: str) -> str:
+        """写入单篇 Markdown：先写临时文件再原子替换，站点构建与提交不会读到半截文件。"""
+        slug = self._generate_slug(topic["title"])
+        filepath = CONTENT_DIR / f"{datetime.now():%Y-%m-%d}-{slug}.md"
+        tmp_path = filepath.with_name(f".{filepath.name}.tmp")
+        try:
+            tmp_path.write_text(content, encoding="utf-8")
+            os.replace(tmp_path, filepath)
+        except BaseException:
+            # 写入失败不在 content/blog 中留下半截临时文件，避免被提交
+            tmp_path.unlink(missing_ok=True)
+            raise
+        return str(filepath)
 
-        for topic, content in articles:
-            slug = self._generate_slug(topic["title"])
-            filename = f"{date_str}-{slug}.md"
-            filepath = CONTENT_DIR / filename
-            filepath.write_text(content, encoding="utf-8")
-            saved.append(str(filepath))
-        return saved
+    @staticmethod
+    def _commit_message(count: int) -> str:
+        return f"{DEFAULT_COMMIT_PREFIX} {count} new articles - {datetime.now():%Y-%m-%d}"
 
     @staticmethod
     def _generate_slug(title: str) -> str:
@@ -189,33 +512,101 @@ class TrendForgePipeline:
         slug = re.sub(r"[-\s]+", "-", slug)
         return slug[:50]
 
-    def _save_raw_trending(self, items: List[Dict]) -> None:
-        """保存原始抓取结果，便于分析与回溯。"""
-        date_str = datetime.now().strftime("%Y-%m-%d")
-        payload = {
-            "date": date_str,
-            "timestamp": datetime.now().isoformat(),
-            "count": len(items),
-            "items": items,
-        }
-        (RAW_DATA_DIR / f"{date_str}.json").write_text(
-            json.dumps(payload, ensure_ascii=False, indent=2, default=str),
-            encoding="utf-8",
-        )
-
-    def _save_processed_trending(self, items: List[Dict]) -> None:
+    def _save_processed_trending(self, items: List[TrendItem]) -> None:
         """保存筛选后的结果。"""
         date_str = datetime.now().strftime("%Y-%m-%d")
         payload = {
             "date": date_str,
             "timestamp": datetime.now().isoformat(),
             "count": len(items),
-            "items": items,
+            "items": [item.to_dict() for item in items],
         }
         (PROCESSED_DATA_DIR / f"{date_str}.json").write_text(
             json.dumps(payload, ensure_ascii=False, indent=2, default=str),
             encoding="utf-8",
         )
+        # 增量更新去重历史索引，下次运行无需重新解析 processed 文件
+        self.deduplicator.record_history(item.title for item in items)
+
+
+def dump_json_items(items: List[Dict]) -> List[str]:
+    """把条目序列化为 indent=2 JSON 片段（已按 payload["items"] 的层级缩进）。"""
+    return [
+        textwrap.indent(json.dumps(item, ensure_ascii=False, indent=2, default=str), JSON_ITEM_INDENT)
+        for item in items
+    ]
+
+
+def join_json_items(header: Dict, fragments: List[str]) -> str:
+    """拼出与 json.dumps({**header, "items": [...]}, indent=2) 相同的文本。"""
+    items = "[\n" + ",\n".join(fragments) + "\n  ]" if fragments else "[]"
+    return f"{_json_items_prefix(header)}{items}\n}}"
+
+
+def _json_items_prefix(header: Dict) -> str:
+    head = json.dumps(header, ensure_ascii=False, indent=2, default=str)[: -len("\n}")]
+    return f'{head},\n  "items": '
+
+
+class RawTrendingWriter:
+    """
+    原始抓取结果的增量写入器，内存只保留一片缓冲。
+
+    条目片段先追加到旁路文件，finish() 时补上表头（count 需最后才知道）并原子替换目标文件，
+    产出的文本与一次性 join_json_items 完全相同；中途失败则 abort() 清理，不留下半截文件。
+    """
+
+    def __init__(self, path: Path, executor: StageExecutor, flush_items: int = RAW_FLUSH_ITEMS) -> None:
+        self.path = path
+        self.count = 0
+        self.executor = executor
+        self.flush_items = max(1, flush_items)
+        self._buffer: List[Dict] = []
+        self._items_path = path.with_name(f"{path.name}.items")
+        self._fp: Optional[TextIO] = self._items_path.open("w", encoding="utf-8")
+
+    async def add(self, item: TrendItem) -> None:
+        self._buffer.append(item.to_dict())
+        if len(self._buffer) >= self.flush_items:
+            await self.flush()
+
+    async def flush(self) -> None:
+        if not self._buffer:
+            return
+        buffer, self._buffer = self._buffer, []
+        fragments = await self.executor.map_chunks(dump_json_items, buffer)
+        for fragment in fragments:
+            self._fp.write(",\n" if self.count else "[\n")
+            self._fp.write(fragment)
+            self.count += 1
+
+    async def finish(self) -> None:
+        await self.flush()
+        self._fp.close()
+        self._fp = None
+        header = {
+            "date": datetime.now().strftime("%Y-%m-%d"),
+            "timestamp": datetime.now().isoformat(),
+            "count": self.count,
+        }
+        tmp_path = self.path.with_name(f"{self.path.name}.tmp")
+        with tmp_path.open("w", encoding="utf-8") as out:
+            out.write(_json_items_prefix(header))
+            if self.count:
+                with self._items_path.open("r", encoding="utf-8") as items:
+                    shutil.copyfileobj(items, out)
+                out.write("\n  ]")
+            else:
+                out.write("[]")
+            out.write("\n}")
+        os.replace(tmp_path, self.path)
+        self._items_path.unlink()
+
+    def abort(self) -> None:
+        if self._fp is not None:
+            self._fp.close()
+            self._fp = None
+        self._items_path.unlink(missing_ok=True)
 
 
 def main() -> None:
@@ -225,14 +616,16 @@ def main() -> None:
     parser.add_argument("--mcp-base", help="MCP 服务地址，默认 http://localhost:3001")
     args = parser.parse_args()
 
+    if args.command == "test":
+        print("暂无自动化测试，请手动执行 crawl/full 以验证。")
+        return
+
     pipeline = TrendForgePipeline(use_mcp=args.use_mcp, mcp_base=args.mcp_base)
 
     if args.command == "full":
         asyncio.run(pipeline.run_daily_pipeline())
     elif args.command == "crawl":
         asyncio.run(_run_crawl(pipeline))
-    elif args.command == "test":
-        print("暂无自动化测试，请手动执行 crawl/full 以验证。")
 
 
 def _format_preview(item: Dict) -> str:
@@ -243,8 +636,13 @@ def _format_preview(item: Dict) -> str:
 
 async def _run_crawl(pipeline: TrendForgePipeline) -> None:
     """只运行爬虫并打印部分结果。"""
-    items = await pipeline._fetch_all_trending()
+    try:
+        items = await pipeline._fetch_all_trending()
+    finally:
+        await pipeline.close()
     print(f"Fetched {len(items)} items")
+    pipeline._print_crawl_report()
+    pipeline._print_http_stats()
     for item in items[:5]:
         print("-", _format_preview(item))
 
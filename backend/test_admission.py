@@ -0,0 +1,161 @@
+#!/usr/bin/env python3
+"""
+DR 准入与顺延队列行为检查
+覆盖成本估算、预算内择优与顺延队列的保留期，不调用 DR，也不读写仓库内的数据目录
+"""
+
+import sys
+import tempfile
+from datetime import date, timedelta
+from pathlib import Path
+
+# 添加仓库根目录到Python路径
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from backend.generators.admission import AdmissionController, Budget, CostHistory, RunUsage, TopicBacklog
+
+
+def make_topic(title, category="AI", score=100):
+    return {
+        "title": title,
+        "url": f"https://example.com/{title}",
+        "source": "hackernews",
+        "category": category,
+        "engagement_score": score,
+    }
+
+
+def test_cost_history():
+    """同类别样本足够时用类别均值，不足时用全局均值，没有历史时用缺省值"""
+    print("\nTesting cost history...")
+    default = RunUsage(90, 5000, 1.0)
+    history = CostHistory(":memory:", window=3, default=default)
+    assert history.estimate("AI") == default
+
+    for duration in (10, 20, 30, 60):
+        history.record("AI", RunUsage(duration, 1000, 0.5))
+    history.record("云计算", RunUsage(30, 100, 0.1))
+
+    ai = history.estimate("AI")
+    assert ai.duration == (20 + 30 + 60) / 3, ai
+    # 全局均值同样只取最近 window 次
+    cloud = history.estimate("云计算")
+    assert (cloud.duration, cloud.tokens) == ((30 + 60 + 30) / 3, 700), cloud
+    print(f"✓ AI {ai.duration:.1f}s (window of 3), 云计算 falls back to global {cloud.duration:.1f}s")
+    history.close()
+
+
+def test_admit_within_budget():
+    """按热度/成本择优准入，放不下的跳过并继续尝试更便宜的话题，准入结果保持原顺序"""
+    print("\nTesting admission...")
+    costs = {"a": 1500, "b": 800, "c": 900, "d": 200}
+    topics = [make_topic("a", score=5000), make_topic("b", score=400), make_topic("c", score=300),
+              make_topic("d", score=100)]
+    controller = AdmissionController(
+        Budget(tokens=2000),
+        estimate=lambda topic: RunUsage(60, costs[topic["title"]], 0.0),
+        score=lambda topic: topic["engagement_score"],
+    )
+    admitted, deferred, report = controller.admit(topics, limit=10)
+
+    assert [topic["title"] for topic in admitted] == ["a", "d"], admitted
+    assert [topic["title"] for topic in deferred] == ["b", "c"], deferred
+    assert report.planned.tokens == 1700 and (report.admitted, report.deferred) == (2, 2), report
+
+    limited, rest, _ = controller.admit(topics, limit=1)
+    assert [topic["title"] for topic in limited] == ["a"] and len(rest) == 3
+    print(f"✓ Admitted {[t['title'] for t in admitted]}, deferred {[t['title'] for t in deferred]}")
+
+
+def test_wall_clock_concurrency():
+    """墙钟预算按并发折算：预估耗时之和除以并发数"""
+    print("\nTesting wall-clock budget...")
+    topics = [make_topic(str(idx), score=100 - idx) for idx in range(4)]
+
+    def admitted(concurrency):
+        controller = AdmissionController(
+            Budget(seconds=120),
+            estimate=lambda topic: RunUsage(60, 0, 0.0),
+            score=lambda topic: topic["engagement_score"],
+            concurrency=concurrency,
+        )
+        return len(controller.admit(topics, limit=10)[0])
+
+    assert admitted(1) == 2
+    assert admitted(2) == 4
+    print("✓ 2 topics at concurrency 1, 4 at concurrency 2")
+
+
+def test_backlog_round_trip():
+    """顺延队列保存后可读回，沿用首次入队日期，超过 keep_days 的丢弃"""
+    print("\nTesting backlog round trip...")
+    today = date(2026, 10, 18)
+    with tempfile.TemporaryDirectory() as tmp:
+        backlog = TopicBacklog(str(Path(tmp) / "backlog" / "topics.json"), keep_days=2)
+        assert backlog.load(today) == []
+
+        old, fresh = make_topic("old"), make_topic("fresh")
+        backlog.save([old], today - timedelta(days=3))
+        assert backlog.load(today - timedelta(days=1)) == [old]
+
+        # 再次顺延不会刷新入队日期，反复放不进预算的话题照样过期
+        backlog.save([old, fresh], today)
+        assert backlog.load(today) == [fresh], backlog.load(today)
+        assert backlog.load(today - timedelta(days=1)) == [old, fresh]
+        assert not list(Path(tmp, "backlog").glob("*.tmp"))
+
+    print(f"✓ Topics queued before {today - timedelta(days=2)} expire")
+
+
+def test_failed_topics_requeued():
+    """DR 结束后已生成的话题移出队列，失败的与未准入的留待下次"""
+    print("\nTesting backlog after DR...")
+    from backend.crawlers.base_crawler import TrendItem
+    from backend.pipeline import TrendForgePipeline
+
+    with tempfile.TemporaryDirectory() as tmp:
+        pipeline = TrendForgePipeline.__new__(TrendForgePipeline)
+        pipeline.backlog = TopicBacklog(str(Path(tmp) / "topics.json"), keep_days=2)
+        done, failed, deferred = (TrendItem.from_dict(make_topic(title)) for title in ("done", "failed", "deferred"))
+        # 准入时整批入队，研究中途崩溃也不会丢失
+        pipeline.backlog.save([topic.to_dict() for topic in (done, failed, deferred)])
+        pipeline.deferred = [deferred]
+
+        pipeline._settle_backlog([failed])
+        titles = [topic["title"] for topic in pipeline.backlog.load()]
+
+    assert titles == ["deferred", "failed"], titles
+    print(f"✓ Backlog after DR: {titles}")
+
+
+def main():
+    print("="*60)
+    print("DR Admission & Backlog Checks")
+    print("="*60)
+
+    tests = [
+        test_cost_history,
+        test_admit_within_budget,
+        test_wall_clock_concurrency,
+        test_backlog_round_trip,
+        test_failed_topics_requeued,
+    ]
+
+    failed = 0
+    for test in tests:
+        try:
+            test()
+        except Exception as e:
+            print(f"✗ {test.__name__} failed: {e!r}")
+            failed += 1
+
+    print("\n" + "="*60)
+    print(f"Passed: {len(tests) - failed}/{len(tests)}")
+    if failed:
+        print("⚠️ Some checks failed")
+        sys.exit(1)
+    print("✅ All checks passed!")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,151 @@
+#!/usr/bin/env python3
+"""
+配置注册表行为检查
+覆盖 mtime 缓存与热重载、弱引用订阅者与 schema 校验，只读写临时目录中的 YAML
+"""
+
+import gc
+import os
+import sys
+import tempfile
+from pathlib import Path
+
+# 添加仓库根目录到Python路径
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from backend.utils.config_loader import ConfigRegistry
+from backend.utils.config_schema import SCHEMAS, ConfigError, Field
+
+SCHEMA = {
+    "limit": Field(int, 10),
+    "http": {"timeout": Field(float, 5.0), "hosts": Field(list, [], item_type=str)},
+}
+
+
+def write_yaml(path, text, mtime_ns):
+    """写入并显式设置 mtime，避免文件系统时间精度导致两次写入 mtime 相同"""
+    path.write_text(text, encoding="utf-8")
+    os.utime(path, ns=(mtime_ns, mtime_ns))
+
+
+class Listener:
+    def __init__(self):
+        self.seen = []
+
+    def on_change(self, config):
+        self.seen.append(config["limit"])
+
+
+def test_mtime_cache():
+    """mtime 未变时返回同一份已解析配置，变了才重新解析"""
+    print("\nTesting mtime cache...")
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / "app.yaml"
+        write_yaml(path, "limit: 1\n", 1_000_000_000)
+        registry = ConfigRegistry()
+        registry.register_schema(str(path), SCHEMA)
+
+        first = registry.get(str(path))
+        assert registry.get(str(path)) is first
+        assert first["http"]["timeout"] == 5.0
+
+        write_yaml(path, "limit: 2\n", 2_000_000_000)
+        assert registry.get(str(path))["limit"] == 2
+        assert registry.reload_if_changed() == []
+
+        write_yaml(path, "limit: 3\n", 3_000_000_000)
+        assert registry.reload_if_changed() == [str(path)]
+        assert registry.get(str(path))["limit"] == 3
+    print("✓ Cached until mtime changes")
+
+
+def test_weak_subscribers():
+    """重新加载后通知订阅者；订阅对象释放后不再回调"""
+    print("\nTesting subscribers...")
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / "app.yaml"
+        write_yaml(path, "limit: 1\n", 1_000_000_000)
+        registry = ConfigRegistry()
+        registry.register_schema(str(path), SCHEMA)
+        registry.get(str(path))
+
+        kept, dropped = Listener(), Listener()
+        registry.subscribe(str(path), kept.on_change)
+        registry.subscribe(str(path), dropped.on_change)
+
+        write_yaml(path, "limit: 2\n", 2_000_000_000)
+        registry.reload_if_changed()
+        assert kept.seen == [2] and dropped.seen == [2]
+
+        del dropped
+        gc.collect()
+        write_yaml(path, "limit: 3\n", 3_000_000_000)
+        registry.reload_if_changed()
+        assert kept.seen == [2, 3]
+        assert len(registry._subscribers[str(path)]) == 1
+    print(f"✓ Live subscriber saw {kept.seen}, released one pruned")
+
+
+def test_schema_validation():
+    """缺失的键补齐缺省值，类型错误时报出文件与字段路径"""
+    print("\nTesting schema validation...")
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / "app.yaml"
+        registry = ConfigRegistry()
+        registry.register_schema(str(path), SCHEMA)
+        assert registry.get(str(path)) == {"limit": 10, "http": {"timeout": 5.0, "hosts": []}}
+
+        write_yaml(path, "http:\n  timeout: 3\n  hosts: [a, 1]\n", 1_000_000_000)
+        try:
+            registry.get(str(path))
+        except ConfigError as exc:
+            message = str(exc)
+        else:
+            raise AssertionError("expected ConfigError")
+        assert str(path) in message and "http.hosts" in message, message
+    print(f"✓ {message}")
+
+
+def test_repo_configs():
+    """仓库自带的配置文件都能通过各自的 schema"""
+    print("\nTesting bundled configs...")
+    root = Path(__file__).resolve().parents[1]
+    registry = ConfigRegistry()
+    for path, schema in SCHEMAS.items():
+        config_path = root / path
+        assert config_path.exists(), config_path
+        registry.register_schema(str(config_path), schema)
+        registry.get(str(config_path))
+    print(f"✓ {len(SCHEMAS)} config files validated")
+
+
+def main():
+    print("="*60)
+    print("Config Registry Checks")
+    print("="*60)
+
+    tests = [
+        test_mtime_cache,
+        test_weak_subscribers,
+        test_schema_validation,
+        test_repo_configs,
+    ]
+
+    failed = 0
+    for test in tests:
+        try:
+            test()
+        except Exception as e:
+            print(f"✗ {test.__name__} failed: {e!r}")
+            failed += 1
+
+    print("\n" + "="*60)
+    print(f"Passed: {len(tests) - failed}/{len(tests)}")
+    if failed:
+        print("⚠️ Some checks failed")
+        sys.exit(1)
+    print("✅ All checks passed!")
+
+
+if __name__ == "__main__":
+    main()
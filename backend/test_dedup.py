@@ -0,0 +1,208 @@
+#!/usr/bin/env python3
+"""
+去重与聚类行为检查
+覆盖多源合并、代表条目选择与历史保留期，不访问网络，也不读写仓库内的历史索引
+"""
+
+import os
+import sys
+import tempfile
+from datetime import date, timedelta
+from pathlib import Path
+
+# 添加仓库根目录到Python路径
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from backend.utils.dedup_history import DedupHistory
+from backend.utils.deduplicator import Deduplicator
+
+
+def new_deduplicator(backend="sequence"):
+    """在临时目录中按缺省配置创建去重器，历史索引换成内存库"""
+    cwd = os.getcwd()
+    with tempfile.TemporaryDirectory() as tmp:
+        os.chdir(tmp)
+        try:
+            deduplicator = Deduplicator()
+            deduplicator.close()
+        finally:
+            os.chdir(cwd)
+    deduplicator.history = DedupHistory(":memory:", deduplicator.new_index(), deduplicator.check_days)
+    if backend == "tfidf":
+        from backend.utils.tfidf import TfidfSimilarity
+
+        deduplicator.tfidf = TfidfSimilarity()
+    return deduplicator
+
+
+def make_item(title, source, url="", score=100, raw_data=None):
+    return {
+        "title": title,
+        "source": source,
+        "url": url,
+        "engagement_score": score,
+        "raw_data": raw_data if raw_data is not None else {},
+    }
+
+
+def story_items():
+    return [
+        make_item("OpenAI releases GPT-5", "reddit", "http://www.openai.com/blog/gpt-5/", 200),
+        make_item("Rust 2.0 announced", "newsapi", "https://rust-lang.org/2", 50),
+        make_item("OpenAI Releases GPT-5!", "hackernews", "https://openai.com/blog/gpt-5?utm_source=hn", 300),
+        make_item("GPT-5 is here", "github", "https://openai.com/blog/gpt-5#top", 10),
+    ]
+
+
+def test_exact_merge():
+    """规范化URL或归一化标题相同即并为一簇，热度合计到代表条目"""
+    print("\nTesting exact merge...")
+    batch = new_deduplicator().new_batch()
+    for item in story_items():
+        batch.offer(item)
+    unique = batch.finish()
+
+    assert len(unique) == 2, f"期望 2 个话题簇, 实际 {len(unique)}"
+    assert batch.stats["exact"] == 2, batch.stats
+    gpt = next(item for item in unique if "GPT" in item["title"])
+    assert gpt["engagement_score"] == 510, gpt["engagement_score"]
+    assert [member["source"] for member in gpt["raw_data"]["cluster"]] == ["github", "reddit"]
+    print(f"✓ {len(unique)} clusters, merged score {gpt['engagement_score']}, stats {batch.stats}")
+
+
+def test_representative_order():
+    """代表条目按来源优先级选出，与到达顺序无关"""
+    print("\nTesting representative selection...")
+    results = []
+    for items in (story_items(), list(reversed(story_items()))):
+        unique = new_deduplicator().deduplicate(items)
+        results.append(sorted((item["title"], item["source"], item["engagement_score"]) for item in unique))
+
+    assert results[0] == results[1], results
+    assert ("OpenAI Releases GPT-5!", "hackernews", 510) in results[0], results[0]
+    print(f"✓ Same representatives in both orders: {results[0]}")
+
+
+def test_link_target_merge():
+    """讨论页以外链目标参与URL匹配；通用参数名（如 ref）不被当作跟踪参数去掉"""
+    print("\nTesting link targets and query params...")
+    items = [
+        make_item(
+            "Show HN: a tiny database", "reddit", "https://www.reddit.com/r/programming/comments/abc/",
+            raw_data={"url": "https://example.com/tinydb", "is_self": False},
+        ),
+        make_item("TinyDB 1.0 released", "newsapi", "https://example.com/tinydb?fbclid=xyz"),
+        make_item("Repo at main", "github", "https://github.com/acme/tool?ref=main"),
+        make_item("Repo at dev", "github", "https://github.com/acme/tool?ref=dev"),
+    ]
+    unique = new_deduplicator().deduplicate(items)
+
+    assert len(unique) == 3, [item["title"] for item in unique]
+    print(f"✓ {len(unique)} clusters: {[item['title'] for item in unique]}")
+
+
+def test_similar_titles():
+    """标题近似的条目两种后端都会合并"""
+    print("\nTesting similar titles...")
+    backends = ["sequence"]
+    try:
+        import scipy  # noqa: F401
+
+        backends.append("tfidf")
+    except ImportError:
+        print("⚠ scipy not installed, skipping tfidf backend")
+
+    for backend in backends:
+        # 代表条目会被原地汇总，每个后端使用新的条目
+        items = [
+            make_item("OpenAI releases GPT-5 with better reasoning", "hackernews", "https://a.com/1", 100),
+            make_item("OpenAI releases GPT-5 with better reasoning skills", "reddit", "https://b.com/2", 40),
+            make_item("Apple unveils new MacBook Pro lineup", "newsapi", "https://c.com/3", 60),
+        ]
+        batch = new_deduplicator(backend).new_batch()
+        for item in items:
+            batch.offer(item)
+        unique = batch.finish()
+        assert len(unique) == 2, (backend, [item["title"] for item in unique])
+        assert batch.stats["similar"] == 1, (backend, batch.stats)
+        assert unique[0]["engagement_score"] == 140, (backend, unique[0]["engagement_score"])
+        print(f"✓ {backend}: {len(unique)} clusters, stats {batch.stats}")
+
+
+def test_history_cutoff():
+    """超过 check_days 的历史标题不再参与比对，并在 expire 时删除"""
+    print("\nTesting history cutoff...")
+    deduplicator = new_deduplicator()
+    history = DedupHistory(":memory:", deduplicator.new_index(), check_days=7)
+    today = date(2026, 10, 18)
+    history.add_dated(
+        [
+            ("Old story about chips", today - timedelta(days=8)),
+            ("Week old story about GPUs", today - timedelta(days=7)),
+            ("Fresh story about robots", today),
+        ]
+    )
+
+    def seen(title):
+        return title in history.candidates(deduplicator.hasher.signature(title), today)
+
+    assert not seen("Old story about chips")
+    assert seen("Week old story about GPUs")
+    assert list(history.recent_titles(today)) == ["Week old story about GPUs", "Fresh story about robots"]
+
+    # 再次出现的标题只刷新日期，不会回退
+    history.add_dated([("Fresh story about robots", today - timedelta(days=30))])
+    assert history.expire(today) == 1
+    assert len(history) == 2
+    print(f"✓ Cutoff {today - timedelta(days=7)} keeps {len(history)} titles")
+    history.close()
+
+
+def test_history_duplicate():
+    """已记录的标题在下一轮被判为历史重复"""
+    print("\nTesting history duplicates...")
+    deduplicator = new_deduplicator()
+    deduplicator.record_history(["NVIDIA announces new GPU architecture"])
+
+    batch = deduplicator.new_batch()
+    assert not batch.offer(make_item("NVIDIA announces new GPU architecture", "hackernews"))
+    assert batch.offer(make_item("Linux 7.0 released", "reddit"))
+    unique = batch.finish()
+
+    assert [item["title"] for item in unique] == ["Linux 7.0 released"]
+    assert batch.stats["history"] == 1, batch.stats
+    print(f"✓ History duplicate dropped, stats {batch.stats}")
+
+
+def main():
+    print("="*60)
+    print("Dedup & Clustering Checks")
+    print("="*60)
+
+    tests = [
+        test_exact_merge,
+        test_representative_order,
+        test_link_target_merge,
+        test_similar_titles,
+        test_history_cutoff,
+        test_history_duplicate,
+    ]
+
+    failed = 0
+    for test in tests:
+        try:
+            test()
+        except Exception as e:
+            print(f"✗ {test.__name__} failed: {e!r}")
+            failed += 1
+
+    print("\n" + "="*60)
+    print(f"Passed: {len(tests) - failed}/{len(tests)}")
+    if failed:
+        print("⚠️ Some checks failed")
+        sys.exit(1)
+    print("✅ All checks passed!")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,168 @@
+#!/usr/bin/env python3
+"""
+HackerNews 增量存储行为检查
+覆盖分档刷新、只更新易变字段、日志回放与压缩，不访问 HN API
+"""
+
+import asyncio
+import json
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+# 添加仓库根目录到Python路径
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from backend.crawlers.hackernews import HackerNewsCrawler
+from backend.crawlers.hn_item_store import DEFAULT_REFRESH_INTERVAL, HNItemStore
+
+# flush 自动压缩按当前时间判断保留期，故事时间以当前时间为基准
+NOW = time.time()
+HOUR = 3600
+
+
+def make_story(story_id, age, score=10, title=None):
+    return {
+        "id": story_id,
+        "title": title or f"Story {story_id}",
+        "url": f"https://example.com/{story_id}",
+        "time": NOW - age,
+        "score": score,
+        "descendants": 1,
+        "kids": list(range(50)),
+    }
+
+
+def test_refresh_tiers():
+    """故事越老刷新间隔越长，到期才需要重新拉取"""
+    print("\nTesting refresh tiers...")
+    intervals = [HNItemStore.refresh_interval(NOW - age, NOW) for age in (HOUR, 12 * HOUR, 48 * HOUR, 96 * HOUR)]
+    assert intervals == [5 * 60, 30 * 60, 3 * HOUR, DEFAULT_REFRESH_INTERVAL], intervals
+
+    with tempfile.TemporaryDirectory() as tmp:
+        store = HNItemStore(str(Path(tmp) / "items.jsonl"))
+        assert store.needs_refresh(1, NOW)
+        store.put(make_story(1, age=HOUR), now=NOW)
+        assert not store.needs_refresh(1, NOW + 5 * 60 - 1)
+        assert store.needs_refresh(1, NOW + 5 * 60)
+    print(f"✓ Intervals {intervals}")
+
+
+def test_volatile_update():
+    """刷新只更新 score/descendants，其余字段沿用；评论 ID 列表不落盘"""
+    print("\nTesting volatile update...")
+    with tempfile.TemporaryDirectory() as tmp:
+        store = HNItemStore(str(Path(tmp) / "items.jsonl"))
+        stored = store.put(make_story(1, age=HOUR), now=NOW)
+        assert "kids" not in stored
+
+        refreshed = make_story(1, age=HOUR, score=99, title="Edited title")
+        refreshed["descendants"] = None
+        item = store.update_volatile(1, refreshed, now=NOW + 600)
+        assert (item["score"], item["descendants"], item["title"]) == (99, 1, "Story 1"), item
+        assert not store.needs_refresh(1, NOW + 600)
+    print(f"✓ Score {item['score']}, title kept: {item['title']}")
+
+
+def test_log_replay_and_compaction():
+    """重新打开时回放日志并跳过损坏行；日志过长时压缩为每个 ID 一行并丢弃过期故事"""
+    print("\nTesting replay and compaction...")
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / "items.jsonl"
+        store = HNItemStore(str(path), retention_days=7)
+        store.put(make_story(1, age=HOUR), now=NOW)
+        store.put(make_story(2, age=8 * 24 * HOUR), now=NOW)
+        store.flush()
+        store.update_volatile(1, {"score": 50}, now=NOW + 600)
+        store.flush()
+        with path.open("a", encoding="utf-8") as fp:
+            fp.write("{not json\n")
+
+        reopened = HNItemStore(str(path), retention_days=7)
+        assert reopened.get(1)["score"] == 50
+        assert reopened.get(2) is not None
+
+        reopened.compact(now=NOW)
+        lines = [json.loads(line) for line in path.read_text(encoding="utf-8").splitlines()]
+        assert [line["id"] for line in lines] == [1], lines
+        assert reopened.get(2) is None
+        assert not list(Path(tmp).glob("*.tmp"))
+
+        # 追加的行数超过存活条目数的 COMPACT_RATIO 倍时 flush 自动压缩
+        for offset in range(3):
+            reopened.update_volatile(1, {"score": 60 + offset}, now=NOW + offset)
+        reopened.flush()
+        assert len(path.read_text(encoding="utf-8").splitlines()) == 1
+    print("✓ Replayed log, compacted to 1 line")
+
+
+class FakeHttp:
+    """记录请求的假客户端，按 URL 中的 ID 返回 item"""
+
+    def __init__(self, stories):
+        self.stories = stories
+        self.urls = []
+
+    async def get_json(self, url, **kwargs):
+        self.urls.append(url)
+        story_id = int(url.rsplit("/", 1)[-1].split(".")[0])
+        return dict(self.stories[story_id])
+
+
+def test_crawler_uses_store():
+    """未到期的故事不发请求；到期的只发一次 item 请求并更新热度；新故事整条入库"""
+    print("\nTesting crawler refresh path...")
+    with tempfile.TemporaryDirectory() as tmp:
+        crawler = HackerNewsCrawler()
+        crawler.item_store = HNItemStore(str(Path(tmp) / "items.jsonl"))
+        crawler.item_store.put(make_story(1, age=HOUR), now=NOW - 60)
+        crawler.item_store.put(make_story(2, age=HOUR), now=NOW - 600)
+        http = FakeHttp({
+            1: make_story(1, age=HOUR, score=20),
+            2: make_story(2, age=HOUR, score=30),
+            3: make_story(3, age=HOUR, score=40),
+        })
+
+        async def load_all():
+            semaphore = asyncio.Semaphore(2)
+            return [await crawler._load_item(http, semaphore, story_id, NOW) for story_id in (1, 2, 3)]
+
+        items = asyncio.run(load_all())
+
+    assert [item["score"] for item in items] == [10, 30, 40], items
+    assert [url.rsplit("/", 1)[-1] for url in http.urls] == ["2.json", "3.json"], http.urls
+    assert crawler.store_stats == {"skipped": 1, "refreshed": 1, "fetched": 1}, crawler.store_stats
+    print(f"✓ Store stats {crawler.store_stats}")
+
+
+def main():
+    print("="*60)
+    print("HackerNews Item Store Checks")
+    print("="*60)
+
+    tests = [
+        test_refresh_tiers,
+        test_volatile_update,
+        test_log_replay_and_compaction,
+        test_crawler_uses_store,
+    ]
+
+    failed = 0
+    for test in tests:
+        try:
+            test()
+        except Exception as e:
+            print(f"✗ {test.__name__} failed: {e!r}")
+            failed += 1
+
+    print("\n" + "="*60)
+    print(f"Passed: {len(tests) - failed}/{len(tests)}")
+    if failed:
+        print("⚠️ Some checks failed")
+        sys.exit(1)
+    print("✅ All checks passed!")
+
+
+if __name__ == "__main__":
+    main()
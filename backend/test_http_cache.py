@@ -0,0 +1,137 @@
+#!/usr/bin/env python3
+"""
+爬虫响应缓存行为检查
+在本机启动一个临时 HTTP 服务，覆盖条件请求 304、no-store、max-age 与容量淘汰，不访问外网
+"""
+
+import asyncio
+import os
+import sys
+import tempfile
+from pathlib import Path
+
+# 添加仓库根目录到Python路径
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from aiohttp import web
+
+from backend.crawlers.http_cache import ResponseCache
+from backend.crawlers.http_client import HttpClient
+
+
+async def serve(handler):
+    """在随机端口启动服务，返回 (runner, 基础URL)"""
+    app = web.Application()
+    app.router.add_get("/{name}", handler)
+    runner = web.AppRunner(app)
+    await runner.setup()
+    site = web.TCPSite(runner, "127.0.0.1", 0)
+    await site.start()
+    host, port = runner.addresses[0][:2]
+    return runner, f"http://{host}:{port}"
+
+
+async def fetch_three_times(cache_dir):
+    """每个路径请求三次，返回 (各路径的服务端请求记录, 每次拿到的版本, 缓存统计)"""
+    requests = {}
+    version = {"n": 1}
+
+    async def handler(request):
+        name = request.match_info["name"]
+        requests.setdefault(name, []).append(request.headers.get("If-None-Match"))
+        if name == "etag":
+            if request.headers.get("If-None-Match") == '"v1"':
+                return web.Response(status=304, headers={"ETag": '"v1"'})
+            return web.json_response({"v": version["n"]}, headers={"ETag": '"v1"'})
+        if name == "max-age":
+            return web.json_response({"v": version["n"]}, headers={"Cache-Control": "public, max-age=60"})
+        return web.json_response({"v": version["n"]}, headers={"Cache-Control": "no-store"})
+
+    runner, base = await serve(handler)
+    client = HttpClient({"cache": {"enabled": True, "dir": cache_dir}})
+    seen = {}
+    try:
+        for _ in range(3):
+            for name in ("etag", "max-age", "no-store"):
+                payload = await client.get_json(f"{base}/{name}", cacheable=True)
+                seen.setdefault(name, []).append(payload["v"])
+            version["n"] += 1
+    finally:
+        await client.close()
+        await runner.cleanup()
+    return requests, seen, client.cache.stats
+
+
+def test_conditional_requests():
+    """带 ETag 的响应每次走条件请求，304 时复用已缓存的内容"""
+    print("\nTesting 304 revalidation...")
+    with tempfile.TemporaryDirectory() as tmp:
+        requests, seen, stats = asyncio.run(fetch_three_times(tmp))
+
+    assert requests["etag"] == [None, '"v1"', '"v1"'], requests["etag"]
+    assert seen["etag"] == [1, 1, 1], seen["etag"]
+    assert stats.revalidated == 2, stats
+    print(f"✓ ETag sent on repeat requests, stats {stats.as_dict()}")
+
+
+def test_max_age_and_no_store():
+    """max-age 内不发请求；no-store 的响应从不缓存"""
+    print("\nTesting max-age and no-store...")
+    with tempfile.TemporaryDirectory() as tmp:
+        requests, seen, stats = asyncio.run(fetch_three_times(tmp))
+        cached = len(list(Path(tmp).glob("*.json")))
+
+    assert len(requests["max-age"]) == 1 and seen["max-age"] == [1, 1, 1], (requests, seen)
+    assert len(requests["no-store"]) == 3 and seen["no-store"] == [1, 2, 3], (requests, seen)
+    assert stats.fresh_hits == 2, stats
+    assert cached == 2, cached
+    print(f"✓ max-age served from cache, no-store fetched every time ({cached} files cached)")
+
+
+def test_eviction():
+    """超过条目上限时淘汰最久未使用的文件，读取会刷新使用时间"""
+    print("\nTesting eviction...")
+    with tempfile.TemporaryDirectory() as tmp:
+        cache = ResponseCache(tmp, max_entries=2)
+        headers = {"Cache-Control": "max-age=60"}
+        for idx, name in enumerate(("a", "b")):
+            cache.store(name, name, headers, {"v": name})
+            os.utime(Path(tmp, f"{name}.json"), (idx, idx))
+        assert cache.get("a") is not None
+
+        cache.store("c", "c", headers, {"v": "c"})
+        assert sorted(path.stem for path in Path(tmp).glob("*.json")) == ["a", "c"]
+        assert cache.stats.evictions == 1, cache.stats
+        assert not list(Path(tmp).glob("*.tmp"))
+    print("✓ Least recently used entry evicted")
+
+
+def main():
+    print("="*60)
+    print("HTTP Response Cache Checks")
+    print("="*60)
+
+    tests = [
+        test_conditional_requests,
+        test_max_age_and_no_store,
+        test_eviction,
+    ]
+
+    failed = 0
+    for test in tests:
+        try:
+            test()
+        except Exception as e:
+            print(f"✗ {test.__name__} failed: {e!r}")
+            failed += 1
+
+    print("\n" + "="*60)
+    print(f"Passed: {len(tests) - failed}/{len(tests)}")
+    if failed:
+        print("⚠️ Some checks failed")
+        sys.exit(1)
+    print("✅ All checks passed!")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,123 @@
+#!/usr/bin/env python3
+"""
+关键词匹配行为检查
+覆盖单词边界、* 通配与各爬虫的分类规则，不访问网络
+"""
+
+import sys
+from pathlib import Path
+
+# 添加仓库根目录到Python路径
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from backend.utils.keywords import KeywordMatcher
+
+
+def check(matcher, text, expected):
+    """断言命中的分组并打印结果"""
+    groups = matcher.matched_groups(text)
+    assert groups == expected, f"{text!r}: 期望 {expected}, 实际 {groups}"
+    print(f"✓ {text!r} -> {groups}")
+
+
+def test_word_boundary():
+    """纯ASCII关键词要求两侧为单词边界"""
+    print("\nTesting word boundary...")
+    matcher = KeywordMatcher({"AI": ["ai"], "云计算": ["cloud"]})
+
+    check(matcher, "He said the email was fine", [])
+    check(matcher, "Chainsaw review", [])
+    check(matcher, "AI startup raises funding", ["AI"])
+    check(matcher, "AI-powered search", ["AI"])
+    check(matcher, "New model (AI) beats humans", ["AI"])
+    check(matcher, "Cloudflare outage", [])
+    check(matcher, "Cloud costs are rising for AI", ["AI", "云计算"])
+
+    # 关闭边界后退回子串匹配
+    loose = KeywordMatcher({"AI": ["ai"]}, word_boundary=False)
+    check(loose, "He said the email was fine", ["AI"])
+
+
+def test_wildcards():
+    """关键词首尾的 * 放开对应一侧的边界"""
+    print("\nTesting wildcards...")
+    matcher = KeywordMatcher({"GPT": ["*gpt*"], "安全": ["hack*", "*security"], "加密货币": ["crypto*"]})
+
+    check(matcher, "ChatGPT-5 launch", ["GPT"])
+    check(matcher, "GPTs store opens", ["GPT"])
+    check(matcher, "Hacker finds bug in router", ["安全"])
+    check(matcher, "Cybersecurity firm raises 50M", ["安全"])
+    check(matcher, "Cryptography basics", ["加密货币"])
+    check(matcher, "Shacks by the lake", [])
+    check(matcher, "Security theater", ["安全"])
+    check(matcher, "Securityholders meeting", [])
+
+
+def test_non_ascii():
+    """中文关键词不做边界判断"""
+    print("\nTesting non-ASCII keywords...")
+    matcher = KeywordMatcher({"AI": ["人工智能"], "安全": ["漏洞"]})
+
+    check(matcher, "国产人工智能芯片发布", ["AI"])
+    check(matcher, "某系统曝出高危漏洞", ["安全"])
+    check(matcher, "今日天气晴", [])
+
+
+def test_crawler_categories():
+    """各爬虫的安全类与原有子串规则一致：只有 HN 匹配 hack，security 可出现在词中"""
+    print("\nTesting crawler categories...")
+    from backend.crawlers.hackernews import CATEGORY_MATCHER as HN_MATCHER
+    from backend.crawlers.newsapi import CATEGORY_MATCHER as NEWSAPI_MATCHER
+    from backend.crawlers.reddit import CATEGORY_MATCHER as REDDIT_MATCHER
+    from backend.crawlers.mcp_trends import CATEGORY_MATCHER as MCP_MATCHER
+
+    shared = [
+        ("Cybersecurity firm raises 50M", "安全"),
+        ("He said the email was fine", "科技"),
+        ("ChatGPT plugins are back", "AI"),
+    ]
+    not_security = ("Hacking the Xbox", "科技")
+    breach = ("Data breach hits retailer", "安全")
+    cases = {
+        "hackernews": (HN_MATCHER, [("Hacking the Xbox", "安全"), ("Data breach hits retailer", "科技")]),
+        "reddit": (REDDIT_MATCHER, [not_security, breach, ("New vulnerabilities in OpenSSH", "安全")]),
+        "newsapi": (NEWSAPI_MATCHER, [not_security, breach, ("Ransomware attacks rise", "安全")]),
+        "mcp": (MCP_MATCHER, [not_security, breach, ("某系统曝出高危漏洞", "安全")]),
+    }
+    for name, (matcher, expectations) in cases.items():
+        for title, expected in shared + expectations:
+            category = matcher.first_group(title, "科技")
+            assert category == expected, f"{name} {title!r}: 期望 {expected}, 实际 {category}"
+        print(f"✓ {name}: {len(shared) + len(expectations)} titles categorized as expected")
+
+
+def main():
+    print("="*60)
+    print("Keyword Matcher Checks")
+    print("="*60)
+
+    tests = [
+        test_word_boundary,
+        test_wildcards,
+        test_non_ascii,
+        test_crawler_categories,
+    ]
+
+    failed = 0
+    for test in tests:
+        try:
+            test()
+        except Exception as e:
+            print(f"✗ {test.__name__} failed: {e}")
+            failed += 1
+
+    print("\n" + "="*60)
+    print(f"Passed: {len(tests) - failed}/{len(tests)}")
+    if failed:
+        print("⚠️ Some checks failed")
+        sys.exit(1)
+    print("✅ All checks passed!")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,109 @@
+#!/usr/bin/env python3
+"""
+DR 报告缓存行为检查
+覆盖缓存键构成、过期与按最近使用淘汰，使用内存 SQLite，不调用 DR
+"""
+
+import sys
+from pathlib import Path
+
+# 添加仓库根目录到Python路径
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from backend.generators.report_cache import ReportCache, report_key
+
+TEMPLATE = "请围绕「{title}」撰写深度研究报告"
+MODEL = {"model": "gpt-4o", "temperature": 0.2}
+
+
+def make_topic(title, url="https://example.com/story", raw_data=None):
+    return {"title": title, "url": url, "raw_data": raw_data or {}}
+
+
+def test_key_components():
+    """同一故事的转载与讨论页共用缓存键；模板或模型配置变化即换键"""
+    print("\nTesting cache keys...")
+    key = report_key(make_topic("OpenAI releases GPT-5"), TEMPLATE, MODEL)
+
+    repost = make_topic("OpenAI Releases GPT-5!", "https://www.example.com/story?utm_source=hn")
+    discussion = make_topic(
+        "OpenAI releases GPT-5", "https://news.ycombinator.com/item?id=1",
+        raw_data={"url": "https://example.com/story"},
+    )
+    assert report_key(repost, TEMPLATE, MODEL) == key
+    assert report_key(discussion, TEMPLATE, MODEL) == key
+
+    topic = make_topic("OpenAI releases GPT-5")
+    assert report_key(topic, TEMPLATE + "，不少于三千字", MODEL) != key
+    assert report_key(topic, TEMPLATE, {**MODEL, "model": "gpt-4o-mini"}) != key
+    assert report_key(topic, TEMPLATE, {**MODEL, "temperature": 0.7}) != key
+    assert report_key(make_topic("Anthropic releases a new model"), TEMPLATE, MODEL) != key
+    print("✓ Reposts share a key; template, model and topic changes do not")
+
+
+def test_ttl():
+    """超过 ttl 的条目读取时视为未命中并删除"""
+    print("\nTesting TTL...")
+    cache = ReportCache(":memory:", ttl=3600, max_entries=10)
+    cache.put("k", "title", "report", now=1000)
+
+    assert cache.contains("k", now=1000 + 3600)
+    assert cache.get("k", now=1000 + 3600) == "report"
+    assert not cache.contains("k", now=1000 + 3601)
+    assert cache.get("k", now=1000 + 3601) is None
+    assert cache.get("k", now=1000) is None
+    assert (cache.stats.hits, cache.stats.expired, cache.stats.misses) == (1, 1, 2), cache.stats
+    print(f"✓ Expired after ttl, stats {cache.stats.as_dict()}")
+    cache.close()
+
+
+def test_lru_eviction():
+    """超过 max_entries 时淘汰最久未使用的条目，读取会刷新使用时间"""
+    print("\nTesting LRU eviction...")
+    cache = ReportCache(":memory:", ttl=3600, max_entries=2)
+    cache.put("a", "A", "report a", now=1)
+    cache.put("b", "B", "report b", now=2)
+    assert cache.get("a", now=3) == "report a"
+
+    cache.put("c", "C", "report c", now=4)
+    assert cache.contains("a", now=5) and cache.contains("c", now=5)
+    assert not cache.contains("b", now=5)
+    assert cache.stats.evictions == 1, cache.stats
+
+    # 写入时同时清理过期条目
+    cache.put("d", "D", "report d", now=3605)
+    assert not cache.contains("a", now=3605)
+    assert cache.stats.expired == 2, cache.stats
+    print(f"✓ Least recently used evicted, stats {cache.stats.as_dict()}")
+    cache.close()
+
+
+def main():
+    print("="*60)
+    print("DR Report Cache Checks")
+    print("="*60)
+
+    tests = [
+        test_key_components,
+        test_ttl,
+        test_lru_eviction,
+    ]
+
+    failed = 0
+    for test in tests:
+        try:
+            test()
+        except Exception as e:
+            print(f"✗ {test.__name__} failed: {e!r}")
+            failed += 1
+
+    print("\n" + "="*60)
+    print(f"Passed: {len(tests) - failed}/{len(tests)}")
+    if failed:
+        print("⚠️ Some checks failed")
+        sys.exit(1)
+    print("✅ All checks passed!")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,144 @@
+#!/usr/bin/env python3
+"""
+DR 调度器行为检查
+覆盖在途数量、加性增/乘性减与失败隔离，用短暂 sleep 代替真实研究，不访问网络
+"""
+
+import asyncio
+import sys
+from pathlib import Path
+
+# 添加仓库根目录到Python路径
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from backend.generators.scheduler import AdaptiveScheduler
+
+
+def run(scheduler, items, job, on_done=None):
+    return asyncio.run(scheduler.run(items, job, on_done=on_done))
+
+
+def test_in_flight():
+    """在途任务数不超过并发上限，完成一个立即补位，结果按输入顺序返回"""
+    print("\nTesting in-flight limit...")
+    scheduler = AdaptiveScheduler(concurrency=2, min_concurrency=2, max_concurrency=2, window=100)
+    running = []
+    peak = []
+
+    async def job(item):
+        running.append(item)
+        peak.append(len(running))
+        # 第一个任务最慢，其余任务应在它完成前陆续补位
+        await asyncio.sleep(0.05 if item == 0 else 0.01)
+        running.remove(item)
+        return item * 10
+
+    records = run(scheduler, list(range(5)), job)
+
+    assert max(peak) == 2, peak
+    assert scheduler.stats.peak_in_flight == 2, scheduler.stats
+    assert scheduler.stats.in_flight == 0, scheduler.stats
+    assert [record.result for record in records] == [0, 10, 20, 30, 40]
+    assert scheduler.stats.completed == 5 and scheduler.stats.failed == 0, scheduler.stats
+    print(f"✓ Peak in flight {scheduler.stats.peak_in_flight}, {scheduler.stats.completed} completed")
+
+
+def test_additive_increase():
+    """窗口内全部成功且耗时低于目标时并发加一，直到上限"""
+    print("\nTesting additive increase...")
+    scheduler = AdaptiveScheduler(concurrency=1, max_concurrency=3, window=2, latency_target=10.0)
+
+    async def job(item):
+        await asyncio.sleep(0)
+
+    run(scheduler, list(range(8)), job)
+
+    assert scheduler.concurrency == 3, scheduler.stats
+    assert scheduler.stats.increases == 2, scheduler.stats
+    assert scheduler.stats.decreases == 0, scheduler.stats
+    print(f"✓ Concurrency 1 -> {scheduler.concurrency} ({scheduler.stats.increases} increases)")
+
+
+def test_multiplicative_decrease():
+    """失败率超过阈值或耗时中位数超过目标时并发减半，不低于下限"""
+    print("\nTesting multiplicative decrease...")
+    scheduler = AdaptiveScheduler(concurrency=4, min_concurrency=1, window=4, error_threshold=0.25)
+
+    async def failing(item):
+        raise RuntimeError(f"topic {item} failed")
+
+    records = run(scheduler, list(range(8)), failing)
+
+    assert scheduler.concurrency == 1, scheduler.stats
+    assert scheduler.stats.decreases == 2, scheduler.stats
+    assert scheduler.stats.failed == 8, scheduler.stats
+    assert all(isinstance(record.error, RuntimeError) for record in records)
+
+    slow = AdaptiveScheduler(concurrency=4, window=2, latency_target=0.01)
+
+    async def sleepy(item):
+        await asyncio.sleep(0.02)
+
+    run(slow, list(range(2)), sleepy)
+    assert slow.concurrency == 2 and slow.stats.decreases == 1, slow.stats
+    print(f"✓ Errors: 4 -> {scheduler.concurrency}, latency: 4 -> {slow.concurrency}")
+
+
+def test_failure_isolation():
+    """任务或 on_done 回调出错只记入该任务，其余任务照常完成"""
+    print("\nTesting failure isolation...")
+    scheduler = AdaptiveScheduler(concurrency=3, window=100)
+    reported = []
+
+    async def job(item):
+        if item == "bad-job":
+            raise ValueError("research failed")
+        await asyncio.sleep(0.01)
+        return item.upper()
+
+    def on_done(record):
+        reported.append(record.item)
+        if record.item == "bad-callback":
+            raise OSError("disk full")
+
+    records = run(scheduler, ["a", "bad-job", "bad-callback", "b"], job, on_done)
+
+    assert sorted(reported) == ["a", "b", "bad-callback", "bad-job"], reported
+    assert [record.ok for record in records] == [True, False, False, True]
+    assert isinstance(records[1].error, ValueError), records[1]
+    assert isinstance(records[2].error, OSError), records[2]
+    assert [records[0].result, records[3].result] == ["A", "B"]
+    assert scheduler.stats.failed == 2, scheduler.stats
+    print(f"✓ {scheduler.stats.failed} failures recorded, others finished")
+
+
+def main():
+    print("="*60)
+    print("DR Scheduler Checks")
+    print("="*60)
+
+    tests = [
+        test_in_flight,
+        test_additive_increase,
+        test_multiplicative_decrease,
+        test_failure_isolation,
+    ]
+
+    failed = 0
+    for test in tests:
+        try:
+            test()
+        except Exception as e:
+            print(f"✗ {test.__name__} failed: {e!r}")
+            failed += 1
+
+    print("\n" + "="*60)
+    print(f"Passed: {len(tests) - failed}/{len(tests)}")
+    if failed:
+        print("⚠️ Some checks failed")
+        sys.exit(1)
+    print("✅ All checks passed!")
+
+
+if __name__ == "__main__":
+    main()
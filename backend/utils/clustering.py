@@ -0,0 +1,57 @@
+"""话题聚类：增量并查集，把同一故事的多源条目归为一簇。"""
+from __future__ import annotations
+
+from typing import Dict, List
+
+
+class UnionFind:
+    """
+    按插入序号维护的并查集。
+
+    根节点始终是簇内最早加入的成员，只用来标识簇，代表条目由调用方另行选定；
+    路径压缩 + 小序号为根，单次操作近似 O(1)。
+    """
+
+    def __init__(self) -> None:
+        self._parent: List[int] = []
+        # 当前各簇的根，按序号升序（dict 保持插入顺序）
+        self._roots: Dict[int, None] = {}
+
+    def __len__(self) -> int:
+        return len(self._parent)
+
+    def add(self) -> int:
+        """新增一个单元素簇，返回其序号。"""
+        idx = len(self._parent)
+        self._parent.append(idx)
+        self._roots[idx] = None
+        return idx
+
+    def find(self, idx: int) -> int:
+        root = idx
+        while self._parent[root] != root:
+            root = self._parent[root]
+        while self._parent[idx] != root:
+            self._parent[idx], idx = root, self._parent[idx]
+        return root
+
+    def union(self, left: int, right: int) -> int:
+        """合并两簇，返回合并后的根。"""
+        left, right = self.find(left), self.find(right)
+        if left == right:
+            return left
+        if right < left:
+            left, right = right, left
+        self._parent[right] = left
+        del self._roots[right]
+        return left
+
+    def roots(self) -> List[int]:
+        return list(self._roots)
+
+    def groups(self) -> Dict[int, List[int]]:
+        """根 → 成员序号列表（均按序号升序）。"""
+        members: Dict[int, List[int]] = {root: [] for root in self._roots}
+        for idx in range(len(self._parent)):
+            members[self.find(idx)].append(idx)
+        return members
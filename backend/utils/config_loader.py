@@ -1,15 +1,96 @@
-"""简单的 YAML 配置加载器。"""
+"""YAML 配置加载：进程内注册表缓存解析结果，按文件 mtime 失效并通知订阅者。"""
 from __future__ import annotations
 
-import yaml
+import weakref
 from pathlib import Path
-from typing import Dict
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+import yaml
+
+from backend.utils.config_schema import SCHEMAS, ConfigError, Schema, validate
+
+Subscriber = Callable[[Dict], None]
+
+
+class ConfigRegistry:
+    """
+    进程级配置注册表。
+
+    get() 每次只做一次 stat：mtime 未变直接返回缓存，变了才重新解析并按 schema 校验；
+    重新加载后通知该文件的订阅者（弱引用，订阅对象释放后自动失效）。
+    返回的字典在多个调用方之间共享，请勿原地修改。
+    """
+
+    def __init__(self) -> None:
+        self._schemas: Dict[str, Schema] = dict(SCHEMAS)
+        self._cache: Dict[str, Tuple[Optional[int], Dict]] = {}
+        self._subscribers: Dict[str, List[weakref.WeakMethod]] = {}
+
+    def register_schema(self, path: str, schema: Schema) -> None:
+        self._schemas[path] = schema
+        self._cache.pop(path, None)
+
+    def get(self, path: str) -> Dict:
+        mtime = self._mtime(path)
+        cached = self._cache.get(path)
+        if cached is not None and cached[0] == mtime:
+            return cached[1]
+
+        config = self._load(path)
+        self._cache[path] = (mtime, config)
+        if cached is not None:
+            self._notify(path, config)
+        return config
+
+    def subscribe(self, path: str, callback: Subscriber) -> None:
+        """订阅配置变更；callback 须为绑定方法，收到校验后的新配置。"""
+        self._subscribers.setdefault(path, []).append(weakref.WeakMethod(callback))
+
+    def reload_if_changed(self) -> List[str]:
+        """检查所有已缓存的配置文件，返回发生变化并已重新加载的路径。"""
+        changed = [path for path, (mtime, _) in list(self._cache.items()) if self._mtime(path) != mtime]
+        for path in changed:
+            self.get(path)
+        return changed
+
+    def clear(self) -> None:
+        self._cache.clear()
+
+    def _load(self, path: str) -> Dict:
+        config_path = Path(path)
+        data: Any = {}
+        if config_path.exists():
+            with config_path.open("r", encoding="utf-8") as fp:
+                data = yaml.safe_load(fp) or {}
+        schema = self._schemas.get(path)
+        if schema is None:
+            return data
+        try:
+            return validate(data, schema)
+        except ConfigError as exc:
+            raise ConfigError(f"{path}: {exc}") from None
+
+    def _notify(self, path: str, config: Dict) -> None:
+        alive: List[weakref.WeakMethod] = []
+        for ref in self._subscribers.get(path, []):
+            callback = ref()
+            if callback is None:
+                continue
+            alive.append(ref)
+            callback(config)
+        self._subscribers[path] = alive
+
+    @staticmethod
+    def _mtime(path: str) -> Optional[int]:
+        try:
+            return Path(path).stat().st_mtime_ns
+        except OSError:
+            return None
+
+
+CONFIG_REGISTRY = ConfigRegistry()
 
 
 def load_yaml_config(path: str) -> Dict:
-    """加载 YAML，若文件缺失返回空字典。"""
-    config_path = Path(path)
-    if not config_path.exists():
-        return {}
-    with config_path.open("r", encoding="utf-8") as fp:
-        return yaml.safe_load(fp) or {}
+    """加载 YAML（经注册表缓存与校验），若文件缺失返回空字典或 schema 缺省值。"""
+    return CONFIG_REGISTRY.get(path)
@@ -0,0 +1,200 @@
+"""配置 schema：加载时一次性校验类型并补齐缺省值，调用方直接按键取值。"""
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Any, Dict, Mapping, Optional, Tuple, Union
+
+FILTER_RULES_PATH = "backend/config/filter_rules.yaml"
+DR_CONFIG_PATH = "backend/config/dr_config.yaml"
+CRAWLER_CONFIG_PATH = "backend/config/crawler_config.yaml"
+DEDUP_BACKENDS = ("sequence", "tfidf")
+
+
+class ConfigError(ValueError):
+    """配置不符合 schema。"""
+
+
+@dataclass(frozen=True)
+class Field:
+    """schema 中的一个字段：期望类型与缺省值；item_type 用于约束映射/列表的元素类型。"""
+
+    type: Union[type, Tuple[type, ...]]
+    default: Any = None
+    item_type: Optional[Union[type, Tuple[type, ...]]] = None
+    choices: Optional[Tuple[Any, ...]] = None
+
+
+Schema = Mapping[str, Union[Field, "Schema"]]
+
+
+def validate(data: Any, schema: Schema, where: str = "") -> Dict:
+    """按 schema 校验并补齐缺省值，返回新字典；未声明的键原样保留。"""
+    if data is None:
+        data = {}
+    if not isinstance(data, dict):
+        raise ConfigError(f"{where or '<root>'} 应为映射，实际为 {type(data).__name__}")
+
+    result = dict(data)
+    for key, spec in schema.items():
+        path = f"{where}.{key}" if where else key
+        if not isinstance(spec, Field):
+            result[key] = validate(data.get(key), spec, path)
+            continue
+
+        value = data.get(key)
+        if value is None:
+            result[key] = _copy_default(spec.default)
+            continue
+        result[key] = _check_field(value, spec, path)
+    return result
+
+
+def _check_field(value: Any, spec: Field, path: str) -> Any:
+    expected = spec.type
+    # YAML 中整数写法同样可作浮点数
+    if expected is float and isinstance(value, int) and not isinstance(value, bool):
+        value = float(value)
+    if not isinstance(value, expected) or (isinstance(value, bool) and expected in (int, float)):
+        raise ConfigError(f"{path} 类型应为 {_type_name(expected)}，实际为 {type(value).__name__}")
+    if spec.choices is not None and value not in spec.choices:
+        raise ConfigError(f"{path} 取值应为 {', '.join(map(str, spec.choices))} 之一，实际为 {value}")
+    if spec.item_type is not None:
+        values = value.values() if isinstance(value, dict) else value
+        for item in values:
+            if not isinstance(item, spec.item_type) or isinstance(item, bool):
+                raise ConfigError(f"{path} 的元素类型应为 {_type_name(spec.item_type)}，实际含 {item!r}")
+    return value
+
+
+def _type_name(expected: Union[type, Tuple[type, ...]]) -> str:
+    if isinstance(expected, tuple):
+        return "/".join(item.__name__ for item in expected)
+    return expected.__name__
+
+
+def _copy_default(default: Any) -> Any:
+    if isinstance(default, dict):
+        return dict(default)
+    if isinstance(default, list):
+        return list(default)
+    return default
+
+
+NUMBER = (int, float)
+
+FILTER_RULES_SCHEMA: Schema = {
+    "engagement_thresholds": Field(dict, {}, item_type=NUMBER),
+    "platform_weights": Field(dict, {}, item_type=NUMBER),
+    "topic_keywords": Field(dict, {}, item_type=list),
+    "keyword_word_boundary": Field(bool, True),
+    "daily_limit": Field(int, 10),
+    "recency_hours": Field(float, 24.0),
+    "deduplication": {
+        "similarity_threshold": Field(float, 0.85),
+        "check_days": Field(int, 7),
+        "history_index": Field(str, "data/cache/dedup_history.sqlite3"),
+        "backend": Field(str, "sequence", choices=DEDUP_BACKENDS),
+        "source_priority": Field(list, ["hackernews", "github", "newsapi", "reddit"], item_type=str),
+        "tfidf": {
+            "threshold": Field(float, 0.6),
+            "ngram_range": Field(list, [2, 3], item_type=int),
+            "chunk_size": Field(int, 512),
+        },
+        "lsh": {
+            "num_perm": Field(int, 64),
+            "bands": Field(int, 16),
+            "shingle_size": Field(int, 3),
+        },
+    },
+}
+
+DR_CONFIG_SCHEMA: Schema = {
+    "max_articles_per_run": Field(int, 10),
+    "researcher_pool_size": Field(int, 6),
+    "concurrency": {
+        "initial": Field(int, 3),
+        "min": Field(int, 1),
+        "max": Field(int, 6),
+        "window": Field(int, 4),
+        "latency_target": Field(float, 120.0),
+        "error_threshold": Field(float, 0.25),
+    },
+    "budget": {
+        "wall_clock_minutes": Field(float, 0.0),
+        "tokens": Field(int, 0),
+        "cost": Field(float, 0.0),
+        "default_duration": Field(float, 180.0),
+        "default_tokens": Field(int, 60000),
+        "default_cost": Field(float, 0.0),
+        "history_path": Field(str, "data/cache/dr_costs.sqlite3"),
+        "history_window": Field(int, 20),
+        "backlog_path": Field(str, "data/processed/dr_backlog.json"),
+        "backlog_days": Field(int, 2),
+    },
+    "publish": {
+        "commit_interval_seconds": Field(float, 0.0),
+    },
+    "report_cache": {
+        "enabled": Field(bool, True),
+        "path": Field(str, "data/cache/dr_reports.sqlite3"),
+        "ttl_hours": Field(float, 72.0),
+        "max_entries": Field(int, 500),
+    },
+}
+
+# sources 下除 default 外的各数据源段按需覆盖 default，未列出的数据源直接沿用 default
+CRAWLER_CONFIG_SCHEMA: Schema = {
+    "http": {
+        "limit": Field(int, 64),
+        "limit_per_host": Field(int, 8),
+        "dns_cache_ttl": Field(int, 300),
+        "keepalive_timeout": Field(float, 30.0),
+        "timeout": {
+            "total": Field(float, 30.0),
+            "connect": Field(float, 10.0),
+            "sock_read": Field(float, 20.0),
+        },
+    },
+    "crawl": {
+        "global_timeout": Field(float, 300.0),
+        "crawler_timeout": Field(float, 120.0),
+        "crawler_timeouts": Field(dict, {}, item_type=NUMBER),
+    },
+    "executor": {
+        "workers": Field(int, 2),
+        "inline_threshold": Field(int, 2000),
+        "chunk_size": Field(int, 1000),
+    },
+    "sources": {
+        "default": {
+            "rate": Field(float, 0.0),
+            "burst": Field(float, 0.0),
+            "retries": Field(int, 2),
+            "backoff_base": Field(float, 0.5),
+            "backoff_max": Field(float, 30.0),
+        },
+    },
+    "hackernews": {
+        "top_limit": Field(int, 30),
+        "concurrency": Field(int, 8),
+        "item_store": Field(str, "data/cache/hn_items.jsonl"),
+        "item_retention_days": Field(int, 7),
+    },
+    "mcp": {
+        "concurrency": Field(int, 5),
+        "platform_timeout": Field(float, 15.0),
+    },
+    "cache": {
+        "enabled": Field(bool, True),
+        "dir": Field(str, "data/cache/http"),
+        "default_ttl": Field(float, 600.0),
+        "max_entries": Field(int, 500),
+        "max_bytes": Field(int, 50 * 1024 * 1024),
+    },
+}
+
+SCHEMAS: Dict[str, Schema] = {
+    FILTER_RULES_PATH: FILTER_RULES_SCHEMA,
+    DR_CONFIG_PATH: DR_CONFIG_SCHEMA,
+    CRAWLER_CONFIG_PATH: CRAWLER_CONFIG_SCHEMA,
+}
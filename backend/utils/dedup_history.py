@@ -0,0 +1,153 @@
+"""去重历史索引：SQLite 持久化已处理标题及其 LSH 分桶，按需查询而非启动时全量加载。"""
+from __future__ import annotations
+
+import sqlite3
+from dataclasses import dataclass
+from datetime import date, timedelta
+from pathlib import Path
+from typing import Dict, Iterable, Iterator, List, Tuple
+
+import numpy as np
+
+from backend.utils.minhash import LSHIndex, MinHasher
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT NOT NULL);
+CREATE TABLE IF NOT EXISTS titles (
+    id INTEGER PRIMARY KEY,
+    title TEXT NOT NULL UNIQUE,
+    seen_on TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS titles_seen_on ON titles (seen_on);
+CREATE TABLE IF NOT EXISTS bands (
+    band INTEGER NOT NULL,
+    bucket BLOB NOT NULL,
+    title_id INTEGER NOT NULL REFERENCES titles (id) ON DELETE CASCADE,
+    PRIMARY KEY (band, bucket, title_id)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS bands_title_id ON bands (title_id);
+"""
+
+RECENT_TITLES_SQL = "SELECT title FROM titles WHERE seen_on >= ? ORDER BY id"
+
+
+@dataclass(frozen=True)
+class RecentTitles:
+    """
+    保留期内历史标题的只读视图。
+
+    每次迭代新开一个只读连接逐行读取，不把整个保留期装入内存；
+    只含路径与截止日期，可 pickle 交给进程池，也可重复迭代。
+    """
+
+    path: str
+    cutoff: str
+
+    def __iter__(self) -> Iterator[str]:
+        conn = sqlite3.connect(f"{Path(self.path).as_uri()}?mode=ro", uri=True)
+        try:
+            for (title,) in conn.execute(RECENT_TITLES_SQL, (self.cutoff,)):
+                yield title
+        finally:
+            conn.close()
+
+
+class DedupHistory:
+    """
+    已处理标题的持久化 LSH 索引。
+
+    打开时只建立连接，查询按签名分段命中 (band, bucket) 主键索引，
+    启动耗时与内存不随历史天数增长；超出 check_days 的记录在写入时清理。
+    """
+
+    def __init__(self, path: str, index: LSHIndex, check_days: int) -> None:
+        self.path = path
+        self.index = index
+        self.check_days = check_days
+        if path != ":memory:":
+            Path(path).parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(path)
+        self._conn.execute("PRAGMA foreign_keys = ON")
+        self._conn.execute("PRAGMA journal_mode = WAL")
+        # is_new 为真表示索引为空或签名参数已变，需要调用方回填
+        self.is_new = self._prepare()
+
+    def close(self) -> None:
+        self._conn.close()
+
+    def candidates(self, signature: np.ndarray, today: date | None = None) -> List[str]:
+        """返回与签名至少一段分桶相同、且仍在保留期内的历史标题。"""
+        bands = list(enumerate(self.index.band_keys(signature)))
+        clause = " OR ".join(["(b.band = ? AND b.bucket = ?)"] * len(bands))
+        params: List = [value for pair in bands for value in pair]
+        params.append(self._cutoff(today))
+        rows = self._conn.execute(
+            f"SELECT DISTINCT t.title FROM bands b JOIN titles t ON t.id = b.title_id "
+            f"WHERE ({clause}) AND t.seen_on >= ?",
+            params,
+        )
+        return [row[0] for row in rows]
+
+    def recent_titles(self, today: date | None = None) -> Iterable[str]:
+        """保留期内的全部标题，供整批相似度后端逐行读取；内存库无法另开连接，只能直接取出。"""
+        if self.path == ":memory:":
+            return [row[0] for row in self._conn.execute(RECENT_TITLES_SQL, (self._cutoff(today),))]
+        return RecentTitles(str(Path(self.path).resolve()), self._cutoff(today))
+
+    def add(self, titles: Iterable[str], seen_on: date | None = None) -> None:
+        """记录一批标题；已存在的标题只刷新日期。"""
+        self.add_dated((title, seen_on or date.today()) for title in titles)
+
+    def add_dated(self, entries: Iterable[Tuple[str, date]]) -> None:
+        with self._conn:
+            for title, seen_on in entries:
+                row = self._conn.execute("SELECT id FROM titles WHERE title = ?", (title,)).fetchone()
+                if row is not None:
+                    self._conn.execute(
+                        "UPDATE titles SET seen_on = MAX(seen_on, ?) WHERE id = ?", (seen_on.isoformat(), row[0])
+                    )
+                    continue
+                title_id = self._conn.execute(
+                    "INSERT INTO titles (title, seen_on) VALUES (?, ?)", (title, seen_on.isoformat())
+                ).lastrowid
+                signature = self.index.hasher.signature(title)
+                self._conn.executemany(
+                    "INSERT OR IGNORE INTO bands (band, bucket, title_id) VALUES (?, ?, ?)",
+                    [(band, key, title_id) for band, key in enumerate(self.index.band_keys(signature))],
+                )
+
+    def expire(self, today: date | None = None) -> int:
+        """删除保留期外的记录，返回删除条数。"""
+        with self._conn:
+            cursor = self._conn.execute("DELETE FROM titles WHERE seen_on < ?", (self._cutoff(today),))
+        return cursor.rowcount
+
+    def __len__(self) -> int:
+        return self._conn.execute("SELECT COUNT(*) FROM titles").fetchone()[0]
+
+    def _cutoff(self, today: date | None) -> str:
+        return ((today or date.today()) - timedelta(days=self.check_days)).isoformat()
+
+    def _prepare(self) -> bool:
+        """建表并校验签名参数；参数不一致时旧分桶无法复用，清空重建。"""
+        self._conn.executescript(SCHEMA)
+        expected = self._signature_meta(self.index)
+        stored = dict(self._conn.execute("SELECT key, value FROM meta"))
+        if stored == expected:
+            return False
+
+        with self._conn:
+            self._conn.execute("DELETE FROM titles")
+            self._conn.execute("DELETE FROM meta")
+            self._conn.executemany("INSERT INTO meta (key, value) VALUES (?, ?)", expected.items())
+        return True
+
+    @staticmethod
+    def _signature_meta(index: LSHIndex) -> Dict[str, str]:
+        hasher: MinHasher = index.hasher
+        return {
+            "num_perm": str(hasher.num_perm),
+            "shingle_size": str(hasher.shingle_size),
+            "seed": str(hasher.seed),
+            "bands": str(index.bands),
+        }
@@ -2,57 +2,100 @@
 from __future__ import annotations
 
 import json
-from datetime import datetime, timedelta
+from datetime import date, datetime
 from difflib import SequenceMatcher
 from pathlib import Path
-from typing import Dict, List, Set
+from typing import TYPE_CHECKING, Any, Callable, Dict, Iterable, List, NamedTuple, Optional, Set, Tuple
 
-from backend.utils.config_loader import load_yaml_config
+import numpy as np
+
+from backend.utils.clustering import UnionFind
+from backend.utils.config_loader import CONFIG_REGISTRY, load_yaml_config
+from backend.utils.config_schema import FILTER_RULES_PATH
+from backend.utils.dedup_history import DedupHistory
+from backend.utils.minhash import LSHIndex, MinHasher
+from backend.utils.normalize import link_target, normalize_title, source_ranks, story_key
 
-DEFAULT_THRESHOLD = 0.85
-DEFAULT_CHECK_DAYS = 7
 PROCESSED_DIR = Path("data/processed")
 
+# tfidf 后端依赖 SciPy，仅在配置选用时导入
+if TYPE_CHECKING:
+    from backend.utils.tfidf import TfidfSimilarity
+
 
 class Deduplicator:
-    """根据标题相似度去重，并参考近几天已生成的记录。"""
+    """
+    根据标题相似度去重，并参考近几天已生成的记录（持久化于 SQLite 历史索引）。
+
+    backend=sequence（默认）：先用 MinHash/LSH 索引取回少量候选，再对候选做 SequenceMatcher 精确比对，
+    相似度判定与 similarity_threshold 的原有语义一致，可逐条流式去重。
+    backend=tfidf：整批构建字符 2/3-gram TF-IDF 向量求余弦相似度，更适合中文标题，需等整批到齐。
+    """
 
     def __init__(self) -> None:
-        config = load_yaml_config("backend/config/filter_rules.yaml")
-        dedup_cfg = config.get("deduplication", {})
-        self.similarity_threshold = dedup_cfg.get("similarity_threshold", DEFAULT_THRESHOLD)
-        self.check_days = dedup_cfg.get("check_days", DEFAULT_CHECK_DAYS)
-        self.history_titles = self._load_recent_titles()
+        self.history: Optional[DedupHistory] = None
+        self._apply_config(load_yaml_config(FILTER_RULES_PATH))
+        # 阈值、后端或签名参数被修改时重建相似度组件与历史索引
+        CONFIG_REGISTRY.subscribe(FILTER_RULES_PATH, self._apply_config)
 
-    def deduplicate(self, items: List[Dict]) -> List[Dict]:
-        """按相似度过滤重复标题。"""
-        unique: List[Dict] = []
+    def _apply_config(self, config: Dict) -> None:
+        dedup_cfg = config["deduplication"]
+        self.similarity_threshold = dedup_cfg["similarity_threshold"]
+        self.check_days = dedup_cfg["check_days"]
+        self.source_priority = source_ranks(dedup_cfg["source_priority"])
+
+        lsh_cfg = dedup_cfg["lsh"]
+        self.hasher = MinHasher(num_perm=lsh_cfg["num_perm"], shingle_size=lsh_cfg["shingle_size"])
+        self.bands = lsh_cfg["bands"]
+
+        self.backend = dedup_cfg["backend"]
+        self.tfidf: Optional[TfidfSimilarity] = None
+        if self.backend == "tfidf":
+            from backend.utils.tfidf import TfidfSimilarity
 
+            self.tfidf = TfidfSimilarity(**dedup_cfg["tfidf"])
+
+        if self.history is not None:
+            self.history.close()
+        self.history = DedupHistory(dedup_cfg["history_index"], self.new_index(), self.check_days)
+        if self.history.is_new:
+            # 首次使用或签名参数变更：从 data/processed 回填一次，之后由 record_history 增量维护
+            self.history.add_dated(self._load_recent_titles().items())
+
+    def deduplicate(self, items: List[Dict]) -> List[Dict]:
+        """按相似度聚类，返回各簇代表条目（热度为全簇之和）。"""
+        batch = self.new_batch()
         for item in items:
-            title = item.get("title", "")
-            if not title:
-                continue
+            batch.offer(item)
+        return batch.finish()
 
-            if self._is_duplicate(title, [u["title"] for u in unique]):
-                continue
-            if self._is_duplicate(title, self.history_titles):
-                continue
+    def new_batch(self) -> "DedupBatch":
+        """开启一轮去重，可逐条喂入（流式）。"""
+        return DedupBatch(self)
 
-            unique.append(item)
+    def new_index(self) -> LSHIndex[int]:
+        return LSHIndex(self.hasher, self.bands)
 
-        return unique
+    def record_history(self, titles: Iterable[str]) -> None:
+        """把本轮选中的标题写入历史索引，并清理保留期外的记录。"""
+        self.history.add(titles)
+        self.history.expire()
 
-    def _is_duplicate(self, title: str, corpus: List[str] | Set[str]) -> bool:
-        """计算标题相似度，大于阈值视为重复。"""
-        for existed in corpus:
-            ratio = SequenceMatcher(None, title, existed).ratio()
-            if ratio >= self.similarity_threshold:
-                return True
-        return False
+    def close(self) -> None:
+        self.history.close()
+
+    def is_history_duplicate(self, title: str, signature: np.ndarray) -> bool:
+        return self._matches(title, self.history.candidates(signature))
 
-    def _load_recent_titles(self) -> Set[str]:
-        """读取最近若干天已处理的话题标题。"""
-        titles: Set[str] = set()
+    def is_similar(self, title: str, other: str) -> bool:
+        return SequenceMatcher(None, title, other).ratio() >= self.similarity_threshold
+
+    def _matches(self, title: str, candidates: Iterable[str]) -> bool:
+        return any(self.is_similar(title, candidate) for candidate in candidates)
+
+    def _load_recent_titles(self) -> Dict[str, date]:
+        """读取最近若干天已处理的话题标题及其日期，用于回填历史索引。"""
+        titles: Dict[str, date] = {}
         if not PROCESSED_DIR.exists():
             return titles
 
@@ -75,6 +118,175 @@ class Deduplicator:
             for item in data.get("items", []):
                 title = item.get("title")
                 if title:
-                    titles.add(title)
+                    titles[title] = max(titles.get(title, file_date), file_date)
 
         return titles
+
+
+class ClusterMember(NamedTuple):
+    """簇成员在比对与汇总时用到的字段；完整条目只为各簇代表保留。"""
+
+    source: Any
+    title: str
+    url: Any
+    engagement: float
+
+    @classmethod
+    def of(cls, item: Dict) -> "ClusterMember":
+        return cls(item.get("source"), item.get("title", ""), item.get("url"), item.get("engagement_score", 0))
+
+
+class DedupBatch:
+    """
+    单轮去重与聚类状态。
+
+    同一故事的多源条目用增量并查集归为一簇，按来源优先级、来源名、URL、标题选出代表（与到达顺序无关），
+    finish() 时把全簇热度累加到代表条目上，下游筛选与 DR 只处理代表。
+    只有各簇代表保留完整条目，其余成员只留 ClusterMember，内存随话题簇数而非抓取量增长。
+    先按规范化 URL 与归一化标题做 O(1) 精确匹配，未命中才进入近似比对。
+    sequence 后端逐条判定（streaming 为真）；tfidf 后端在 finish() 时整批计算相似对再聚类。
+    """
+
+    def __init__(self, deduplicator: Deduplicator) -> None:
+        self._dedup = deduplicator
+        self._index = deduplicator.new_index()
+        self._members: List[ClusterMember] = []
+        # 簇根 → 代表的完整条目、代表的成员序号
+        self._items: Dict[int, Dict] = {}
+        self._leaders: Dict[int, int] = {}
+        self._clusters = UnionFind()
+        self._by_url: Dict[str, int] = {}
+        self._by_title: Dict[str, int] = {}
+        self.stats = {"exact": 0, "similar": 0, "history": 0}
+        self.streaming = deduplicator.tfidf is None
+        self._result: Optional[List[Dict]] = None
+
+    @property
+    def unique(self) -> List[Dict]:
+        """当前各簇的代表条目（按到达顺序）。"""
+        return [self._items[root] for root in self._clusters.roots()]
+
+    def offer(self, item: Dict) -> bool:
+        """
+        加入一条，返回它是否新建了一个簇；并入已有簇（即使因此成为代表）或与历史重复时返回 False。
+
+        非流式后端只完成精确匹配，返回值只是暂定结果，以 finish() 为准。
+        """
+        title = item.get("title", "")
+        if not title:
+            return False
+
+        url_key = link_target(item.get("url", ""), item.get("raw_data"))
+        title_key = normalize_title(title)
+        existing = self._by_url.get(url_key) if url_key else None
+        if existing is None:
+            existing = self._by_title.get(title_key)
+        if existing is not None:
+            self.stats["exact"] += 1
+            self._union(existing, self._add(item, url_key, title_key))
+            return False
+
+        if not self.streaming:
+            self._add(item, url_key, title_key)
+            return True
+
+        signature = self._dedup.hasher.signature(title)
+        matched = self._similar_roots(title, signature)
+        if not matched and self._dedup.is_history_duplicate(title, signature):
+            self.stats["history"] += 1
+            return False
+
+        idx = self._add(item, url_key, title_key)
+        self._index.add(idx, signature)
+        if not matched:
+            return True
+
+        self.stats["similar"] += 1
+        for root in matched:
+            self._union(root, idx)
+        return False
+
+    def similarity_job(self) -> Optional[Tuple[Callable, Tuple]]:
+        """非流式后端的整批相似度计算 (函数, 参数)，可交给进程池执行后把结果传给 finish()。"""
+        if self.streaming or not self._members:
+            return None
+        titles = [member.title for member in self._members]
+        return self._dedup.tfidf.similar_pairs, (titles, self._dedup.history.recent_titles())
+
+    def finish(self, similar: Optional[Tuple] = None) -> List[Dict]:
+        """结束本轮：非流式后端在此聚类，随后汇总各簇热度，返回代表条目。"""
+        if self._result is not None:
+            return self._result
+
+        dropped: Set[int] = set()
+        job = self.similarity_job() if similar is None else None
+        if job is not None:
+            similar = job[0](*job[1])
+        if similar is not None:
+            rows, cols, in_history = similar
+            for row, col in zip(rows.tolist(), cols.tolist()):
+                if self._clusters.find(row) != self._clusters.find(col):
+                    self.stats["similar"] += 1
+                    self._union(row, col)
+            # 簇内任一条目与历史相似即视为已处理过的故事
+            dropped = {self._clusters.find(idx) for idx in np.flatnonzero(in_history).tolist()}
+            self.stats["history"] += len(dropped)
+
+        representatives: List[Dict] = []
+        for root, members in self._clusters.groups().items():
+            if root in dropped:
+                continue
+            representative = self._items[root]
+            if len(members) > 1:
+                leader = self._leaders[root]
+                others = sorted((self._members[idx] for idx in members if idx != leader), key=self._rank)
+                self._aggregate(representative, others)
+            representatives.append(representative)
+        self._result = representatives
+        return representatives
+
+    def _add(self, item: Dict, url_key: str, title_key: str) -> int:
+        idx = self._clusters.add()
+        self._members.append(ClusterMember.of(item))
+        self._items[idx] = item
+        self._leaders[idx] = idx
+        if url_key:
+            self._by_url.setdefault(url_key, idx)
+        self._by_title.setdefault(title_key, idx)
+        return idx
+
+    def _union(self, left: int, right: int) -> None:
+        """合并两簇，保留排序靠前的代表，落选一方的完整条目随即释放。"""
+        left, right = self._clusters.find(left), self._clusters.find(right)
+        if left == right:
+            return
+        root = self._clusters.union(left, right)
+        other = right if root == left else left
+        challenger = self._leaders.pop(other)
+        item = self._items.pop(other)
+        if self._rank(self._members[challenger]) < self._rank(self._members[self._leaders[root]]):
+            self._leaders[root] = challenger
+            self._items[root] = item
+
+    def _rank(self, member: ClusterMember) -> Tuple:
+        """代表的排序键：story_key 之后再比热度（高者优先），越小越优先。"""
+        return story_key(member.source, member.url, member.title, self._dedup.source_priority) + (-member.engagement,)
+
+    def _similar_roots(self, title: str, signature: np.ndarray) -> Set[int]:
+        """LSH 候选按簇去重后逐簇比对；同簇已命中的成员不再重复计算相似度。"""
+        matched: Set[int] = set()
+        for key in sorted(self._index.query(signature)):
+            root = self._clusters.find(key)
+            if root not in matched and self._dedup.is_similar(title, self._members[key].title):
+                matched.add(root)
+        return matched
+
+    @staticmethod
+    def _aggregate(representative: Dict, others: List[ClusterMember]) -> None:
+        """代表条目的热度取全簇之和，并在 raw_data 中保留其他来源的标题与链接。"""
+        representative["engagement_score"] = representative.get("engagement_score", 0) + sum(
+            other.engagement for other in others
+        )
+        raw = representative.get("raw_data")
+        if isinstance(raw, dict):
+            raw["cluster"] = [{"source": other.source, "title": other.title, "url": other.url} for other in others]
@@ -0,0 +1,79 @@
+"""管线 CPU 密集阶段的执行层：大输入分片交给进程池，小输入直接在本进程执行。"""
+from __future__ import annotations
+
+import asyncio
+import os
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+from typing import Any, Callable, Dict, List, Optional, Sequence, TypeVar
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+DEFAULT_WORKERS = min(4, os.cpu_count() or 1)
+DEFAULT_INLINE_THRESHOLD = 2000  # 低于该条目数时进程间传输开销大于收益
+DEFAULT_CHUNK_SIZE = 1000
+
+
+class StageExecutor:
+    """
+    把同步的 CPU 密集函数从事件循环移出。
+
+    workers 为 0 时始终内联执行；进程池在首次需要时创建，管线结束时关闭。
+    提交到进程池的函数与参数必须可 pickle（模块级函数、普通数据）。
+    """
+
+    def __init__(
+        self,
+        workers: int = DEFAULT_WORKERS,
+        inline_threshold: int = DEFAULT_INLINE_THRESHOLD,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+    ) -> None:
+        self.workers = max(0, workers)
+        self.inline_threshold = inline_threshold
+        self.chunk_size = max(1, chunk_size)
+        self.stats = {"inline": 0, "offloaded": 0, "chunks": 0}
+        self._pool: Optional[ProcessPoolExecutor] = None
+
+    @classmethod
+    def from_config(cls, conf: Dict) -> "StageExecutor":
+        return cls(
+            workers=conf["workers"],
+            inline_threshold=conf["inline_threshold"],
+            chunk_size=conf["chunk_size"],
+        )
+
+    async def run(self, fn: Callable[..., R], *args: Any, size: int = 0) -> R:
+        """整体执行 fn(*args)；size 为输入规模，用于决定是否内联。"""
+        if not self._offload(size):
+            self.stats["inline"] += 1
+            return fn(*args)
+        self.stats["offloaded"] += 1
+        return await asyncio.get_running_loop().run_in_executor(self._get_pool(), partial(fn, *args))
+
+    async def map_chunks(self, fn: Callable[..., List[R]], items: Sequence[T], *args: Any) -> List[R]:
+        """按 chunk_size 分片并行执行 fn(chunk, *args)，按原顺序拼接各片结果。"""
+        if not self._offload(len(items)):
+            self.stats["inline"] += 1
+            return fn(list(items), *args)
+
+        loop = asyncio.get_running_loop()
+        pool = self._get_pool()
+        chunks = [list(items[i : i + self.chunk_size]) for i in range(0, len(items), self.chunk_size)]
+        self.stats["offloaded"] += 1
+        self.stats["chunks"] += len(chunks)
+        results = await asyncio.gather(*(loop.run_in_executor(pool, partial(fn, chunk, *args)) for chunk in chunks))
+        return [value for part in results for value in part]
+
+    def close(self) -> None:
+        if self._pool is not None:
+            self._pool.shutdown(wait=False, cancel_futures=True)
+            self._pool = None
+
+    def _offload(self, size: int) -> bool:
+        return self.workers > 0 and size >= self.inline_threshold
+
+    def _get_pool(self) -> ProcessPoolExecutor:
+        if self._pool is None:
+            self._pool = ProcessPoolExecutor(max_workers=self.workers)
+        return self._pool
@@ -2,52 +2,179 @@
 from __future__ import annotations
 
 from datetime import datetime, timedelta
-from typing import Dict, List
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
 
-from backend.utils.config_loader import load_yaml_config
+import numpy as np
+
+from backend.utils.config_loader import CONFIG_REGISTRY, load_yaml_config
+from backend.utils.config_schema import FILTER_RULES_PATH
+from backend.utils.keywords import KeywordMatcher
+from backend.utils.normalize import source_ranks, story_key
+from backend.utils.topk import TopKSelector
 
-DEFAULT_RECENCY_HOURS = 24
-DEFAULT_DAILY_LIMIT = 10
 DEFAULT_WEIGHT = 1.0
+MICROSECOND = timedelta(microseconds=1)
+BATCH_MIN_ITEMS = 256  # 低于该条目数时列式装载的开销大于收益
 
 
 class TrendingFilter:
     """按照热度、关键词与时效性筛选热点。"""
 
     def __init__(self) -> None:
-        config = load_yaml_config("backend/config/filter_rules.yaml")
-        self.engagement_thresholds = config.get("engagement_thresholds", {})
-        self.platform_weights = config.get("platform_weights", {})
-        self.recency_hours = config.get("recency_hours", DEFAULT_RECENCY_HOURS)
-        self.daily_limit = config.get("daily_limit", DEFAULT_DAILY_LIMIT)
-        self.keywords = self._collect_keywords(config.get("topic_keywords", {}))
-
-    def filter_trending(self, items: List[Dict]) -> List[Dict]:
-        """返回符合条件的热点（按热度降序，截断 daily_limit）。"""
+        self._apply_config(load_yaml_config(FILTER_RULES_PATH))
+        # 规则文件被修改时重建阈值与关键词自动机
+        CONFIG_REGISTRY.subscribe(FILTER_RULES_PATH, self._apply_config)
+
+    def _apply_config(self, config: Dict) -> None:
+        self.engagement_thresholds = config["engagement_thresholds"]
+        self.platform_weights = config["platform_weights"]
+        self.recency_hours = config["recency_hours"]
+        self.daily_limit = config["daily_limit"]
+        self.keyword_matcher = KeywordMatcher(config["topic_keywords"], word_boundary=config["keyword_word_boundary"])
+        # 同分时与聚类选代表使用同一来源优先级，排序不受抓取到达顺序影响
+        self.source_priority = source_ranks(config["deduplication"]["source_priority"])
+
+    def filter_trending(self, items: Iterable[Dict]) -> List[Dict]:
+        """
+        返回符合条件的热点（按热度降序，截断 daily_limit）。
+
+        已装入内存的大列表走列式批量路径；其余（含生成器）逐条判定并流式取前 k，内存 O(k)。
+        """
         now = datetime.now()
-        filtered: List[Dict] = []
-
-        for item in items:
-            if not item.get("title"):
-                continue
-
-            if not self._within_recency(item.get("published_at"), now):
-                continue
-
-            if not self._meet_engagement(item):
-                continue
-
-            if not self._contain_keyword(item["title"]):
-                continue
+        if isinstance(items, list) and len(items) >= BATCH_MIN_ITEMS:
+            return self.filter_batch(items, now)
+        return self.select(items, now)
+
+    def select(self, items: Iterable[Dict], now: datetime, limit: Optional[int] = None) -> List[Dict]:
+        """流式筛选：逐条判定，只保留当前前 limit 名（缺省 daily_limit）。"""
+        return self.new_selector(limit).extend(item for item in items if self.accepts(item, now)).result()
+
+    def new_selector(self, limit: Optional[int] = None) -> TopKSelector[Dict]:
+        """按权重热度取前 limit 名的选择器，同分按 tie_key，与 rank、filter_batch 结果一致。"""
+        return TopKSelector(
+            self.daily_limit if limit is None else limit,
+            self.score,
+            self.tie_key,
+        )
 
-            filtered.append(item)
+    def score(self, item: Dict) -> float:
+        """条目的排序分（应用平台权重后的热度）。"""
+        return self._weighted_score(item.get("source"), item.get("engagement_score", 0))
+
+    def tie_key(self, item: Dict) -> Tuple:
+        """同分时的次序键（越小越靠前），与 DedupBatch 选代表的键相同。"""
+        return story_key(item.get("source"), item.get("url"), item.get("title", ""), self.source_priority)
+
+    def filter_batch(self, items: List[Dict], now: datetime) -> List[Dict]:
+        """
+        列式批量筛选，结果与逐条 accepts + rank 完全一致。
+
+        来源、热度、发布时间装入 NumPy 列后向量化比较阈值与时效窗口，
+        关键词只对前几项都通过的条目扫描，最后用 argpartition 取前 daily_limit。
+        """
+        if not items:
+            return []
+        mask, scores, codes, weights = self._screen_columns(items, now)
+        selected = np.flatnonzero(mask)
+        order = self._top_k(
+            scores[selected] * weights[codes[selected]],
+            self.daily_limit,
+            lambda idx: self.tie_key(items[selected[idx]]),
+        )
+        return [items[idx] for idx in selected[order]]
+
+    def _screen_columns(self, items: List[Dict], now: datetime):
+        """装载列并计算通过掩码，返回 (掩码, 热度列, 来源编码, 各来源权重)。"""
+        count = len(items)
+        # 每个来源只查一次阈值与权重
+        source_codes: Dict[str, int] = {}
+        codes = np.fromiter(
+            (source_codes.setdefault(str(item.get("source", "")).lower(), len(source_codes)) for item in items),
+            dtype=np.int64,
+            count=count,
+        )
+        thresholds = np.array([float(self.engagement_thresholds.get(name, 0)) for name in source_codes])
+        weights = np.array([float(self.platform_weights.get(name, DEFAULT_WEIGHT)) for name in source_codes])
+        scores = np.fromiter((float(item.get("engagement_score", 0)) for item in items), dtype=np.float64, count=count)
+
+        # 先做纯列运算的标题与热度判定，发布时间解析和关键词扫描只针对剩余条目
+        mask = np.fromiter((bool(item.get("title")) for item in items), dtype=bool, count=count)
+        mask &= scores >= thresholds[codes]
+        survivors = np.flatnonzero(mask)
+        mask[survivors] = self._recency_mask([items[idx] for idx in survivors], now)
+        for idx in np.flatnonzero(mask).tolist():
+            mask[idx] = self._contain_keyword(items[idx]["title"])
+        return mask, scores, codes, weights
+
+    def _recency_mask(self, items: List[Dict], now: datetime) -> np.ndarray:
+        """
+        时效列：以微秒整数存发布距今时长，与窗口整体比较（与 timedelta 比较同样精确）。
+
+        缺失视为当前时间，无法解析的直接淘汰；带时区的沿用逐条判定。
+        """
+        ages: List[int] = []
+        overrides: Dict[int, bool] = {}
+        for idx, item in enumerate(items):
+            value = item.get("published_at") or now
+            if not isinstance(value, datetime):
+                try:
+                    value = datetime.fromisoformat(str(value))
+                except ValueError:
+                    overrides[idx] = False
+                    value = now
+            if value.tzinfo is not None:
+                overrides[idx] = self._within_recency(value, now)
+                value = now
+            ages.append((now - value) // MICROSECOND)
+
+        mask = np.array(ages, dtype=np.int64) <= timedelta(hours=self.recency_hours) // MICROSECOND
+        for idx, passed in overrides.items():
+            mask[idx] = passed
+        return mask
 
-        # 按权重后的热度排序
-        filtered.sort(
-            key=lambda x: self._weighted_score(x.get("source"), x.get("engagement_score", 0)),
-            reverse=True,
+    @staticmethod
+    def _top_k(weighted: np.ndarray, limit: int, tie: Callable[[int], Tuple]) -> np.ndarray:
+        """
+        降序取前 limit 个的下标；同分按 tie(下标)（即 tie_key）再按原顺序，
+        与稳定排序 sorted(key=(-score, tie_key)) 一致。
+        """
+        if limit <= 0:
+            return np.empty(0, dtype=np.int64)
+        positions = np.arange(len(weighted))
+        if len(weighted) > limit:
+            # 先取第 limit 大的分数作为门槛，只有门槛及以上的条目需要计算次序键
+            cutoff = -np.partition(-weighted, limit - 1)[limit - 1]
+            positions = positions[weighted >= cutoff]
+        order = sorted(positions.tolist(), key=lambda idx: (-weighted[idx], tie(idx), idx))
+        return np.array(order[:limit], dtype=np.int64)
+
+    def accepts(self, item: Dict, now: datetime) -> bool:
+        """单条判定：标题、时效、热度、关键词均满足才保留，供流式筛选使用。"""
+        if not item.get("title"):
+            return False
+
+        if not self._within_recency(item.get("published_at"), now):
+            return False
+
+        if not self._meet_engagement(item):
+            return False
+
+        return self._contain_keyword(item["title"])
+
+    def accepts_many(self, items: List[Dict], now: datetime) -> List[bool]:
+        """批量判定，便于分片交给进程池。"""
+        if len(items) >= BATCH_MIN_ITEMS:
+            return self._screen_columns(items, now)[0].tolist()
+        return [self.accepts(item, now) for item in items]
+
+    def rank(self, candidates: List[Dict]) -> List[Dict]:
+        """按权重后的热度降序排序，截断 daily_limit。"""
+        weighted = np.array(
+            [self._weighted_score(x.get("source"), x.get("engagement_score", 0)) for x in candidates],
+            dtype=np.float64,
         )
-        return filtered[: self.daily_limit]
+        order = self._top_k(weighted, self.daily_limit, lambda idx: self.tie_key(candidates[idx]))
+        return [candidates[idx] for idx in order]
 
     def _within_recency(self, published_at, now: datetime) -> bool:
         """校验是否在时效窗口内。"""
@@ -68,18 +195,13 @@ class TrendingFilter:
         threshold = self.engagement_thresholds.get(source, 0)
         return score >= threshold
 
+    def matched_keyword_groups(self, title: str) -> List[str]:
+        """标题命中的关键词分组（如 tech_en、news_keywords）。"""
+        return self.keyword_matcher.matched_groups(title)
+
     def _contain_keyword(self, title: str) -> bool:
         """标题需命中至少一个关键词。"""
-        lower = title.lower()
-        return any(kw in lower for kw in self.keywords)
-
-    @staticmethod
-    def _collect_keywords(keyword_group: Dict) -> List[str]:
-        """扁平化关键词配置并转小写，便于快速匹配。"""
-        all_kw: List[str] = []
-        for group in keyword_group.values():
-            all_kw.extend(group)
-        return [kw.lower() for kw in all_kw]
+        return self.keyword_matcher.contains_any(title)
 
     def _weighted_score(self, source: str, score: float) -> float:
         """应用平台权重后的排序分。"""
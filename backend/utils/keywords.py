@@ -0,0 +1,105 @@
+"""关键词分组匹配：Aho–Corasick 自动机，一次线性扫描得出标题命中了哪些分组。"""
+from __future__ import annotations
+
+from collections import deque
+from typing import Dict, Iterable, List, Mapping, Optional, Set, Tuple
+
+WILDCARD = "*"
+
+
+def _is_word_char(char: str) -> bool:
+    return char.isascii() and (char.isalnum() or char == "_")
+
+
+class KeywordMatcher:
+    """
+    把 {分组: [关键词]} 编译成一个自动机，构建一次后可反复使用（可 pickle，供进程池使用）。
+
+    大小写不敏感。word_boundary 为真时，纯 ASCII 关键词要求两侧不是英文字母/数字，
+    避免 "AI" 命中 "said"、"email"；关键词首尾写 * 可放开该侧边界（如 "*gpt*"、"vulnerabilit*"）。
+    中文等非 ASCII 关键词不做边界判断。
+    """
+
+    def __init__(self, groups: Mapping[str, Iterable[str]], word_boundary: bool = True) -> None:
+        self.group_names: List[str] = list(groups)
+        self._goto: List[Dict[str, int]] = [{}]
+        self._fail: List[int] = [0]
+        # 每个状态结束的关键词：(长度, 分组序号, 左侧需边界, 右侧需边界)
+        self._output: List[List[Tuple[int, int, bool, bool]]] = [[]]
+
+        for group_idx, keywords in enumerate(groups.values()):
+            for raw in keywords:
+                keyword = str(raw).strip()
+                left_open = keyword.startswith(WILDCARD)
+                right_open = keyword.endswith(WILDCARD)
+                keyword = keyword.strip(WILDCARD).lower()
+                if not keyword:
+                    continue
+                bounded = word_boundary and keyword.isascii()
+                self._insert(keyword, (len(keyword), group_idx, bounded and not left_open, bounded and not right_open))
+        self._build_failure_links()
+
+    def matched_groups(self, text: str) -> List[str]:
+        """返回命中的分组名，按分组声明顺序。"""
+        hit = self._scan(text, stop_early=False)
+        return [name for idx, name in enumerate(self.group_names) if idx in hit]
+
+    def first_group(self, text: str, default: Optional[str] = None) -> Optional[str]:
+        """返回声明顺序最靠前的命中分组，用于按优先级分类。"""
+        groups = self.matched_groups(text)
+        return groups[0] if groups else default
+
+    def contains_any(self, text: str) -> bool:
+        """是否命中任一关键词，首次命中即返回。"""
+        return bool(self._scan(text, stop_early=True))
+
+    def _scan(self, text: str, stop_early: bool) -> Set[int]:
+        lower = text.lower()
+        hit: Set[int] = set()
+        delta, output = self._delta, self._output
+        state = 0
+        for end, char in enumerate(lower, start=1):
+            state = delta[state].get(char, 0)
+            if not output[state]:
+                continue
+            for length, group_idx, left_bound, right_bound in output[state]:
+                if group_idx in hit:
+                    continue
+                start = end - length
+                if left_bound and start > 0 and _is_word_char(lower[start - 1]):
+                    continue
+                if right_bound and end < len(lower) and _is_word_char(lower[end]):
+                    continue
+                hit.add(group_idx)
+                if stop_early:
+                    return hit
+        return hit
+
+    def _insert(self, keyword: str, entry: Tuple[int, int, bool, bool]) -> None:
+        state = 0
+        for char in keyword:
+            nxt = self._goto[state].get(char)
+            if nxt is None:
+                nxt = len(self._goto)
+                self._goto[state][char] = nxt
+                self._goto.append({})
+                self._fail.append(0)
+                self._output.append([])
+            state = nxt
+        self._output[state].append(entry)
+
+    def _build_failure_links(self) -> None:
+        """BFS 建失配指针，把后缀状态的输出并入当前状态，并展开为完整转移表（扫描时无需回退）。"""
+        self._delta: List[Dict[str, int]] = [dict(self._goto[0])] + [{} for _ in self._goto[1:]]
+        queue = deque(self._goto[0].values())
+        while queue:
+            state = queue.popleft()
+            self._delta[state] = {**self._delta[self._fail[state]], **self._goto[state]}
+            for char, nxt in self._goto[state].items():
+                queue.append(nxt)
+                fallback = self._fail[state]
+                while fallback and char not in self._goto[fallback]:
+                    fallback = self._fail[fallback]
+                target = self._goto[fallback].get(char, 0)
+                self._fail[nxt] = target if target != nxt else 0
+                self._output[nxt] = self._output[nxt] + self._output[self._fail[nxt]]
@@ -0,0 +1,87 @@
+"""标题近似重复检索：字符 n-gram MinHash 签名 + LSH 分桶索引。"""
+from __future__ import annotations
+
+import zlib
+from collections import defaultdict
+from typing import Dict, Generic, Hashable, List, Set, TypeVar
+
+import numpy as np
+
+DEFAULT_NUM_PERM = 64
+DEFAULT_BANDS = 16
+DEFAULT_SHINGLE_SIZE = 3
+DEFAULT_SEED = 20251124
+# 32 位以内的最大素数；系数 a < 2^31、哈希值 < 2^32，a*x+b 不会溢出 uint64
+HASH_PRIME = np.uint64(4294967291)
+
+K = TypeVar("K", bound=Hashable)
+
+
+def shingles(text: str, size: int = DEFAULT_SHINGLE_SIZE) -> Set[str]:
+    """小写并折叠空白后切字符 n-gram；中英文混排同样适用。"""
+    normalized = " ".join(text.lower().split())
+    if len(normalized) <= size:
+        return {normalized} if normalized else set()
+    return {normalized[i : i + size] for i in range(len(normalized) - size + 1)}
+
+
+class MinHasher:
+    """用 num_perm 组 (a*x+b) mod p 哈希近似随机排列，向量化计算签名。"""
+
+    def __init__(
+        self,
+        num_perm: int = DEFAULT_NUM_PERM,
+        shingle_size: int = DEFAULT_SHINGLE_SIZE,
+        seed: int = DEFAULT_SEED,
+    ) -> None:
+        # 固定种子保证签名跨进程稳定，可落盘复用
+        rng = np.random.default_rng(seed)
+        self.num_perm = num_perm
+        self.shingle_size = shingle_size
+        self.seed = seed
+        self._a = rng.integers(1, 2**31, size=num_perm, dtype=np.uint64)
+        self._b = rng.integers(0, 2**31, size=num_perm, dtype=np.uint64)
+
+    def signature(self, text: str) -> np.ndarray:
+        grams = shingles(text, self.shingle_size)
+        if not grams:
+            return np.full(self.num_perm, HASH_PRIME, dtype=np.uint64)
+        hashes = np.fromiter((zlib.crc32(g.encode("utf-8")) for g in grams), dtype=np.uint64, count=len(grams))
+        return ((hashes[:, None] * self._a + self._b) % HASH_PRIME).min(axis=0)
+
+
+class LSHIndex(Generic[K]):
+    """
+    把签名切成 bands 段，任一段完全相同即视为候选。
+
+    Jaccard 相似度为 s 的两标题成为候选的概率为 1-(1-s^r)^b（r 为每段行数），
+    只需对少量候选做精确比对，而非与全量语料逐一比较。
+    """
+
+    def __init__(self, hasher: MinHasher, bands: int = DEFAULT_BANDS) -> None:
+        if hasher.num_perm % bands:
+            raise ValueError("num_perm 必须能被 bands 整除")
+        self.hasher = hasher
+        self.bands = bands
+        self.rows = hasher.num_perm // bands
+        self._buckets: List[Dict[bytes, List[K]]] = [defaultdict(list) for _ in range(bands)]
+        self._size = 0
+
+    def __len__(self) -> int:
+        return self._size
+
+    def band_keys(self, signature: np.ndarray) -> List[bytes]:
+        return [signature[i * self.rows : (i + 1) * self.rows].tobytes() for i in range(self.bands)]
+
+    def add(self, key: K, signature: np.ndarray) -> None:
+        for bucket, band in zip(self._buckets, self.band_keys(signature)):
+            bucket[band].append(key)
+        self._size += 1
+
+    def query(self, signature: np.ndarray) -> Set[K]:
+        candidates: Set[K] = set()
+        for bucket, band in zip(self._buckets, self.band_keys(signature)):
+            hits = bucket.get(band)
+            if hits:
+                candidates.update(hits)
+        return candidates
@@ -0,0 +1,89 @@
+"""去重用的 URL 规范化与标题归一化。"""
+from __future__ import annotations
+
+import re
+import unicodedata
+from typing import Any, Dict, Iterable, Mapping, Optional, Set, Tuple
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+# 各平台的点击 ID，只影响来源统计、不改变页面内容，任何主机上都可去掉
+TRACKING_PARAMS = {"fbclid", "gclid", "dclid", "msclkid", "mc_cid", "mc_eid", "igshid"}
+TRACKING_PREFIXES = ("utm_",)
+# ref、source、share 等通用名字在别的站点可能决定页面内容（如分支、数据源），只在已知主机上去掉
+HOST_TRACKING_PARAMS = {
+    "twitter.com": {"ref_src", "ref_url", "s", "t"},
+    "x.com": {"ref_src", "ref_url", "s", "t"},
+    "youtube.com": {"si", "feature"},
+    "youtu.be": {"si", "feature"},
+}
+DEFAULT_PORTS = {"http": "80", "https": "443"}
+# 讨论页包装：raw_data 里带有外链目标时以目标为准
+WRAPPER_HOSTS = ("reddit.com", "news.ycombinator.com")
+_PUNCT_SPACE = re.compile(r"[\W_]+", re.UNICODE)
+
+
+def canonical_url(url: str) -> str:
+    """统一协议与主机大小写，去掉 www.、默认端口、片段、跟踪参数和末尾斜杠。"""
+    if not url:
+        return ""
+    parts = urlsplit(url.strip())
+    if not parts.netloc:
+        return url.strip()
+
+    host = (parts.hostname or "").lower()
+    if host.startswith("www."):
+        host = host[4:]
+    scheme = parts.scheme.lower()
+    if parts.port and str(parts.port) != DEFAULT_PORTS.get(scheme):
+        host = f"{host}:{parts.port}"
+
+    dropped = TRACKING_PARAMS | _host_params(host)
+    query = [
+        (key, value)
+        for key, value in parse_qsl(parts.query, keep_blank_values=True)
+        if key.lower() not in dropped and not key.lower().startswith(TRACKING_PREFIXES)
+    ]
+    path = parts.path.rstrip("/")
+    # http/https 视为同一资源
+    return urlunsplit(("https" if scheme in DEFAULT_PORTS else scheme, host, path, urlencode(sorted(query)), ""))
+
+
+def _host_params(host: str) -> Set[str]:
+    for known, params in HOST_TRACKING_PARAMS.items():
+        if host == known or host.endswith("." + known):
+            return params
+    return set()
+
+
+def link_target(url: str, raw_data: Optional[Mapping] = None) -> str:
+    """讨论页（Reddit 帖子、HN 讨论）若携带外链目标，返回目标的规范化 URL。"""
+    canonical = canonical_url(url)
+    host = urlsplit(canonical).hostname or ""
+    if raw_data and any(host == wrapper or host.endswith("." + wrapper) for wrapper in WRAPPER_HOSTS):
+        target = raw_data.get("url")
+        if isinstance(target, str) and target.startswith("http") and not raw_data.get("is_self"):
+            return canonical_url(target)
+    return canonical
+
+
+def story_key(source: Any, url: Any, title: str, priority: Mapping[str, int]) -> Tuple:
+    """
+    同一故事多个条目间与到达顺序无关的排序键，越小越优先。
+
+    依次比较来源优先级（未列出的排在最后）、来源名、有无 URL、规范化 URL、归一化标题；
+    聚类选代表与同分排序共用，保证两处取舍一致。
+    """
+    source = str(source or "")
+    canonical = canonical_url(url) if isinstance(url, str) else ""
+    return priority.get(source, len(priority)), source, not canonical, canonical, normalize_title(title)
+
+
+def source_ranks(sources: Iterable[str]) -> Dict[str, int]:
+    """配置中的来源优先级列表 → {来源: 名次}。"""
+    return {source: rank for rank, source in enumerate(sources)}
+
+
+def normalize_title(title: str) -> str:
+    """NFKC + casefold，标点与空白折叠为单个空格。"""
+    folded = unicodedata.normalize("NFKC", title).casefold()
+    return " ".join(_PUNCT_SPACE.sub(" ", folded).split())
@@ -1,12 +1,14 @@
 """Git 存储工具。"""
 from __future__ import annotations
 
+import asyncio
 from pathlib import Path
-from typing import Iterable, List
+from typing import Callable, Iterable, List, Optional
 
 from git import Repo, GitCommandError
 
-DEFAULT_TRACK_PATHS = ["content/", "data/"]
+# data/cache 为本地缓存，不纳入提交
+DEFAULT_TRACK_PATHS = ["content/", "data/trending/", "data/processed/"]
 
 
 class GitStorage:
@@ -18,21 +20,91 @@ class GitStorage:
         self.repo = Repo(self.repo_path)
 
     def commit_and_push(self, message: str) -> None:
-        """提交指定路径并尝试推送远程。"""
+        """提交跟踪路径下的全部变更并尝试推送远程。"""
         try:
-            self.repo.index.add(self.track_paths)
-            if not self.repo.index.diff("HEAD"):
-                print("   ⚠️  没有检测到需提交的变更，跳过提交")
-                return
+            self.commit_paths(self.track_paths, message)
+        except GitCommandError as exc:
+            print(f"   ⚠️  Git 提交失败: {exc}")
+            return
+        # 即使本次没有新变更，也把之前推送失败的提交补推上去
+        self.push()
 
-            self.repo.index.commit(message)
-            print(f"   ✓ 已提交: {message}")
+    def commit_paths(self, paths: Iterable[str], message: str) -> bool:
+        """只提交给定路径，返回是否产生了提交；Git 出错时抛出 GitCommandError。"""
+        self.repo.index.add(list(paths))
+        if not self.repo.index.diff("HEAD"):
+            print("   ⚠️  没有检测到需提交的变更，跳过提交")
+            return False
 
-            if self.repo.remotes:
-                origin = self.repo.remote("origin")
-                origin.push()
-                print("   ✓ 已推送到 origin")
-            else:
-                print("   ⚠️  未配置远程仓库，跳过推送")
+        self.repo.index.commit(message)
+        print(f"   ✓ 已提交: {message}")
+        return True
+
+    def push(self) -> bool:
+        """推送到 origin，返回是否成功；未配置远程时视为无需推送。"""
+        if not self.repo.remotes:
+            print("   ⚠️  未配置远程仓库，跳过推送")
+            return True
+        try:
+            self.repo.remote("origin").push()
         except GitCommandError as exc:
-            print(f"   ⚠️  Git 操作失败: {exc}")
+            print(f"   ⚠️  推送失败: {exc}")
+            return False
+        print("   ✓ 已推送到 origin")
+        return True
+
+
+class IncrementalCommitter:
+    """
+    定时把新写好的文件小批量提交推送，首篇文章不必等整轮研究结束才发布。
+
+    Git 操作在线程中执行，不阻塞事件循环；stop() 之后剩余的文件由收尾的整体提交带上。
+    """
+
+    def __init__(self, storage: GitStorage, interval: float, message: Callable[[int], str]) -> None:
+        self.storage = storage
+        self.interval = interval
+        self.message = message
+        self.committed = 0
+        self._pending: List[str] = []
+        self._unpushed = False
+        self._task: Optional[asyncio.Task] = None
+        self._stopping: Optional[asyncio.Event] = None
+
+    def add(self, path: str) -> None:
+        self._pending.append(path)
+
+    def start(self) -> None:
+        self._stopping = asyncio.Event()
+        self._task = asyncio.ensure_future(self._loop())
+
+    async def stop(self) -> None:
+        """停止定时器；正在进行的提交会先完成，避免与收尾提交同时操作 Git 索引。"""
+        if self._task is not None:
+            self._stopping.set()
+            await self._task
+            self._task = None
+
+    async def flush(self) -> None:
+        if self._pending:
+            batch, self._pending = self._pending, []
+            try:
+                committed = await asyncio.to_thread(self.storage.commit_paths, batch, self.message(len(batch)))
+            except GitCommandError as exc:
+                print(f"   ⚠️  Git 提交失败: {exc}")
+                # 未提交的文件留待下一轮或收尾提交
+                self._pending = batch + self._pending
+                return
+            if committed:
+                self.committed += len(batch)
+                self._unpushed = True
+        # 提交已落地，推送失败只重试推送
+        if self._unpushed:
+            self._unpushed = not await asyncio.to_thread(self.storage.push)
+
+    async def _loop(self) -> None:
+        while not self._stopping.is_set():
+            try:
+                await asyncio.wait_for(self._stopping.wait(), self.interval)
+            except asyncio.TimeoutError:
+                await self.flush()
@@ -0,0 +1,146 @@
+"""字符 n-gram TF-IDF 标题相似度：整批向量化，分块稀疏矩阵乘法求余弦相似度。"""
+from __future__ import annotations
+
+from typing import Dict, Iterable, Iterator, List, Sequence, Tuple
+
+import numpy as np
+from scipy import sparse
+
+from backend.utils.normalize import normalize_title
+
+DEFAULT_NGRAM_RANGE = (2, 3)
+DEFAULT_TFIDF_THRESHOLD = 0.6
+DEFAULT_CHUNK_SIZE = 512
+
+
+def char_ngrams(text: str, ngram_range: Tuple[int, int] = DEFAULT_NGRAM_RANGE) -> List[str]:
+    """归一化后切字符 n-gram；中文按字、英文按字母同等处理，混排标题一次完成。"""
+    # 去掉空格：中文与英文/数字之间有无空格不影响相似度
+    normalized = normalize_title(text).replace(" ", "")
+    low, high = ngram_range
+    grams: List[str] = []
+    for size in range(low, high + 1):
+        if len(normalized) < size:
+            continue
+        grams.extend(normalized[i : i + size] for i in range(len(normalized) - size + 1))
+    return grams or ([normalized] if normalized else [])
+
+
+class TfidfSimilarity:
+    """
+    批量余弦相似度。
+
+    对一批标题（含历史标题）统一建词表与 IDF，行向量 L2 归一化后分块做稀疏矩阵乘法：
+    批内每次取 chunk_size 行与整批相乘，历史标题则逐块读入、向量化后与整批相乘即丢弃。
+    """
+
+    def __init__(
+        self,
+        threshold: float = DEFAULT_TFIDF_THRESHOLD,
+        ngram_range: Sequence[int] = DEFAULT_NGRAM_RANGE,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+    ) -> None:
+        self.threshold = threshold
+        self.ngram_range = (int(ngram_range[0]), int(ngram_range[1]))
+        self.chunk_size = max(1, chunk_size)
+
+    def vectorize(self, titles: Sequence[str]) -> sparse.csr_matrix:
+        vocab: Dict[str, int] = {}
+        tf = self._term_counts(titles, vocab)
+        df = np.bincount(tf.indices, minlength=tf.shape[1])
+        return self._weigh(tf, self._idf(df, len(titles)))
+
+    def similar_pairs(
+        self, titles: Sequence[str], history: Iterable[str] = ()
+    ) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        返回 (rows, cols, in_history)。
+
+        rows/cols 为批内相似度达标的条目对（cols < rows），in_history 标记与历史标题相似的条目。
+        history 需可重复迭代：第一遍只统计 DF，第二遍按 chunk_size 分块向量化并与本批比对，
+        内存不随历史条数增长。
+        """
+        count = len(titles)
+        in_history = np.zeros(count, dtype=bool)
+        empty = np.empty(0, dtype=np.int64)
+        if not count:
+            return empty, empty, in_history
+
+        # IDF 按历史与本批合计统计，与两者一起向量化的结果一致
+        vocab: Dict[str, int] = {}
+        history_df: List[int] = []
+        history_count = 0
+        for title in history:
+            history_count += 1
+            for gram in set(char_ngrams(title, self.ngram_range)):
+                col = vocab.setdefault(gram, len(vocab))
+                if col == len(history_df):
+                    history_df.append(0)
+                history_df[col] += 1
+        tf = self._term_counts(titles, vocab)
+        df = np.bincount(tf.indices, minlength=tf.shape[1])
+        df[: len(history_df)] += np.asarray(history_df, dtype=df.dtype)
+        idf = self._idf(df, history_count + count)
+        batch = self._weigh(tf, idf)
+
+        pair_rows: List[np.ndarray] = []
+        pair_cols: List[np.ndarray] = []
+        for start in range(0, count, self.chunk_size):
+            rows, cols = self._hits(batch[start : start + self.chunk_size], batch)
+            rows += start
+            pair = cols < rows
+            pair_rows.append(rows[pair])
+            pair_cols.append(cols[pair])
+
+        for chunk in _chunked(history, self.chunk_size):
+            rows, _ = self._hits(batch, self._weigh(self._term_counts(chunk, vocab, idf.shape[0]), idf))
+            in_history[rows] = True
+
+        return np.concatenate(pair_rows), np.concatenate(pair_cols), in_history
+
+    def _hits(self, left: sparse.csr_matrix, right: sparse.csr_matrix) -> Tuple[np.ndarray, np.ndarray]:
+        sims = (left @ right.T).tocoo()
+        hit = sims.data >= self.threshold
+        return sims.row[hit].astype(np.int64), sims.col[hit].astype(np.int64)
+
+    def _term_counts(self, titles: Iterable[str], vocab: Dict[str, int], width: int = 0) -> sparse.csr_matrix:
+        """词频矩阵；新出现的 n-gram 追加进 vocab，列数至少为 width。"""
+        indptr = [0]
+        indices: List[int] = []
+        counts: List[int] = []
+        for title in titles:
+            row: Dict[int, int] = {}
+            for gram in char_ngrams(title, self.ngram_range):
+                col = vocab.setdefault(gram, len(vocab))
+                row[col] = row.get(col, 0) + 1
+            indices.extend(row.keys())
+            counts.extend(row.values())
+            indptr.append(len(indices))
+        return sparse.csr_matrix(
+            (np.asarray(counts, dtype=np.float32), indices, indptr),
+            shape=(len(indptr) - 1, max(len(vocab), width, 1)),
+        )
+
+    @staticmethod
+    def _idf(df: np.ndarray, total: int) -> np.ndarray:
+        # 平滑 IDF：idf = ln((1+n)/(1+df)) + 1
+        return np.log((1 + total) / (1 + df)).astype(np.float32) + 1
+
+    @staticmethod
+    def _weigh(tf: sparse.csr_matrix, idf: np.ndarray) -> sparse.csr_matrix:
+        """乘 IDF 后按行 L2 归一化。"""
+        weighted = tf.multiply(idf).tocsr()
+        norms = np.sqrt(np.asarray(weighted.multiply(weighted).sum(axis=1)).ravel())
+        norms[norms == 0] = 1
+        return sparse.diags(1 / norms).dot(weighted).tocsr()
+
+
+def _chunked(items: Iterable[str], size: int) -> Iterator[List[str]]:
+    chunk: List[str] = []
+    for item in items:
+        chunk.append(item)
+        if len(chunk) >= size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
@@ -0,0 +1,68 @@
+"""流式 Top-K 选择：只保留当前前 k 名，内存 O(k)，与输入规模无关。"""
+from __future__ import annotations
+
+import heapq
+from itertools import count
+from typing import Any, Callable, Generic, Iterable, List, Optional, Tuple, TypeVar
+
+T = TypeVar("T")
+
+
+class _Descending:
+    """反转比较方向的包装，使最小堆把“次序键更大者”视为更弱。"""
+
+    __slots__ = ("key",)
+
+    def __init__(self, key: Any) -> None:
+        self.key = key
+
+    def __eq__(self, other: object) -> bool:
+        return isinstance(other, _Descending) and self.key == other.key
+
+    def __lt__(self, other: "_Descending") -> bool:
+        return other.key < self.key
+
+    def __gt__(self, other: "_Descending") -> bool:
+        return self.key < other.key
+
+
+class TopKSelector(Generic[T]):
+    """
+    按 score(item) 降序保留前 k 个条目。
+
+    同分先比 tie(item)（越小越靠前），仍相同才按到达顺序，因此只要 tie 能区分条目，
+    结果就与到达顺序无关；与稳定排序 sorted(key=(-score, tie))[:k] 完全一致。
+    堆顶是当前最弱者，新条目只有严格强于堆顶才替换。
+    """
+
+    def __init__(self, k: int, score: Callable[[T], float], tie: Optional[Callable[[T], Any]] = None) -> None:
+        self.k = max(0, k)
+        self.seen = 0
+        self._score = score
+        self._tie = tie
+        self._seq = count()
+        # (分数, 反转的次序键, -到达序号, 条目)：前三项即可分出大小，不会比较到条目本身
+        self._heap: List[Tuple[float, _Descending, int, T]] = []
+
+    def __len__(self) -> int:
+        return len(self._heap)
+
+    def push(self, item: T) -> None:
+        self.seen += 1
+        if not self.k:
+            return
+        tie = _Descending(self._tie(item) if self._tie is not None else ())
+        entry = (self._score(item), tie, -next(self._seq), item)
+        if len(self._heap) < self.k:
+            heapq.heappush(self._heap, entry)
+        elif entry[:3] > self._heap[0][:3]:
+            heapq.heapreplace(self._heap, entry)
+
+    def extend(self, items: Iterable[T]) -> "TopKSelector[T]":
+        for item in items:
+            self.push(item)
+        return self
+
+    def result(self) -> List[T]:
+        """当前前 k 名，分数降序、同分按次序键再按到达顺序。"""
+        return [entry[3] for entry in sorted(self._heap, key=lambda entry: entry[:3], reverse=True)]
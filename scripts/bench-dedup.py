@@ -0,0 +1,116 @@
+#!/usr/bin/env python3
+"""去重基准：对比逐对 SequenceMatcher 旧实现与新实现（LSH 或 TF-IDF 后端，合成标题语料）。"""
+from __future__ import annotations
+
+import argparse
+import random
+import sys
+import time
+from difflib import SequenceMatcher
+from pathlib import Path
+from typing import Dict, List
+
+BASE_DIR = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(BASE_DIR))
+
+from backend.utils.dedup_history import DedupHistory  # noqa: E402
+from backend.utils.config_schema import DEDUP_BACKENDS  # noqa: E402
+from backend.utils.deduplicator import Deduplicator  # noqa: E402
+
+DEFAULT_SIZES = [500, 1000, 2000, 10000]
+DEFAULT_LEGACY_MAX = 2000  # 旧实现为 O(n²)，超过该规模只跑新实现
+DUP_RATE = 0.3  # 约三成条目是已有话题的改写
+CJK_CHARS = "人工智能模型发布开源芯片安全漏洞融资上市云计算数据库区块链量子机器学习大厂推出新品手机系统更新"
+SOURCE_SUFFIXES = [" - HN", " | Reddit", " (The Verge)", " - 36氪"]
+
+
+def synthetic_titles(size: int, seed: int = 7) -> List[str]:
+    """生成中英文混合标题，其中一部分是前文标题的轻度改写。"""
+    rng = random.Random(seed)
+    vocab = ["".join(rng.choice("abcdefghijklmnopqrstuvwxyz") for _ in range(rng.randint(3, 9))) for _ in range(5000)]
+    titles: List[str] = []
+    for _ in range(size):
+        if titles and rng.random() < DUP_RATE:
+            titles.append(_rewrite(rng.choice(titles), rng, vocab))
+        elif rng.random() < 0.3:
+            titles.append("".join(rng.choice(CJK_CHARS) for _ in range(rng.randint(10, 24))))
+        else:
+            titles.append(" ".join(rng.choice(vocab) for _ in range(rng.randint(5, 11))).capitalize())
+    return titles
+
+
+def _rewrite(title: str, rng: random.Random, vocab: List[str]) -> str:
+    words = title.split()
+    roll = rng.random()
+    if roll < 0.3:
+        return title + rng.choice(SOURCE_SUFFIXES)
+    if roll < 0.5:
+        return title.lower() + "!"
+    if roll < 0.75 and len(words) > 1:
+        words.insert(rng.randrange(len(words) + 1), rng.choice(vocab))
+        return " ".join(words)
+    if len(title) > 4:
+        pos = rng.randrange(len(title))
+        return title[:pos] + title[pos + 1 :]
+    return title
+
+
+def legacy_deduplicate(titles: List[str], threshold: float) -> List[str]:
+    """旧实现：每个新标题与全部已接收标题逐一比较。"""
+    unique: List[str] = []
+    for title in titles:
+        if any(SequenceMatcher(None, title, existed).ratio() >= threshold for existed in unique):
+            continue
+        unique.append(title)
+    return unique
+
+
+def fast_deduplicate(dedup: Deduplicator, titles: List[str]) -> List[str]:
+    items: List[Dict] = [{"title": title} for title in titles]
+    return [item["title"] for item in dedup.deduplicate(items)]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="去重实现基准")
+    parser.add_argument("--sizes", type=int, nargs="+", default=DEFAULT_SIZES)
+    parser.add_argument("--legacy-max", type=int, default=DEFAULT_LEGACY_MAX)
+    parser.add_argument("--backend", choices=DEDUP_BACKENDS, default="sequence", help="新实现使用的相似度后端")
+    args = parser.parse_args()
+
+    dedup = Deduplicator()
+    # 基准只比较批内去重，排除本地历史记录的影响
+    dedup.close()
+    dedup.history = DedupHistory(":memory:", dedup.new_index(), dedup.check_days)
+    if args.backend == "tfidf":
+        from backend.utils.tfidf import TfidfSimilarity
+
+        dedup.tfidf = TfidfSimilarity()
+    threshold = dedup.similarity_threshold
+
+    print(f"{'size':>7} {'legacy(s)':>10} {args.backend + '(s)':>8} {'speedup':>8} {'unique':>13} {'agreement':>10}")
+    for size in args.sizes:
+        titles = synthetic_titles(size)
+
+        start = time.perf_counter()
+        fast = fast_deduplicate(dedup, titles)
+        fast_time = time.perf_counter() - start
+
+        if size > args.legacy_max:
+            print(f"{size:>7} {'-':>10} {fast_time:>8.2f} {'-':>8} {len(fast):>13} {'-':>10}")
+            continue
+
+        start = time.perf_counter()
+        slow = legacy_deduplicate(titles, threshold)
+        legacy_time = time.perf_counter() - start
+
+        # 两种实现对每条标题"保留/丢弃"判断一致的比例
+        kept_fast, kept_slow = set(fast), set(slow)
+        agreement = sum((t in kept_fast) == (t in kept_slow) for t in titles) / len(titles)
+        print(
+            f"{size:>7} {legacy_time:>10.2f} {fast_time:>8.2f} {legacy_time / fast_time:>7.0f}x "
+            f"{len(slow):>6}/{len(fast):<6} {agreement:>9.1%}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,80 @@
+#!/usr/bin/env python3
+"""筛选基准：对比逐条 accepts + rank 与列式批量筛选（合成热点条目），并校验结果一致。"""
+from __future__ import annotations
+
+import argparse
+import random
+import sys
+import time
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Dict, List
+
+BASE_DIR = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(BASE_DIR))
+
+from backend.utils.filter import TrendingFilter  # noqa: E402
+
+DEFAULT_SIZES = [10_000, 100_000]
+SOURCES = ["hackernews", "reddit", "github", "newsapi", "weibo", "zhihu", "producthunt", "juejin"]
+WORDS = ["AI", "GPT-5", "OpenAI", "launches", "database", "cloud", "said", "email", "Rust", "发布", "模型", "融资", "手机"]
+
+
+def synthetic_items(size: int, now: datetime, seed: int = 11) -> List[Dict]:
+    """生成热度、来源、发布时间（含字符串与缺失）混杂的条目，热度取整以制造并列。"""
+    rng = random.Random(seed)
+    items: List[Dict] = []
+    for _ in range(size):
+        published = now - timedelta(hours=rng.uniform(0, 48))
+        roll = rng.random()
+        items.append(
+            {
+                "title": " ".join(rng.choice(WORDS) for _ in range(rng.randint(3, 8))),
+                "source": rng.choice(SOURCES),
+                "engagement_score": float(rng.randrange(0, 20000, 50)),
+                "published_at": published.isoformat() if roll < 0.4 else (None if roll < 0.45 else published),
+            }
+        )
+    return items
+
+
+def legacy_filter(trending_filter: TrendingFilter, items: List[Dict], now: datetime) -> List[Dict]:
+    """原逐条路径：accepts 过滤后按权重分降序、同分按 tie_key 稳定排序再截断。"""
+    candidates = [item for item in items if trending_filter.accepts(item, now)]
+    ranked = sorted(
+        candidates,
+        key=lambda x: (
+            -trending_filter._weighted_score(x.get("source"), x.get("engagement_score", 0)),
+            trending_filter.tie_key(x),
+        ),
+    )
+    return ranked[: trending_filter.daily_limit]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="筛选实现基准")
+    parser.add_argument("--sizes", type=int, nargs="+", default=DEFAULT_SIZES)
+    args = parser.parse_args()
+
+    trending_filter = TrendingFilter()
+    now = datetime.now()
+    print(f"{'size':>8} {'per-item(s)':>12} {'batch(s)':>9} {'speedup':>8} {'identical':>10}")
+    for size in args.sizes:
+        items = synthetic_items(size, now)
+
+        start = time.perf_counter()
+        expected = legacy_filter(trending_filter, items, now)
+        scalar_time = time.perf_counter() - start
+
+        start = time.perf_counter()
+        got = trending_filter.filter_batch(items, now)
+        batch_time = time.perf_counter() - start
+
+        identical = [id(item) for item in got] == [id(item) for item in expected]
+        print(f"{size:>8} {scalar_time:>12.3f} {batch_time:>9.3f} {scalar_time / batch_time:>7.1f}x {str(identical):>10}")
+        if not identical:
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
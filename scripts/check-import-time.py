@@ -0,0 +1,89 @@
+#!/usr/bin/env python3
+"""按命令检查 pipeline 冷启动导入耗时（基于 python -X importtime），防止重型依赖回到启动路径。"""
+from __future__ import annotations
+
+import argparse
+import subprocess
+import sys
+from pathlib import Path
+from typing import Dict, List, Tuple
+
+BASE_DIR = Path(__file__).resolve().parent.parent
+DEFAULT_BUDGET_MS = 500
+DEFAULT_RUNS = 3  # 取多次中的最小值以降低抖动
+
+CRAWLER_MODULES = [
+    "backend.crawlers.hackernews",
+    "backend.crawlers.github_trending",
+    "backend.crawlers.reddit",
+    "backend.crawlers.newsapi",
+    "backend.crawlers.mcp_trends",
+]
+
+# 各命令冷启动需要导入的模块，以及不应出现在该命令启动路径上的重型依赖
+COMMAND_IMPORTS: Dict[str, List[str]] = {
+    "crawl": ["backend.pipeline", *CRAWLER_MODULES],
+}
+FORBIDDEN_MODULES: Dict[str, List[str]] = {
+    "crawl": ["metagpt", "git", "backend.generators.dr_generator", "backend.utils.storage"],
+}
+
+
+def measure(modules: List[str], forbidden: List[str]) -> Tuple[float, List[str]]:
+    """返回 (导入耗时毫秒, 意外被导入的模块)，耗时已扣除空解释器的启动导入。"""
+    check = f"import sys; print(','.join(m for m in {forbidden!r} if m in sys.modules))"
+    code = "; ".join([*(f"import {module}" for module in modules), check])
+    total_us, leaked = _run_importtime(code)
+    baseline_us, _ = _run_importtime("pass")
+    return max(0.0, (total_us - baseline_us) / 1000), [m for m in leaked.split(",") if m]
+
+
+def _run_importtime(code: str) -> Tuple[int, str]:
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        cwd=BASE_DIR,
+        capture_output=True,
+        text=True,
+    )
+    if proc.returncode != 0:
+        errors = [line for line in proc.stderr.splitlines() if not line.startswith("import time:")]
+        print("✗ 导入失败:\n" + "\n".join(errors[-5:]))
+        sys.exit(1)
+    total = 0
+    for line in proc.stderr.splitlines():
+        # 格式: import time: self [us] | cumulative | imported package
+        if not line.startswith("import time:"):
+            continue
+        fields = line[len("import time:"):].split("|")
+        try:
+            total += int(fields[0])
+        except ValueError:
+            continue  # 表头
+    return total, proc.stdout.strip()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="检查 pipeline 各命令的冷启动导入耗时")
+    parser.add_argument("--command", choices=sorted(COMMAND_IMPORTS), default="crawl")
+    parser.add_argument("--budget-ms", type=float, default=DEFAULT_BUDGET_MS, help="导入耗时上限（毫秒）")
+    parser.add_argument("--runs", type=int, default=DEFAULT_RUNS)
+    args = parser.parse_args()
+
+    results = [measure(COMMAND_IMPORTS[args.command], FORBIDDEN_MODULES[args.command]) for _ in range(args.runs)]
+    cost_ms = min(cost for cost, _ in results)
+    leaked = results[0][1]
+
+    ok = True
+    if leaked:
+        ok = False
+        print(f"✗ {args.command} 启动路径导入了重型依赖: {', '.join(leaked)}")
+    if cost_ms > args.budget_ms:
+        ok = False
+        print(f"✗ {args.command} 导入耗时 {cost_ms:.0f}ms 超出预算 {args.budget_ms:.0f}ms")
+    if ok:
+        print(f"✓ {args.command} 导入耗时 {cost_ms:.0f}ms（预算 {args.budget_ms:.0f}ms）")
+    sys.exit(0 if ok else 1)
+
+
+if __name__ == "__main__":
+    main()
@@ -34,6 +34,7 @@ if [ ! -f "backend/config/api_config.yaml" ]; then
 fi
 
 python backend/pipeline.py test || true
+python scripts/check-import-time.py --command crawl
 
 if ls content/blog/*.md 1>/dev/null 2>&1; then
   COUNT=$(ls -1 content/blog/*.md | wc -l)